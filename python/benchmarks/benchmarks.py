@@ -0,0 +1,162 @@
+"""
+Benchmarks of damask.Result on synthetic DADF5 files.
+
+Run with airspeed velocity (asv) from the 'python' directory,
+e.g. 'asv run' or 'asv continuous main HEAD'.
+Methods prefixed by 'time_' measure the wall time, 'peakmem_'
+the peak resident set size, and 'track_' the throughput.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+import damask
+
+from . import synthetic
+
+
+sizes = {'small': {'cells':(16,16,16),'phases':2,'constituents':1,'increments':4},
+         'large': {'cells':(64,64,64),'phases':2,'constituents':1,'increments':4},
+         'multi': {'cells':(32,32,32),'phases':3,'constituents':4,'increments':2},
+        }
+
+
+class Benchmark:
+    """Common settings, synthetic files, and temporary directory of all benchmarks."""
+
+    params = list(sizes)
+    param_names = ['size']
+    timeout = 600.
+    warmup_time = 0.
+    number = 1
+
+    def setup_cache(self) -> dict:
+        """Write one synthetic DADF5 file per size, shared by all benchmarks."""
+        files = {}
+        for name,kwargs in sizes.items():
+            fname = Path(f'{name}.hdf5').absolute()
+            files[name] = (str(fname),)+synthetic.write(fname,**kwargs)
+        return files
+
+    def setup(self,files,size):
+        self.fname,self.N_materialpoints,self.N_bytes = files[size]
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def teardown(self,files,size):
+        shutil.rmtree(self.tmp,ignore_errors=True)
+
+
+class Open(Benchmark):
+
+    def setup(self,files,size):
+        super().setup(files,size)
+        damask.Result(self.fname,index=True)                                                       # write index
+        self.result = damask.Result(self.fname)
+
+    def time_init(self,files,size):
+        damask.Result(self.fname)
+
+    def time_init_index(self,files,size):
+        damask.Result(self.fname,index=True)
+
+    def time_view(self,files,size):
+        self.result.view(times=self.result.times[1:],fields='mechanical').view_less(increments=0)
+
+    def peakmem_init(self,files,size):
+        damask.Result(self.fname)
+
+
+class Read(Benchmark):
+
+    def setup(self,files,size):
+        super().setup(files,size)
+        self.result = damask.Result(self.fname)
+        self.last = self.result.view(increments=-1)
+
+    def time_get(self,files,size):
+        self.result.get(['F','P'])
+
+    def time_place(self,files,size):
+        self.result.place(['F','P'])
+
+    def time_place_lazy_slice(self,files,size):
+        self.last.place('F',constituents=0,lazy=True)[:self.N_materialpoints//10]
+
+    def time_reduce(self,files,size):
+        self.result.reduce('P',['mean','std'])
+
+    def peakmem_place(self,files,size):
+        self.result.place(['F','P'])
+
+    def track_place_throughput(self,files,size):
+        start = time.perf_counter()
+        self.result.place('*')
+        return self.N_bytes/1024**2/(time.perf_counter()-start)
+
+    track_place_throughput.unit = 'MiB/s'                                                           # type: ignore
+
+
+class Add(Benchmark):
+    """Each measurement operates on a fresh copy of the file."""
+
+    def setup(self,files,size):
+        super().setup(files,size)
+        shutil.copy(self.fname,self.tmp)
+        self.result = damask.Result(self.tmp/Path(self.fname).name)
+
+    def time_add_stress_Cauchy(self,files,size):
+        self.result.add_stress_Cauchy()
+
+    def time_add_strain(self,files,size):
+        self.result.add_strain()
+
+    def time_add_IPF_color(self,files,size):
+        self.result.add_IPF_color(np.array([0,0,1]))
+
+    def time_add_calculation(self,files,size):
+        self.result.add_calculation('2.0*#P#+1.0','P_scaled')
+
+    def time_add_many(self,files,size):
+        self.result.add_many(['stress_Cauchy',('equivalent_Mises','sigma'),'strain'])
+
+    def time_add_stress_Cauchy_processes(self,files,size):
+        self.result.view(processes=4).add_stress_Cauchy()
+
+    def peakmem_add_stress_Cauchy(self,files,size):
+        self.result.add_stress_Cauchy()
+
+
+class Export(Benchmark):
+
+    def setup(self,files,size):
+        super().setup(files,size)
+        self.result = damask.Result(self.fname)
+
+    def time_export_VTK(self,files,size):
+        self.result.export_VTK(['F','P'],target_dir=self.tmp,parallel=False)
+
+    def time_export_VTK_processes(self,files,size):
+        self.result.view(processes=4).export_VTK(['F','P'],target_dir=self.tmp,parallel=False)
+
+    def time_export_XDMF(self,files,size):
+        self.result.export_XDMF(['F','P'],target_dir=self.tmp)
+
+    def time_export_DADF5(self,files,size):
+        self.result.export_DADF5(self.tmp/'exported.hdf5',['F','P'])
+
+    def time_export_DADF5_link(self,files,size):
+        self.result.export_DADF5(self.tmp/'exported.hdf5',['F','P'],link=True)
+
+    def peakmem_export_VTK(self,files,size):
+        self.result.export_VTK(['F','P'],target_dir=self.tmp,parallel=False)
+
+    def track_export_VTK_throughput(self,files,size):
+        start = time.perf_counter()
+        self.result.export_VTK('*',target_dir=self.tmp,parallel=False)
+        return self.N_bytes/1024**2/(time.perf_counter()-start)
+
+    track_export_VTK_throughput.unit = 'MiB/s'                                                      # type: ignore
@@ -0,0 +1,141 @@
+"""Synthetic DADF5 files for benchmarking."""
+
+from pathlib import Path
+from typing import Union, Optional, Sequence, Tuple
+
+import h5py
+import numpy as np
+
+import damask
+
+
+outputs_available = {'F':     ('deformation gradient','1',(3,3)),
+                     'F_e':   ('elastic deformation gradient','1',(3,3)),
+                     'F_p':   ('plastic deformation gradient','1',(3,3)),
+                     'L_p':   ('plastic velocity gradient','1/s',(3,3)),
+                     'P':     ('first Piola-Kirchhoff stress','Pa',(3,3)),
+                     'O':     ('crystal orientation as quaternion q_0 (q_1 q_2 q_3)','1',(4,)),
+                     'xi_sl': ('resistance against plastic slip','Pa',(12,)),
+                    }
+
+
+def _values(output: str,
+            t: float,
+            N: int,
+            rng: np.random.Generator) -> np.ndarray:
+    """Plausible values of an output at time t."""
+    shape = outputs_available[output][2]
+    if output == 'O':
+        return damask.Rotation.from_random(N,rng_seed=rng).as_quaternion()
+    if output in ['F','F_e','F_p']:
+        return np.eye(3) + t*1e-3*rng.standard_normal((N,)+shape)
+    if output == 'P':
+        return t*1e7*rng.standard_normal((N,)+shape)
+    if output == 'xi_sl':
+        return (1.+t*1e-2)*rng.uniform(1e8,2e8,(N,)+shape)
+    return 1e-3*rng.standard_normal((N,)+shape)
+
+
+def _cell_to(labels: np.ndarray,
+             names: Sequence[str]) -> np.ndarray:
+    """Mapping of cells (and constituents) to labels and entries; entries are enumerated in cell order."""
+    flat = labels.reshape(-1)
+    mapping = np.empty(flat.shape,dtype=[('label',f'S{max(map(len,names))}'),('entry','<i8')])
+    mapping['label'] = np.array(names,dtype='S')[flat]
+    for i in range(len(names)):
+        mapping['entry'][flat == i] = np.arange(np.count_nonzero(flat == i))
+    return mapping.reshape(labels.shape)
+
+
+def write(fname: Union[str, Path],
+          cells: Sequence[int] = (16,16,16),
+          phases: int = 2,
+          constituents: int = 1,
+          increments: int = 4,
+          outputs: Sequence[str] = ('F','P','O'),
+          grains: int = 20,
+          compression: Optional[str] = None,
+          rng_seed: int = 20191102) -> Tuple[int, int]:
+    """
+    Write a synthetic DADF5 file of a grid solver simulation.
+
+    The grains of a Voronoi tessellation are assigned to
+    the phases, constituents of a material point belong
+    to different grains. The data is random.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        Filename of the DADF5 file.
+    cells : sequence of int, len (3)
+        Number of cells in x,y,z direction.
+    phases : int, optional
+        Number of phases. Defaults to 2.
+    constituents : int, optional
+        Number of constituents per material point. Defaults to 1.
+    increments : int, optional
+        Number of increments after the initial one. Defaults to 4.
+    outputs : sequence of str, optional
+        Outputs of the phases, see `outputs_available`.
+        Defaults to ('F','P','O').
+    grains : int, optional
+        Number of grains. Defaults to 20.
+    compression : {'gzip','lzf'}, optional
+        Compression of the datasets. Defaults to None.
+    rng_seed : int, optional
+        Seed of the random number generator.
+
+    Returns
+    -------
+    N_materialpoints : int
+        Number of material points.
+    N_bytes : int
+        Size of the data of all increments in bytes.
+
+    """
+    rng = np.random.default_rng(rng_seed)
+    cells_ = np.array(cells,dtype=int)
+    size = cells_/np.max(cells_)
+    N_materialpoints = int(np.prod(cells_))
+
+    seeds = damask.seeds.from_random(size,grains,cells_,rng)
+    material = damask.GeomGrid.from_Voronoi_tessellation(cells_,size,seeds).material.flatten(order='F')
+    phase = np.stack([(material+c)%phases for c in range(constituents)],axis=1)
+    phase_names = [f'phase_{p}' for p in range(phases)]
+    lattices = ['cF','cI','hP']
+
+    N_bytes = 0
+    with h5py.File(fname,'w') as f:
+        f.attrs.update({'DADF5_version_major':1,'DADF5_version_minor':0,
+                        'creator':f'synthetic (damask v{damask.version})','created':'2024-01-01 00:00:00+0000',
+                        'call':'DAMASK_grid -l load.yaml -g synthetic.vti'})
+        f.create_group('setup').attrs['description'] = 'input data used to run the simulation'
+        geometry = f.create_group('geometry')
+        geometry.attrs.update({'cells':cells_.astype(np.int32),'size':size,'origin':np.zeros(3)})
+
+        f.create_group('cell_to').attrs['description'] = 'mappings to place data in space'
+        f['cell_to'].create_dataset('phase',data=_cell_to(phase,phase_names))
+        f['cell_to'].create_dataset('homogenization',data=_cell_to(np.zeros(N_materialpoints,int),['SX']))
+
+        N_entries = [np.count_nonzero(phase == p) for p in range(phases)]
+        for i in range(increments+1):
+            t = float(i)
+            inc = f.create_group(f'increment_{i}')
+            inc.attrs['t/s'] = t
+            for label,N,description in [('u_p',N_materialpoints,'displacements of the materialpoints (cell centers)'),
+                                        ('u_n',int(np.prod(cells_+1)),'displacements of the nodes')]:
+                d = inc.create_dataset(f'geometry/{label}',data=t*1e-3*rng.standard_normal((N,3)))
+                d.attrs.update({'description':description,'unit':'m'})
+                N_bytes += d.nbytes
+            inc.create_group('homogenization/SX/mechanical')
+            for p,(name,N) in enumerate(zip(phase_names,N_entries)):
+                mechanical = inc.create_group(f'phase/{name}/mechanical')
+                for out in outputs:
+                    d = mechanical.create_dataset(out,data=_values(out,t,N,rng),
+                                                  compression=compression if N > 0 else None)
+                    d.attrs.update({'description':outputs_available[out][0],'unit':outputs_available[out][1],
+                                    'creator':f'DAMASK v{damask.version}'})
+                    if out == 'O': d.attrs['lattice'] = lattices[p%len(lattices)]
+                    N_bytes += d.nbytes
+
+    return N_materialpoints,N_bytes
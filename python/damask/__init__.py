@@ -28,3 +28,4 @@ from ._configmaterial  import ConfigMaterial   # noqa
 from ._loadcasegrid    import LoadcaseGrid     # noqa
 from ._geomgrid        import GeomGrid         # noqa
 from ._result          import Result           # noqa
+from ._resultcollection import ResultCollection # noqa
@@ -726,9 +726,9 @@ class GeomGrid:
 
         """
         v = VTK.from_image_data(self.cells,self.size,self.origin)\
-               .set('material',self.material.flatten(order='F'))
+               .set('material',self.material.flatten(order='F'),inplace=True)
         for label,data in self.initial_conditions.items():
-            v = v.set(label,data.flatten(order='F'))
+            v.set(label,data.flatten(order='F'),inplace=True)
         v.comments = self.comments
 
         v.save(fname,parallel=False,compress=compress)
@@ -1,19 +1,33 @@
 import re
+import ast
 import fnmatch
 import os
 import copy
 import xml.etree.ElementTree as ET                                                                  # noqa
 import xml.dom.minidom
 import functools
+import contextlib
+import hashlib
+import tempfile
+import time
+import tracemalloc
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterable
-from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple
+from typing import Optional, Union, Callable, Any, Sequence, Literal, Dict, List, Tuple, Set, Iterator, Mapping
 
 import h5py
 import numpy as np
 from numpy import ma
-from scipy import interpolate
+from scipy import sparse
+from h5py import h5s
+from vtkmodules.util.numpy_support import vtk_to_numpy
+try:
+    import numexpr as ne                                                                            # type: ignore
+except ImportError:
+    ne = False
 
 import damask
 from . import VTK
@@ -23,21 +37,137 @@ from . import grid_filters
 from . import mechanics
 from . import tensor
 from . import util
-from ._typehints import FloatSequence, IntSequence, DADF5Dataset
+from ._typehints import FloatSequence, IntSequence, DADF5Dataset, DTypeLike
 
 
 h5py3 = h5py.__version__[0] == '3'
 
 chunk_size = 1024**2//8                                                                             # for compression in HDF5
 
+storage: Dict[str, Any] = {'chunk_size':       chunk_size,
+                           'compression':      'gzip',
+                           'compression_opts': 6,
+                           'shuffle':          True,
+                           'fletcher32':       True}                                                # default for added datasets
+
 prefix_inc = 'increment_'
 
 
-def _read(dataset: h5py._hl.dataset.Dataset) -> np.ndarray:
-    """Read a dataset and its metadata into a numpy.ndarray."""
-    metadata = {k:(v.decode() if not h5py3 and type(v) is bytes else v) for k,v in dataset.attrs.items()}
-    dtype = np.dtype(dataset.dtype,metadata=metadata)                                               # type: ignore
-    return np.array(dataset,dtype=dtype)
+def _meta(dataset: h5py._hl.dataset.Dataset) -> Dict[str, Any]:
+    """Metadata (attributes) of a dataset."""
+    return {k:(v.decode() if not h5py3 and type(v) is bytes else v) for k,v in dataset.attrs.items()}
+
+def _cast(dataset: h5py._hl.dataset.Dataset,
+          dtype: Optional[DTypeLike] = None) -> np.dtype:
+    """Data type to read a dataset with, only floating point data is cast."""
+    return np.dtype(dtype) if dtype is not None and np.issubdtype(dataset.dtype,np.floating) else dataset.dtype
+
+def _dtype(dataset: h5py._hl.dataset.Dataset,
+           dtype: Optional[DTypeLike] = None) -> np.dtype:
+    """Data type of a dataset (cast to dtype) including its metadata."""
+    return np.dtype(_cast(dataset,dtype),metadata=_meta(dataset))                                  # type: ignore
+
+def _read(dataset: h5py._hl.dataset.Dataset,
+          dtype: Optional[DTypeLike] = None) -> np.ndarray:
+    """Read a dataset (cast to dtype) and its metadata into a numpy.ndarray."""
+    with _stage('read'):
+        if (cast := _cast(dataset,dtype)) == dataset.dtype:
+            data = np.array(dataset,dtype=_dtype(dataset))
+        else:
+            data = dataset.astype(cast)[()].view(_dtype(dataset,dtype))                             # cast by HDF5
+    _account(dataset,read=data.nbytes)
+    return data
+
+def _read_rows(dataset: h5py._hl.dataset.Dataset,
+               rows: Union[None, slice, np.ndarray],
+               dtype: Optional[DTypeLike] = None) -> np.ndarray:
+    """Read selected rows (all if None) of a dataset (cast to dtype) and its metadata into a numpy.ndarray."""
+    if rows is None:
+        return _read(dataset,dtype)
+    source = dataset if (cast := _cast(dataset,dtype)) == dataset.dtype else dataset.astype(cast)
+    if isinstance(rows,slice):
+        with _stage('read'):
+            data = np.asarray(source[rows])                                                         # hyperslab
+        _account(dataset,read=data.nbytes)
+        return data.view(_dtype(dataset,dtype))
+    unique,inverse = np.unique(rows,return_inverse=True)
+    with _stage('read'):
+        if len(unique) == 0:
+            data,selection = source[0:0],slice(None)
+        elif unique[-1]-unique[0]+1 <= 2*len(unique):                                              # dense selection: read hyperslab
+            data,selection = source[unique[0]:unique[-1]+1],unique-unique[0]
+        else:
+            data,selection = source[unique],slice(None)                                            # point selection needs increasing indices
+    _account(dataset,read=data.nbytes)
+    return np.asarray(data[selection]).view(_dtype(dataset,dtype))[inverse.ravel()]
+
+def _crop(at_cell: np.ndarray,
+          in_data: np.ndarray,
+          rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Restrict a mapping to the given rows, cells are renumbered according to their position in rows."""
+    if len(at_cell) == 0:
+        return at_cell,in_data
+    i = np.minimum(np.searchsorted(at_cell,rows),len(at_cell)-1)
+    hit = at_cell[i] == rows
+    return np.nonzero(hit)[0],in_data[i[hit]]
+
+def _materialize(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Read the data of all placeholders in a nested dictionary."""
+    return {k:_materialize(v) if isinstance(v,dict) else v[:] for k,v in data.items()}
+
+def _blocks(dataset: h5py._hl.dataset.Dataset,
+            N_bytes: int = 2**24) -> List[Tuple[int, int]]:
+    """Ranges of rows of a dataset of about the given size, aligned to its chunks."""
+    N_block = max(1,N_bytes//max(1,dataset.dtype.itemsize*int(np.prod(dataset.shape[1:],dtype=int))))
+    if dataset.chunks is not None:
+        N_block = max(1,N_block//dataset.chunks[0])*dataset.chunks[0]
+    return [(b,min(b+N_block,dataset.shape[0])) for b in range(0,dataset.shape[0],N_block)]
+
+def _strided_runs(a: np.ndarray,
+                  b: np.ndarray) -> List[Tuple[int, int]]:
+    """First and last index of the runs of positive, constant strides in both a and b."""
+    if len(a) == 0: return []
+    d_a,d_b = np.diff(a),np.diff(b)
+    change = np.nonzero((d_a[1:] != d_a[:-1]) | (d_b[1:] != d_b[:-1]) | (d_a[1:] <= 0) | (d_b[1:] <= 0))[0]+1
+    runs,i = [],0
+    while i < len(a):
+        if i == len(a)-1 or d_a[i] <= 0 or d_b[i] <= 0:
+            runs.append((i,i))
+            i += 1
+        else:
+            e = int(change[np.searchsorted(change,i,side='right')]) if change.size and change[-1] > i else len(d_a)
+            runs.append((i,e))
+            i = e+1
+    return runs
+
+def _storage_options(shape: Tuple[int, ...],
+                     storage: Dict[str, Any]) -> Dict[str, Any]:
+    """Chunking and filters of a dataset of the given shape according to a storage policy."""
+    chunks: Optional[Tuple[int, ...]]
+    if large := np.prod(shape) >= storage['chunk_size']*2:
+        chunks = (max(1,storage['chunk_size']//int(np.prod(shape[1:],dtype=int))),)+shape[1:]
+    else:
+        chunks = shape if np.prod(shape) > 0 else None
+    return {'chunks':           chunks,
+            'compression':      storage['compression'] if large else None,
+            'compression_opts': storage['compression_opts'] if large and storage['compression'] == 'gzip' else None,
+            'shuffle':          storage['shuffle'] and chunks is not None,
+            'fletcher32':       storage['fletcher32'] and chunks is not None}
+
+def _create_dataset(group: h5py.Group,
+                    label: str,
+                    shape: Tuple[int, ...],
+                    dtype: np.dtype,
+                    storage: Dict[str, Any]) -> h5py.Dataset:
+    """Create a dataset with chunking and filters according to a storage policy."""
+    return group.create_dataset(label,shape=shape,dtype=dtype,maxshape=shape,**_storage_options(shape,storage))
+
+def _box(lower: np.ndarray,
+         upper: np.ndarray,
+         cells: np.ndarray) -> np.ndarray:
+    """Flat (ascending) indices of the box [lower,upper) of a regular grid."""
+    i,j,k = [np.arange(l,u) for l,u in zip(lower,upper)]
+    return (i[:,None,None] + cells[0]*(j[None,:,None] + cells[1]*k[None,None,:])).ravel(order='F')
 
 def _match(requested,
            existing: h5py._hl.base.KeysViewHDF5) -> List[str]:
@@ -56,7 +186,7 @@ def _match(requested,
     return sorted(set(flatten_list([fnmatch.filter(existing,r) for r in requested_])),
                   key=util.natural_sort)
 
-def _empty_like(dataset: np.ma.core.MaskedArray,
+def _empty_like(dataset: Union[np.ma.core.MaskedArray, "_LazyData"],
                 N_materialpoints: int,
                 fill_float: float,
                 fill_int: int) -> np.ma.core.MaskedArray:
@@ -66,6 +196,476 @@ def _empty_like(dataset: np.ma.core.MaskedArray,
                     mask = True)
 
 
+PointwiseStep = Tuple[Callable[..., DADF5Dataset], Dict[str, str], Dict[str, Any]]
+
+def _fingerprint(callback: Callable[..., DADF5Dataset],
+                 args: Dict[str, Any],
+                 inputs: Sequence[Mapping[str, Any]]) -> str:
+    """
+    Fingerprint of a calculation.
+
+    The fingerprint consists of a hash of the callback (name and code)
+    and its arguments and a hash of the fingerprints (if derived) or
+    creation time stamps of the inputs, separated by '-'.
+    """
+    def code(c) -> Tuple:
+        return (c.co_code,c.co_names,
+                tuple(code(v) if hasattr(v,'co_code') else
+                      repr(sorted(map(repr,v)) if isinstance(v,frozenset) else v)                   # sets are unordered
+                      for v in c.co_consts))
+
+    calculation = (callback.__qualname__,
+                   code(callback.__code__) if hasattr(callback,'__code__') else None,
+                   sorted([(k,repr(v)) for k,v in args.items()]))
+    stamps = [meta.get('fingerprint',meta.get('created','')) for meta in inputs]
+    return '-'.join([hashlib.sha1(repr(identity).encode()).hexdigest() for identity in (calculation,stamps)])
+
+def _job_pointwise(steps: Sequence[PointwiseStep],
+                   datasets_in: Optional[Dict[str, DADF5Dataset]],
+                   skip: Set[int] = set()) -> Dict[int, DADF5Dataset]:
+    """
+    Evaluate callbacks on the datasets of one group.
+
+    Callbacks are evaluated once all their input datasets,
+    either read or calculated by another callback, are available.
+    """
+    results: Dict[int, DADF5Dataset] = {}
+    if datasets_in is None: return results
+
+    available = dict(datasets_in)
+    pending = [i for i in range(len(steps)) if i not in skip]
+    while ready := [i for i in pending if set(steps[i][1].values()).issubset(available)]:
+        for i in ready:
+            callback,datasets,args = steps[i]
+            pending.remove(i)
+            try:
+                with _stage('compute'):
+                    results[i] = callback(**{arg:available[label] for arg,label in datasets.items()},**args)
+                results[i]['meta']['fingerprint'] = \
+                    _fingerprint(callback,args,[available[datasets[arg]]['meta'] for arg in sorted(datasets)])
+                available[results[i]['label']] = results[i]
+            except Exception as err:
+                print(f'Error during calculation: {err}.')
+                results.pop(i,None)
+    return results
+
+_elementwise = {'sqrt':'sqrt','exp':'exp','expm1':'expm1','log':'log','log10':'log10','log1p':'log1p',
+                'sin':'sin','cos':'cos','tan':'tan','arcsin':'arcsin','arccos':'arccos','arctan':'arctan',
+                'arctan2':'arctan2','sinh':'sinh','cosh':'cosh','tanh':'tanh','arcsinh':'arcsinh',
+                'arccosh':'arccosh','arctanh':'arctanh','abs':'abs','absolute':'abs','where':'where',
+                'real':'real','imag':'imag','conj':'conj'}                                          # NumPy to numexpr
+
+def _is_elementwise(node: ast.AST,
+                    variables: Sequence[str]) -> bool:
+    """Check whether an expression is composed of element-wise operations supported by numexpr."""
+    if isinstance(node,ast.Name):
+        return node.id in variables
+    if isinstance(node,ast.Constant):
+        return type(node.value) in [int,float,bool]
+    if isinstance(node,ast.BinOp):
+        return isinstance(node.op,(ast.Add,ast.Sub,ast.Mult,ast.Div,ast.Pow,ast.Mod,ast.BitAnd,ast.BitOr)) \
+               and _is_elementwise(node.left,variables) and _is_elementwise(node.right,variables)
+    if isinstance(node,ast.UnaryOp):
+        return isinstance(node.op,(ast.UAdd,ast.USub,ast.Invert)) and _is_elementwise(node.operand,variables)
+    if isinstance(node,ast.Compare):
+        return len(node.ops) == 1 and not isinstance(node.ops[0],(ast.Is,ast.IsNot,ast.In,ast.NotIn)) \
+               and _is_elementwise(node.left,variables) and _is_elementwise(node.comparators[0],variables)
+    if isinstance(node,ast.Call):
+        return isinstance(node.func,ast.Attribute) and isinstance(node.func.value,ast.Name) \
+               and node.func.value.id in ['np','numpy'] and node.func.attr in _elementwise \
+               and not node.keywords and all(_is_elementwise(a,variables) for a in node.args)
+    return False
+
+def _compile_formula(formula: str) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+    """
+    Compile a formula that references datasets by '#name#'.
+
+    Element-wise formulas are evaluated by numexpr, if available, or in
+    cache-sized blocks of rows by NumPy. Other formulas are evaluated at once.
+    """
+    labels = list(dict.fromkeys(re.findall(r'#(.*?)#',formula)))
+    variables = [f'_{i}' for i in range(len(labels))]
+    expression = formula
+    for label,variable in zip(labels,variables):
+        expression = expression.replace(f'#{label}#',variable)
+    tree = ast.parse(expression,mode='eval')
+    code = compile(tree,'<formula>','eval')
+    elementwise = len(labels) > 0 and _is_elementwise(tree.body,variables)
+
+    class ToNumexpr(ast.NodeTransformer):
+        def visit_Call(self,node):
+            self.generic_visit(node)
+            node.func = ast.Name(id=_elementwise[node.func.attr],ctx=ast.Load())
+            return node
+
+    unparse = ne and hasattr(ast,'unparse')                                                         # ast.unparse requires Python 3.9
+    numexpr = ast.unparse(ToNumexpr().visit(tree)) if elementwise and unparse else None
+
+    def evaluate(data: Dict[str, np.ndarray]) -> np.ndarray:
+        arrays = {variable:data[label] for variable,label in zip(variables,labels)}
+        if not elementwise:
+            return eval(code,globals(),arrays)
+        if numexpr is not None:
+            return ne.evaluate(numexpr,local_dict=arrays,global_dict={})
+
+        N = len(arrays[variables[0]])
+        N_block = max(1,2**15//max([int(np.prod(a.shape[1:],dtype=int)) for a in arrays.values()]+[1]))
+        result = None
+        for b in range(0,N,N_block):
+            block = eval(code,globals(),{v:a[b:b+N_block] for v,a in arrays.items()})
+            if result is None:
+                if np.ndim(block) == 0: return eval(code,globals(),arrays)
+                result = np.empty((N,)+np.shape(block)[1:],np.result_type(block))
+            result[b:b+N_block] = block
+        return eval(code,globals(),arrays) if result is None else result
+
+    return evaluate
+
+def _cell_to_node(cells: Sequence[int],
+                  nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weights to interpolate linearly from cell centers to nodes of a regular grid.
+
+    Values at the boundary nodes are extrapolated.
+    Cells and nodes are counted with the last axis being fastest.
+    Returns the indices of the eight contributing cells and their weights.
+    """
+    def along(N: int) -> Tuple[np.ndarray, np.ndarray]:
+        if N == 1: return np.zeros((2,2),int),np.array([[1.,0.]]*2)
+        x = np.arange(N+1)-.5                                                                       # node positions in cell units
+        i = np.clip(np.floor(x).astype(int),0,N-2)
+        return np.stack([i,i+1],axis=-1),np.stack([1.-(x-i),x-i],axis=-1)
+
+    (i_x,w_x),(i_y,w_y),(i_z,w_z) = [along(N) for N in cells]
+    x,y,z = np.unravel_index(nodes,np.array(cells)+1)
+    indices = (i_x[x][:,:,None,None]*cells[1] + i_y[y][:,None,:,None])*cells[2] + i_z[z][:,None,None,:]
+    weights =  w_x[x][:,:,None,None]          * w_y[y][:,None,:,None]           * w_z[z][:,None,None,:]
+    return indices.reshape(-1,8),weights.reshape(-1,8)
+
+_forked_job: Dict[str, Any] = {}
+
+def _forked_job_export(inc: str):
+    """Export an increment with the closure inherited from the parent process."""
+    _forked_job['export'](inc,False)
+
+def _forked_job_regrid(name: str,
+                       rows: Optional[np.ndarray],
+                       nodes: Optional[slice]) -> np.ndarray:
+    """Regrid a block of a dataset with the closure inherited from the parent process."""
+    return _forked_job['regrid'](name,rows,nodes)
+
+def _forked_job_pointwise(datasets_in: Optional[Dict[str, DADF5Dataset]],
+                          skip: Set[int]) -> Dict[int, DADF5Dataset]:
+    """Evaluate the callbacks (not picklable) inherited from the parent process."""
+    return _job_pointwise(_forked_job['steps'],datasets_in,skip)
+
+_profile: Optional["_Profile"] = None
+
+def _stage(name: str) -> contextlib.AbstractContextManager:
+    """Account the wall time of a block to a stage, if profiling is active."""
+    return contextlib.nullcontext() if _profile is None else _profile.stage(name)
+
+def _account(dataset: Union[h5py.Dataset, str],
+             read: int = 0,
+             written: int = 0):
+    """Account bytes read from or written to a dataset or file, if profiling is active."""
+    if _profile is not None: _profile.account(dataset,read,written)
+
+def _profiled(name: str) -> Callable:
+    """Account the wall time of a method to a stage, if profiling is active."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profile is None:
+                return func(*args,**kwargs)
+            with _profile.stage(name):
+                return func(*args,**kwargs)
+        return wrapper
+    return decorator
+
+
+class _Profile:
+    """
+    Statistics of the operations within `Result.profile`.
+
+    Attributes
+    ----------
+    time : dict
+        Wall time in s per stage, excluding the time of nested stages.
+    calls : dict
+        Number of calls per stage.
+    bytes_read : dict
+        Bytes read per dataset (after decompression and cast).
+    bytes_stored : dict
+        Storage size in the file per dataset read.
+    bytes_written : dict
+        Bytes written per dataset or file.
+    file_opens : int
+        Number of times the DADF5 file was opened.
+    peak_memory : int or None
+        Peak of the memory allocated in addition to the memory
+        allocated at the start of profiling, in bytes. None if
+        unknown (Python < 3.9 with memory tracing already active).
+    wall_time : float
+        Total wall time in s.
+
+    """
+
+    def __init__(self,
+                 callback: Optional[Callable[[str, float], None]] = None):
+        self.time: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.bytes_read: Dict[str, int] = defaultdict(int)
+        self.bytes_stored: Dict[str, int] = {}
+        self.bytes_written: Dict[str, int] = defaultdict(int)
+        self.file_opens = 0
+        self.peak_memory: Optional[int] = 0
+        self.wall_time = 0.
+        self._callback = callback
+        self._nested: List[float] = []
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return util.srepr([f'{"stage":<16}{"calls":>8}{"time/s":>12}']
+                          + [f'{stage:<16}{self.calls[stage]:>8}{t:>12.4f}'
+                             for stage,t in sorted(self.time.items(),key=lambda x: -x[1])]
+                          + [f'wall time:    {self.wall_time:.4f} s',
+                             f'read:         {sum(self.bytes_read.values())} B'
+                             f' ({sum(self.bytes_stored.values())} B stored)',
+                             f'written:      {sum(self.bytes_written.values())} B',
+                             f'file opens:   {self.file_opens}',
+                             f'peak memory:  {"unknown" if self.peak_memory is None else self.peak_memory} B'])
+
+    @contextlib.contextmanager
+    def stage(self,
+              name: str):
+        """Measure the wall time of a stage."""
+        self._nested.append(0.)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter()-start
+            self.time[name] += elapsed-self._nested.pop()
+            self.calls[name] += 1
+            if self._nested: self._nested[-1] += elapsed
+            if self._callback is not None: self._callback(name,elapsed)
+
+    def account(self,
+                dataset: Union[h5py.Dataset, str],
+                read: int = 0,
+                written: int = 0):
+        """Add bytes read from or written to a dataset or file."""
+        name = dataset if isinstance(dataset,str) else dataset.name
+        if read > 0:
+            self.bytes_read[name] += read
+            if name not in self.bytes_stored and not isinstance(dataset,str):
+                self.bytes_stored[name] = dataset.id.get_storage_size()
+        if written > 0:
+            self.bytes_written[name] += written
+
+
+class _LazyData:
+    """
+    Placeholder for data in a DADF5 file that is read on demand.
+
+    Data is read when the placeholder is indexed, in which case
+    the first index selects the rows to read, or when it is
+    converted with numpy.asarray.
+    """
+
+    def __init__(self,
+                 result: "Result",
+                 dataset: h5py._hl.dataset.Dataset,
+                 N_rows: Optional[int] = None,
+                 fill: Optional[Tuple[float, int]] = None,
+                 dtype: Optional[DTypeLike] = None):
+        """
+        New placeholder for (placed) data.
+
+        Parameters
+        ----------
+        result : damask.Result
+            Result used to access the DADF5 file.
+        dataset : h5py.Dataset
+            Dataset that determines type and shape of the data.
+        N_rows : int, optional
+            Number of rows of placed data.
+            Defaults to None, i.e. data is not placed.
+        fill : tuple of float and int, optional
+            Fill values for floating point and integer data.
+            Defaults to None, i.e. data is not masked.
+        dtype : numpy.dtype, optional
+            Data type to read floating point data with.
+            Defaults to None, i.e. the stored data type.
+
+        """
+        self._result = result
+        self._fill = fill
+        self._cast = dtype
+        self._path: str = dataset.name
+        self._sources: List[Tuple[str, np.ndarray, np.ndarray]] = []
+        self.shape: Tuple[int, ...] = (dataset.shape[0] if N_rows is None else N_rows,)+dataset.shape[1:]
+        self.dtype = _dtype(dataset,dtype)
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return f'lazy data of shape {self.shape} and type {self.dtype}'
+
+
+    def __len__(self) -> int:
+        """Return len(self)."""
+        return self.shape[0]
+
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+
+    def __array__(self,
+                  dtype: Optional[np.dtype] = None,
+                  copy: Optional[bool] = None) -> np.ndarray:
+        """Read all data, masked entries are filled."""
+        data = self._read(None)
+        return np.asarray(data.filled() if isinstance(data,np.ma.MaskedArray) else data,dtype)
+
+
+    def __getitem__(self,
+                    key) -> Union[np.ndarray, np.ma.MaskedArray]:
+        """Read the rows selected by the first index."""
+        key_ = key if isinstance(key,tuple) else (key,)
+        if len(key_) == 0 or key_[0] is Ellipsis:
+            key_ = (slice(None),)+key_
+        N = self.shape[0]
+        if isinstance(key_[0],(int,np.integer,slice)):
+            selected = range(N)[key_[0]]
+            if isinstance(selected,int):
+                return self._read(slice(selected,selected+1))[0][key_[1:]]
+            if selected.step == 1 or len(selected) <= 1:                                            # contiguous rows
+                start = selected.start if len(selected) > 0 else 0
+                data = self._read(None if len(selected) == N else slice(start,start+len(selected)))
+                return data[(slice(None),)+key_[1:]]
+            rows = np.array(selected)
+        elif (index := np.asarray(key_[0])).dtype == bool and index.shape == (N,):
+            rows = np.nonzero(index)[0]
+        elif np.issubdtype(index.dtype,np.integer):
+            if np.any((index < -N) | (index >= N)):
+                raise IndexError(f'index out of bounds for {N} rows')
+            rows = np.where(index < 0,index+N,index)
+        else:
+            rows = np.arange(N)[key_[0]]
+        data = self._read(np.atleast_1d(rows).ravel())
+        return data.reshape(np.shape(rows)+data.shape[1:])[(slice(None),)*np.ndim(rows)+key_[1:]]
+
+
+    def _add(self,
+             path: str,
+             at_cell: np.ndarray,
+             in_data: np.ndarray):
+        """Add a dataset to be placed and the mapping of its entries to the rows."""
+        self._sources.append((path,at_cell,in_data))
+
+
+    def _read(self,
+              rows: Union[None, slice, np.ndarray]) -> Union[np.ndarray, np.ma.MaskedArray]:
+        """Read the given rows (all if None), slices need to be contiguous."""
+        with self._result._open('r') as f:
+            if not self._sources:
+                data = _read_rows(f[self._path],rows,self._cast)
+                return data if self._fill is None else ma.array(data,fill_value=self._fill[0])
+
+            fill_float,fill_int = self._fill if self._fill is not None else (np.nan,0)
+            N_rows = self.shape[0] if rows is None else \
+                     rows.stop-rows.start if isinstance(rows,slice) else len(rows)
+            placed = _empty_like(self,N_rows,fill_float,fill_int)
+            for path,at_cell,in_data in self._sources:
+                if rows is None:
+                    placed[at_cell] = _read_rows(f[path],in_data,self._cast)
+                else:
+                    if isinstance(rows,slice):
+                        b,e = np.searchsorted(at_cell,[rows.start,rows.stop])
+                        at,in_ = at_cell[b:e]-rows.start,in_data[b:e]
+                    else:
+                        at,in_ = _crop(at_cell,in_data,rows)
+                    if len(at) > 0: placed[at] = _read_rows(f[path],in_,self._cast)
+        return placed
+
+
+class _Session:
+    """
+    Persistent access to a DADF5 file.
+
+    A single HDF5 handle and the listings of the visited groups
+    are kept while at least one session is active.
+    The labels and the mappings to place data spatially are kept permanently.
+    They are read from the index, if available.
+    The state is shared among all views on the file.
+    """
+
+    def __init__(self,
+                 fname: Path):
+        self.fname = fname
+        self.depth = 0
+        self.users = 0
+        self.handle: Optional[h5py.File] = None
+        self.inherited: Optional[h5py.File] = None
+        self.keys: Dict[str, List[str]] = {}
+        self.labels: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.mappings: Optional[Tuple] = None
+        self.index: Optional[Path] = None
+
+    def __deepcopy__(self,
+                     memo) -> "_Session":
+        """Share state among views."""
+        return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Do not pickle open handles and cached data."""
+        return {'fname':self.fname,'depth':0,'users':0,'handle':None,'inherited':None,'keys':{},
+                'labels':None,'mappings':None,'index':self.index}
+
+    def file(self,
+             mode: Literal['r', 'a']) -> h5py.File:
+        """Return the shared handle, reopen it if write access is needed."""
+        if self.handle is not None and (mode == 'r' or self.handle.mode == 'r+'):
+            return self.handle
+        if self.users > 0:
+            raise RuntimeError('cannot reopen DADF5 file with write access while its handle is in use')
+        self.close()
+        if _profile is not None: _profile.file_opens += 1
+        self.handle = h5py.File(self.fname,mode)
+        return self.handle
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+        self.handle = None
+        self.keys = {}
+
+    def flush(self):
+        """Write buffered data to the file before forking."""
+        if self.handle is not None:
+            self.handle.flush()
+
+    def detach(self):
+        """Forget the handle inherited by a forked process, closing it would affect the parent."""
+        self.inherited,self.handle = self.handle,None
+        self.depth = self.users = 0
+        self.keys = {}
+
+
 class Result:
     r"""
     Add data to and export data from a DADF5 (DAMASK HDF5) file.
@@ -94,7 +694,9 @@ class Result:
 
     """
 
-    def __init__(self, fname: Union[str, Path]):
+    def __init__(self,
+                 fname: Union[str, Path],
+                 index: bool = False):
         """
         New result view bound to a DADF5 file.
 
@@ -102,42 +704,57 @@ class Result:
         ----------
         fname : str or pathlib.Path
             Name of the DADF5 file to be opened.
+        index : bool, optional
+            Use an index ('*.damask-index') next to the DADF5 file
+            to open it quickly. The index is (re)created if it does
+            not exist or if the DADF5 file has been modified.
+            Defaults to False.
 
         """
-        with h5py.File(fname,'r') as f:
+        self.fname = Path(fname).expanduser().absolute()
+        self._session = _Session(self.fname)
+
+        stat = os.stat(self.fname)
+        index_fname = self.fname.with_name(self.fname.name+'.damask-index')
+
+        if not (index and self._load_index(index_fname,stat)):
+            with h5py.File(self.fname,'r') as f:
 
-            self.version_major = f.attrs['DADF5_version_major']
-            self.version_minor = f.attrs['DADF5_version_minor']
+                self.version_major = f.attrs['DADF5_version_major']
+                self.version_minor = f.attrs['DADF5_version_minor']
 
-            if (self.version_major != 0 or not 14 <= self.version_minor <= 14) and self.version_major != 1:
-                raise TypeError(f'unsupported DADF5 version "{self.version_major}.{self.version_minor}"')
+                if (self.version_major != 0 or not 14 <= self.version_minor <= 14) and self.version_major != 1:
+                    raise TypeError(f'unsupported DADF5 version "{self.version_major}.{self.version_minor}"')
 
-            self.structured = 'cells' in f['geometry'].attrs.keys()
+                self.structured = 'cells' in f['geometry'].attrs.keys()
 
-            if self.structured:
-                self.cells  = f['geometry'].attrs['cells']
-                self.size   = f['geometry'].attrs['size']
-                self.origin = f['geometry'].attrs['origin']
+                if self.structured:
+                    self.cells  = f['geometry'].attrs['cells']
+                    self.size   = f['geometry'].attrs['size']
+                    self.origin = f['geometry'].attrs['origin']
 
-            r = re.compile(rf'{prefix_inc}([0-9]+)')
-            self._increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
-            self._times = {int(i.split('_')[1]):np.around(f[i].attrs['t/s'],12) for i in self._increments}
-            if len(self._increments) == 0:
-                raise ValueError('incomplete DADF5 file')
+                r = re.compile(rf'{prefix_inc}([0-9]+)')
+                self._increments = sorted([i for i in f.keys() if r.match(i)],key=util.natural_sort)
+                self._times = {int(i.split('_')[1]):np.around(f[i].attrs['t/s'],12) for i in self._increments}
+                if len(self._increments) == 0:
+                    raise ValueError('incomplete DADF5 file')
 
-            self.N_materialpoints, self.N_constituents = np.shape(f['cell_to/phase'])
+                self.N_materialpoints, self.N_constituents = np.shape(f['cell_to/phase'])
 
-            self.homogenization   = f['cell_to/homogenization']['label'].astype('str')
-            self._homogenizations = sorted(np.unique(self.homogenization),key=util.natural_sort)
-            self.phase            = f['cell_to/phase']['label'].astype('str')
-            self._phases          = sorted(np.unique(self.phase),key=util.natural_sort)
+                homogenization        = np.char.decode(f['cell_to/homogenization']['label'],'utf-8')
+                self._homogenizations = sorted(np.unique(homogenization),key=util.natural_sort)
+                phase                 = np.char.decode(f['cell_to/phase']['label'],'utf-8')
+                self._phases          = sorted(np.unique(phase),key=util.natural_sort)
+                self._session.labels  = (phase,homogenization)
 
-            fields: List[str] = []
-            for c in self._phases:
-                fields += f['/'.join([self._increments[0],'phase',c])].keys()
-            for m in self._homogenizations:
-                fields += f['/'.join([self._increments[0],'homogenization',m])].keys()
-            self._fields = sorted(set(fields),key=util.natural_sort)                                # make unique
+                fields: List[str] = []
+                for c in self._phases:
+                    fields += f['/'.join([self._increments[0],'phase',c])].keys()
+                for m in self._homogenizations:
+                    fields += f['/'.join([self._increments[0],'homogenization',m])].keys()
+                self._fields = sorted(set(fields),key=util.natural_sort)                            # make unique
+
+            if index: self._write_index(index_fname,stat)
 
         self._visible = {'increments':      self._increments,
                          'phases':          self._phases,
@@ -145,9 +762,79 @@ class Result:
                          'fields':          self._fields,
                         }
 
-        self.fname = Path(fname).expanduser().absolute()
-
         self._protected = True
+        self._processes = 1
+        self._memory_limit: Optional[int] = None
+        self._storage = dict(storage)
+        self._pipeline: Optional[List[PointwiseStep]] = None
+
+
+    def _load_index(self,
+                    index_fname: Path,
+                    stat: os.stat_result) -> bool:
+        """Read the metadata from the index, return False if it is missing or outdated."""
+        try:
+            with h5py.File(index_fname,'r') as f:
+                if f.attrs['format'] != 1 or f.attrs['st_mtime_ns'] != stat.st_mtime_ns \
+                                          or f.attrs['st_size'] != stat.st_size:
+                    return False
+
+                self.version_major = f.attrs['DADF5_version_major']
+                self.version_minor = f.attrs['DADF5_version_minor']
+
+                self.structured = 'cells' in f.attrs.keys()
+                if self.structured:
+                    self.cells  = f.attrs['cells']
+                    self.size   = f.attrs['size']
+                    self.origin = f.attrs['origin']
+
+                self._increments = np.char.decode(f['increments'][()],'utf-8').tolist()
+                self._times = dict(zip([int(i.split('_')[1]) for i in self._increments],f['times'][()]))
+                self.N_materialpoints, self.N_constituents = f['phase'].shape
+                self._homogenizations = sorted(np.char.decode(f['homogenizations'][()],'utf-8'),
+                                               key=util.natural_sort)
+                self._phases = sorted(np.char.decode(f['phases'][()],'utf-8'),key=util.natural_sort)
+                self._fields = np.char.decode(f['fields'][()],'utf-8').tolist()
+        except (OSError,KeyError):
+            return False
+
+        self._session.index = index_fname
+        return True
+
+
+    def _write_index(self,
+                     index_fname: Path,
+                     stat: os.stat_result):
+        """Write the metadata, labels, and mappings to the index."""
+        phase,homogenization = self._labels()
+        mappings_ph,mappings_ho = self._mappings(False)
+        tmp = index_fname.with_name(f'{index_fname.name}.{os.getpid()}')
+        try:
+            with h5py.File(tmp,'w') as f:
+                f.attrs.update({'format':1,'st_mtime_ns':stat.st_mtime_ns,'st_size':stat.st_size,
+                                'DADF5_version_major':self.version_major,
+                                'DADF5_version_minor':self.version_minor})
+                if self.structured:
+                    f.attrs.update({'cells':self.cells,'size':self.size,'origin':self.origin})
+
+                f.create_dataset('increments',data=np.char.encode(self._increments,'utf-8'))
+                f.create_dataset('times',data=np.array(list(self._times.values()),dtype=float))
+                f.create_dataset('fields',data=np.char.encode(self._fields,'utf-8'))
+                for ty,labels in [('phase',phase),('homogenization',homogenization)]:
+                    names,codes = np.unique(labels,return_inverse=True)
+                    f.create_dataset(ty+'s',data=np.char.encode(names,'utf-8'))
+                    f.create_dataset(ty,data=codes.reshape(labels.shape),compression='gzip',shuffle=True)
+
+                for c,(at_cell,in_data) in enumerate(mappings_ph):
+                    for label in at_cell:
+                        f.create_dataset(f'mappings/phase/{c}/{label}/at_cell',data=at_cell[label])
+                        f.create_dataset(f'mappings/phase/{c}/{label}/in_data',data=in_data[label])
+                for label in mappings_ho[0]:
+                    f.create_dataset(f'mappings/homogenization/{label}/at_cell',data=mappings_ho[0][label])
+                    f.create_dataset(f'mappings/homogenization/{label}/in_data',data=mappings_ho[1][label])
+            os.replace(tmp,index_fname)
+        except OSError:                                                                             # index is optional
+            if tmp.exists(): tmp.unlink()
 
 
     def __copy__(self) -> "Result":
@@ -169,7 +856,7 @@ class Result:
         Give short, human-readable summary.
 
         """
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f:
             header = [f'Created by {f.attrs["creator"]}',
                       f'        on {f.attrs["created"]}',
                       f' executing "{f.attrs["call"]}"']
@@ -186,6 +873,140 @@ class Result:
         return util.srepr([util.deemph(header)] + first + in_between + last)
 
 
+    @contextlib.contextmanager
+    def session(self):
+        """
+        Keep the DADF5 file open.
+
+        Within a session, all operations on this result and on views
+        derived from it share one HDF5 handle, and the listings of the
+        groups in the file are cached.
+        The handle is reopened with write access when data is added,
+        which is not possible while the handle is in use for reading.
+        Sessions can be nested, the file is closed when the outermost
+        session ends.
+
+        Examples
+        --------
+        Add the Mises equivalent of the Cauchy stress and read it
+        without reopening the file for every step:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> with r.session():
+        ...     r.add_stress_Cauchy()
+        ...     r.add_equivalent_Mises('sigma')
+        ...     sigma_vM = r.place('sigma_vM')
+        [...]
+
+        """
+        self._session.depth += 1
+        try:
+            yield self
+        finally:
+            self._session.depth -= 1
+            if self._session.depth == 0:
+                self._session.close()
+
+
+    @contextlib.contextmanager
+    def profile(self,
+                callback: Optional[Callable[[str, float], None]] = None):
+        """
+        Record statistics of the operations within the context.
+
+        The wall time is accounted to the stages 'read' (HDF5 reading,
+        including decompression and casting), 'place' (spatial placement
+        and masking), 'compute' (calculation of added data), 'convert'
+        (conversion to VTK arrays), and 'write', as well as to the
+        calling operation (e.g. 'get', 'add', or 'export_VTK') for
+        the remainder. Moreover, the bytes read and written per dataset,
+        the number of times the DADF5 file is opened, and the peak of
+        the allocated memory are recorded.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Function that is called with the name of the stage and
+            its wall time (including nested stages) in s whenever
+            a stage is completed.
+
+        Yields
+        ------
+        statistics : damask._result._Profile
+            Statistics, complete once the context is left.
+
+        Notes
+        -----
+        Profiling applies to all DADF5 files and is not active by default.
+        Work done by forked processes (see `view`) or by background
+        processes writing VTK files is accounted to the waiting stage.
+        The memory is traced with `tracemalloc`, which slows down
+        allocations while profiling.
+
+        Examples
+        --------
+        Find the bottleneck of an export to VTK:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> with r.profile() as stats:
+        ...     r.export_VTK(parallel=False)
+        >>> print(stats)
+        stage              calls      time/s
+        read                 120      1.0125
+        write                 11      0.7721
+        [...]
+
+        """
+        global _profile
+        previous,_profile = _profile,_Profile(callback)
+        tracing = tracemalloc.is_tracing()
+        resettable = not tracing or hasattr(tracemalloc,'reset_peak')                               # Python >= 3.9
+        if not tracing:
+            tracemalloc.start()
+        elif resettable:
+            tracemalloc.reset_peak()
+        baseline,peak_before = tracemalloc.get_traced_memory()
+        start = time.perf_counter()
+        try:
+            yield _profile
+        finally:
+            _profile.wall_time = time.perf_counter()-start
+            peak = tracemalloc.get_traced_memory()[1]
+            _profile.peak_memory = peak-baseline if resettable or peak > peak_before else None
+            if not tracing: tracemalloc.stop()
+            _profile = previous
+
+
+    @contextlib.contextmanager
+    def _open(self,
+              mode: Literal['r', 'a'] = 'r'):
+        """Open the DADF5 file or use the handle of the active session."""
+        if self._session.depth > 0:
+            f = self._session.file(mode)
+            self._session.users += 1
+            try:
+                yield f
+            finally:
+                self._session.users -= 1
+        else:
+            if _profile is not None: _profile.file_opens += 1
+            with h5py.File(self.fname,mode) as f:
+                yield f
+
+
+    def _keys(self,
+              f: h5py.File,
+              path: str) -> List[str]:
+        """List members of a group, cached within a session."""
+        if self._session.depth == 0:
+            return list(f[path].keys())
+        if path not in self._session.keys:
+            self._session.keys[path] = list(f[path].keys())
+        return self._session.keys[path]
+
+
     def _manage_view(self,
                      action: Literal['set', 'add', 'del'],
                      increments: Union[None, int, Sequence[int], str, Sequence[str], bool] = None,
@@ -309,7 +1130,10 @@ class Result:
              phases: Union[None, str, Sequence[str], bool] = None,
              homogenizations: Union[None, str, Sequence[str], bool] = None,
              fields: Union[None, str, Sequence[str], bool] = None,
-             protected: Optional[bool] = None) -> "Result":
+             protected: Optional[bool] = None,
+             processes: Optional[int] = None,
+             memory_limit: Union[None, int, bool] = None,
+             storage: Optional[Dict[str, Any]] = None) -> "Result":
         """
         Set view.
 
@@ -330,6 +1154,17 @@ class Result:
             Names of fields to select.
         protected: bool, optional.
             Protection status of existing data.
+        processes: int, optional.
+            Number of processes used to calculate added data.
+        memory_limit: int or bool, optional.
+            Approximate size in bytes of the input data that is read at
+            once to calculate added data. False reads complete datasets.
+        storage: dict, optional.
+            Storage policy for added data, i.e. any of 'chunk_size'
+            (number of values per chunk), 'compression' ('gzip', 'lzf',
+            or None), 'compression_opts' (gzip level), 'shuffle' (bool),
+            and 'fletcher32' (bool). Unspecified entries are kept.
+            Only datasets of at least two chunks are compressed.
 
         Returns
         -------
@@ -350,12 +1185,51 @@ class Result:
         >>> r = damask.Result('my_file.hdf5')
         >>> r_t10to40 = r.view(times=r.times_in_range(10.0,40.0))
 
+        Add the Cauchy stress using eight processes:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.view(processes=8).add_stress_Cauchy()
+        [...]
+
+        Add the Cauchy stress reading approximately 1 GB of input data at once:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.view(memory_limit=1024**3).add_stress_Cauchy()
+        [...]
+
+        Add the Cauchy stress with fast compression and without checksum:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.view(storage={'compression':'lzf','fletcher32':False}).add_stress_Cauchy()
+        [...]
+
         """
         dup = self._manage_view('set',increments,times,phases,homogenizations,fields)
         if protected is not None:
             if not protected:
                 print(util.warn('Warning: Modification of existing datasets allowed!'))
             dup._protected = protected
+        if processes is not None:
+            if processes < 1:
+                raise ValueError(f'invalid number of processes "{processes}"')
+            dup._processes = int(processes)
+        if memory_limit is False:
+            dup._memory_limit = None
+        elif memory_limit is not None:
+            if memory_limit is True or memory_limit <= 0:
+                raise ValueError(f'invalid memory limit "{memory_limit}"')
+            dup._memory_limit = int(memory_limit)
+        if storage is not None:
+            if invalid := set(storage).difference(dup._storage):
+                raise ValueError(f'invalid storage setting(s) "{sorted(invalid)}"')
+            if storage.get('compression','gzip') not in ['gzip','lzf',None]:
+                raise ValueError(f'invalid compression "{storage["compression"]}"')
+            if storage.get('chunk_size',1) < 1:
+                raise ValueError(f'invalid chunk size "{storage["chunk_size"]}"')
+            dup._storage = {**dup._storage,**storage}
 
         return dup
 
@@ -488,11 +1362,11 @@ class Result:
         if self._protected:
             raise PermissionError('rename datasets')
 
-        with h5py.File(self.fname,'a') as f:
+        with self._open('a') as f:
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             path_src = '/'.join([inc,ty,label,field,name_src])
                             path_dst = '/'.join([inc,ty,label,field,name_dst])
                             if path_src in f.keys():
@@ -501,6 +1375,8 @@ class Result:
                                                                f'original name: {name_src}'.encode()
                                 del f[path_src]
 
+            self._session.keys = {}
+
 
     def remove(self, name: str):
         r"""
@@ -528,14 +1404,16 @@ class Result:
         if self._protected:
             raise PermissionError('delete datasets')
 
-        with h5py.File(self.fname,'a') as f:
+        with self._open('a') as f:
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             path = '/'.join([inc,ty,label,field,name])
                             if path in f.keys(): del f[path]
 
+            self._session.keys = {}
+
 
     def list_data(self) -> List[str]:
         """
@@ -548,16 +1426,16 @@ class Result:
 
         """
         msg = []
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f:
             for inc in self._visible['increments']:
                 msg += [f'\n{inc} ({self._times[int(inc.split("_")[1])]} s)']
                 for ty in ['phase','homogenization']:
                     msg += [f'  {ty}']
                     for label in self._visible[ty+'s']:
                         msg += [f'    {label}']
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             msg += [f'      {field}']
-                            for d in f['/'.join([inc,ty,label,field])].keys():
+                            for d in self._keys(f,'/'.join([inc,ty,label,field])):
                                 dataset = f['/'.join([inc,ty,label,field,d])]
                                 unit = dataset.attrs["unit"] if h5py3 else \
                                        dataset.attrs["unit"].decode()
@@ -578,7 +1456,7 @@ class Result:
     def simulation_setup_files(self):
         """Simulation setup files used to generate the Result object."""
         files = []
-        with h5py.File(self.fname,'r') as f_in:
+        with self._open('r') as f_in:
             f_in['setup'].visititems(lambda name,obj: files.append(name) if isinstance(obj,h5py.Dataset) else None)
         return files
 
@@ -613,7 +1491,7 @@ class Result:
         if self.structured:
             return grid_filters.coordinates0_point(self.cells,self.size,self.origin).reshape(-1,3,order='F')
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._open('r') as f:
                 return f['geometry/x_p'][()]
 
     @property
@@ -622,7 +1500,7 @@ class Result:
         if self.structured:
             return grid_filters.coordinates0_node(self.cells,self.size,self.origin).reshape(-1,3,order='F')
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._open('r') as f:
                 return f['geometry/x_n'][()]
 
     @property
@@ -631,7 +1509,7 @@ class Result:
         if self.structured:
             return VTK.from_image_data(self.cells,self.size,self.origin)
         else:
-            with h5py.File(self.fname,'r') as f:
+            with self._open('r') as f:
                 return VTK.from_unstructured_grid(f['/geometry/x_n'][()],
                                                   f['/geometry/T_c'][()]-1,
                                                   f['/geometry/T_c'].attrs['VTK_TYPE'] if h5py3 else \
@@ -682,6 +1560,17 @@ class Result:
         description : str, optional
             Human-readable description of the result.
 
+        Notes
+        -----
+        If a memory limit is set (see `view`), the formula is
+        evaluated for blocks of rows and must treat rows independently.
+
+        The formula is parsed once. Formulas composed of arithmetic,
+        comparisons, and element-wise NumPy functions (e.g. np.sqrt) are
+        evaluated with numexpr, if installed, or in cache-sized blocks
+        to limit the size of temporary arrays. Other formulas are
+        evaluated by NumPy for the complete datasets.
+
         Examples
         --------
         Add total dislocation density, i.e. the sum of mobile dislocation
@@ -715,11 +1604,11 @@ class Result:
         [...]
 
         """
+        evaluate = _compile_formula(formula)
+
         def calculation(**kwargs) -> DADF5Dataset:
-            formula = kwargs['formula']
-            for d in re.findall(r'#(.*?)#',formula):
-                formula = formula.replace(f'#{d}#',f"kwargs['{d}']['data']")
-            data = eval(formula)
+            d = re.findall(r'#(.*?)#',kwargs['formula'])[-1]
+            data = evaluate({label:kwargs[label]['data'] for label in set(re.findall(r'#(.*?)#',kwargs['formula']))})
 
             if not hasattr(data,'shape') or data.shape[0] != kwargs[d]['data'].shape[0]:
                 raise ValueError('"{}" results in invalid shape'.format(kwargs['formula']))
@@ -1368,7 +2257,8 @@ class Result:
         Notes
         -----
         This function is implemented only for structured grids
-        with one constituent and a single phase.
+        with one constituent. Multi-phase data is placed before
+        the calculation and needs to be present in all phases.
 
         """
         def curl(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
@@ -1397,7 +2287,8 @@ class Result:
         Notes
         -----
         This function is implemented only for structured grids
-        with one constituent and a single phase.
+        with one constituent. Multi-phase data is placed before
+        the calculation and needs to be present in all phases.
 
         """
         def divergence(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
@@ -1426,7 +2317,8 @@ class Result:
         Notes
         -----
         This function is implemented only for structured grids
-        with one constituent and a single phase.
+        with one constituent. Multi-phase data is placed before
+        the calculation and needs to be present in all phases.
 
         """
         def gradient(f: DADF5Dataset, size: np.ndarray) -> DADF5Dataset:
@@ -1444,6 +2336,56 @@ class Result:
         self._add_generic_grid(gradient,{'f':f},{'size':self.size})
 
 
+    def add_many(self,
+                 quantities: Sequence[Union[str, Tuple]]):
+        """
+        Add several pointwise quantities in one pass.
+
+        The input datasets are read once per group, all quantities are
+        calculated in memory, and the results are written together.
+        Quantities can depend on each other irrespective of their order.
+
+        Parameters
+        ----------
+        quantities : sequence of str or tuple
+            Quantities to add. Each quantity is given by the name of
+            the corresponding 'add_' method (with or without prefix)
+            or by a tuple of this name, positional arguments, and
+            optionally a dictionary of keyword arguments.
+
+        Examples
+        --------
+        Add Cauchy stress, logarithmic strain, their Mises equivalents,
+        and the rotational part of the deformation gradient 'F':
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_many(['stress_Cauchy',
+        ...             ('equivalent_Mises','sigma'),
+        ...             'strain',
+        ...             ('equivalent_Mises','epsilon_V^0.0(F)'),
+        ...             ('rotation','F'),
+        ...             ('strain','F',{'t':'U','m':0.5})])
+        [...]
+
+        """
+        self._pipeline = []
+        try:
+            for quantity in quantities:
+                name,*arguments = (quantity,) if isinstance(quantity,str) else quantity
+                kwargs = arguments.pop() if arguments and isinstance(arguments[-1],dict) else {}
+                method = name if name.startswith('add_') else f'add_{name}'
+                if method == 'add_many' or not callable(getattr(self,method,None)):
+                    raise ValueError(f'invalid quantity "{name}"')
+                getattr(self,method)(*arguments,**kwargs)
+            steps = self._pipeline
+        finally:
+            self._pipeline = None
+
+        self._add_pointwise(steps)
+
+
+    @_profiled('add')
     def _add_generic_grid(self,
                           func: Callable[..., DADF5Dataset],
                           datasets: Dict[str, str],
@@ -1464,32 +2406,40 @@ class Result:
             Arguments parsed to func.
 
         """
+        if self._pipeline is not None:
+            raise NotImplementedError('not a pointwise quantity')
         if self.N_constituents != 1 or len(datasets) != 1 or not self.structured:
-            raise NotImplementedError('not a structured grid with one constituent and a single phase')
+            raise NotImplementedError('not a structured grid with one constituent')
 
         at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
 
-        increments = self.place(list(datasets.values()),False)
-        if not increments: raise RuntimeError('received invalid dataset')
-        with h5py.File(self.fname, 'a') as f:
+        with self.session(), self._open('a') as f:
+            increments = self.place(list(datasets.values()),False,lazy=True)
+            if not increments: raise RuntimeError('received invalid dataset')
             for increment in increments.items():
                 for ty in increment[1].items():
                     for field in ty[1].items():
-                        d: np.ma.MaskedArray = list(field[1].values())[0]
+                        d: np.ma.MaskedArray = list(field[1].values())[0][:]                        # one increment in memory
                         if np.any(d.mask): continue
                         dataset = {'f':{'data':np.reshape(d.data,tuple(self.cells)+d.data.shape[1:]),
                                         'label':list(datasets.values())[0],
                                         'meta':d.data.dtype.metadata}}
-                        r = func(**dataset,**args)
+                        with _stage('compute'):
+                            r = func(**dataset,**args)
                         result = r['data'].reshape((-1,)+r['data'].shape[3:])
                         for x in self._visible[ty[0]+'s']:
-                            if ty[0] == 'phase':
-                                result1 = result[at_cell_ph[0][x]]
-                            if ty[0] == 'homogenization':
-                                result1 = result[at_cell_ho[x]]
+                            at_cell,in_data = (at_cell_ph[0][x],in_data_ph[0][x]) if ty[0] == 'phase' else \
+                                              (at_cell_ho[x],in_data_ho[x])
+                            if len(at_cell) == 0: continue
+                            result1 = np.empty((len(in_data),)+result.shape[1:],result.dtype)
+                            result1[in_data] = result[at_cell]
 
                             path = '/'.join(['/',increment[0],ty[0],x,field[0]])
-                            h5_dataset = f[path].create_dataset(r['label'],data=result1)
+                            with _stage('write'):
+                                h5_dataset = _create_dataset(f[path],r['label'],result1.shape,result1.dtype,self._storage)
+                                h5_dataset[...] = result1
+                            _account(h5_dataset,written=result1.nbytes)
+                            self._session.keys.pop('/'.join([increment[0],ty[0],x,field[0]]),None)
 
                             h5_dataset.attrs['created'] = util.time_stamp() if h5py3 else \
                                                           util.time_stamp().encode()
@@ -1523,98 +2473,336 @@ class Result:
             Arguments parsed to func.
 
         """
+        if self._pipeline is not None:
+            self._pipeline.append((func,datasets,args))
+        else:
+            self._add_pointwise([(func,datasets,args)])
+
+
+    @_profiled('add')
+    def _add_pointwise(self,
+                       steps: Sequence[PointwiseStep]):
+        """
+        Add pointwise data calculated in one or more steps.
 
-        def job_pointwise(group: str,
-                          callback: Callable[..., DADF5Dataset],
-                          datasets: Dict[str, str],
-                          args: Dict[str, str]) -> Union[None, DADF5Dataset]:
+        Parameters
+        ----------
+        steps : sequence of tuples
+            Callback function, datasets, and arguments
+            (see `_add_generic_pointwise`) of each step.
+            Datasets calculated by one step can be used by other steps.
+
+        Notes
+        -----
+        The input datasets of all steps are read once per DADF5 group
+        and all results are written after evaluating the steps.
+
+        If more than one process is requested (see `view`), the callbacks
+        are evaluated in a pool of forked processes while reading and
+        writing is done by the calling process in the serial order.
+
+        If a memory limit is set (see `view`), the input datasets are
+        read in blocks of rows, aligned to their HDF5 chunks if possible,
+        and the callbacks are evaluated for each block separately.
+
+        Each added dataset carries a fingerprint of the calculation
+        (callback name and code, arguments, and fingerprints or creation
+        time stamps of the input datasets). Steps for which a dataset with
+        matching fingerprint exists in a group are skipped for this group.
+        Existing datasets that were calculated in the same way but from
+        other inputs are stale and replaced, other existing datasets are
+        only replaced if the view is unprotected. To enforce recalculation
+        of up-to-date data, remove it (see `remove`) before adding it.
+
+        """
+        labels = set([label for _,datasets,_ in steps for label in datasets.values()])
+
+        def up_to_date(f: h5py.File,
+                       group: str) -> Set[int]:
+            metas = {label:_meta(f[group+'/'+label]) for label in self._keys(f,group)}
+            matching = {}
+            for i,(callback,datasets,args) in enumerate(steps):
+                if set(datasets.values()).issubset(metas):
+                    fingerprint = _fingerprint(callback,args,[metas[datasets[arg]] for arg in sorted(datasets)])
+                    if fingerprint in [meta.get('fingerprint') for meta in metas.values()]:
+                        matching[i] = fingerprint
+            if len(matching) == len(steps): return set(matching)
+
+            done: Set[int] = set()                                                                  # derived inputs might be recalculated
+            while ready := [i for i in matching if i not in done and
+                            all(metas[label].get('fingerprint') in [None]+[matching[j] for j in done]
+                                for label in steps[i][1].values())]:
+                done.update(ready)
+            return done
+
+        def partition(group: str) -> List[slice]:
+            with self._open('r') as f:
+                locs = [f[group+'/'+label] for label in sources[group]]
+                N_rows = locs[0].shape[0]
+                if self._memory_limit is None:
+                    return [slice(0,N_rows)]
+                row_bytes = sum([loc.dtype.itemsize*int(np.prod(loc.shape[1:])) for loc in locs])
+                chunk_rows = locs[0].chunks[0] if locs[0].chunks else 1
+                block_rows = max(1,self._memory_limit//row_bytes)
+                if block_rows >= chunk_rows: block_rows = block_rows//chunk_rows*chunk_rows             # align to chunks
+            return [slice(r,min(r+block_rows,N_rows)) for r in range(0,max(N_rows,1),block_rows)]
+
+        def read_pointwise(group: str,
+                           rows: slice) -> Optional[Dict[str, Any]]:
             try:
                 datasets_in = {}
-                with h5py.File(self.fname,'r') as f:
-                    for arg,label in datasets.items():
+                with self._open('r') as f:
+                    for label in sources[group]:
                         loc  = f[group+'/'+label]
-                        datasets_in[arg]={'data' :loc[()],
-                                          'label':label,
-                                          'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
-                                                   for k,v in loc.attrs.items()}}
-                return callback(**datasets_in,**args)
+                        with _stage('read'):
+                            datasets_in[label]={'data' :loc[rows],
+                                                'label':label,
+                                                'meta': _meta(loc)}
+                        _account(loc,read=datasets_in[label]['data'].nbytes)
+                return datasets_in
             except Exception as err:
                 print(f'Error during calculation: {err}.')
                 return None
 
-        groups = []
-        with h5py.File(self.fname,'r') as f:
-            for inc in self._visible['increments']:
-                for ty in ['phase','homogenization']:
-                    for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            group = '/'.join([inc,ty,label,field])
-                            if set(datasets.values()).issubset(f[group].keys()): groups.append(group)
+        def evaluate_pointwise(jobs: List[Tuple[str, slice, int]]):
+            if self._processes == 1 or 'fork' not in mp.get_all_start_methods():
+                for group,rows,N_rows in jobs:
+                    yield (group,rows,N_rows),{} if all((group,i) in failed for i in range(len(steps))) else \
+                                              _job_pointwise(steps,read_pointwise(group,rows),skip[group])
+                return
 
-        if len(groups) == 0:
-            print('No matching dataset found, no data was added.')
-            return
+            with self._open('a'): pass                                                              # check write access before forking
+            _forked_job.update(steps=steps)                                                         # forked workers inherit the callbacks
+            try:
+                with ProcessPoolExecutor(self._processes,mp_context=mp.get_context('fork')) as pool:
+                    pending: deque = deque()
+                    for job in jobs:
+                        pending.append((job,pool.submit(_forked_job_pointwise,read_pointwise(*job[:2]),skip[job[0]])))
+                        if len(pending) >= 2*self._processes:                                       # limit data in flight
+                            job_,future = pending.popleft()
+                            yield job_,future.result()
+                    while pending:
+                        job_,future = pending.popleft()
+                        yield job_,future.result()
+            finally:
+                _forked_job.clear()
+
+        with self.session():
+            sources: Dict[str, List[str]] = {}
+            skip: Dict[str, Set[int]] = {}
+            with self._open('r') as f:
+                for inc in self._visible['increments']:
+                    for ty in ['phase','homogenization']:
+                        for label in self._visible[ty+'s']:
+                            for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                                group = '/'.join([inc,ty,label,field])
+                                existing = self._keys(f,group)
+                                if any(set(datasets.values()).issubset(existing) for _,datasets,_ in steps):
+                                    sources[group] = sorted(labels.intersection(existing))
+                                    skip[group] = up_to_date(f,group)
+
+            if len(sources) == 0:
+                print('No matching dataset found, no data was added.')
+                return
+
+            jobs = []
+            for group in sources:
+                if len(skip[group]) == len(steps): continue
+                blocks = partition(group)
+                jobs += [(group,rows,blocks[-1].stop) for rows in blocks]
+
+            failed: Set[Tuple[str, int]] = set()
+            created: Dict[Tuple[str, int], str] = {}
+            paths: Dict[Tuple[str, int], str] = {}
+            try:
+                for (group,rows,N_rows),results in util.show_progress(evaluate_pointwise(jobs),len(jobs)):
+                    for i in range(len(steps)):
+                        if (group,i) in failed or i in skip[group]:
+                            continue
+                        if i not in results:
+                            failed.add((group,i))
+                            if (group,i) in created:                                                # discard partially written data
+                                with self._open('a') as f:
+                                    del f[created.pop((group,i))]
+                                self._session.keys.pop(group,None)
+                            continue
+                        result = results[i]
+                        with _stage('write'), self._open('a') as f:
+                            _account('/'+'/'.join([group,result['label']]),written=result['data'].nbytes)
+                            try:
+                                fingerprint = result['meta']['fingerprint']
+                                if rows.start > 0:
+                                    dataset = f[paths[(group,i)]]
+                                    dataset[rows] = result['data']
+                                else:
+                                    paths[(group,i)] = '/'.join([group,result['label']])
+                                    if overwritten := paths[(group,i)] in f:                        # replace stale or unprotected data
+                                        existing = _meta(f[paths[(group,i)]]).get('fingerprint','')
+                                        stale = existing.split('-')[0] == fingerprint.split('-')[0]
+                                        if overwritten := stale or not self._protected:
+                                            del f[paths[(group,i)]]
+                                    dataset = _create_dataset(f[group],result['label'],
+                                                              (N_rows,)+result['data'].shape[1:],result['data'].dtype,
+                                                              self._storage)
+                                    created[(group,i)] = paths[(group,i)]
+                                    self._session.keys.pop(group,None)
+                                    dataset[rows] = result['data']
+
+                                    dataset.attrs['created'] = util.time_stamp() if h5py3 else \
+                                                               util.time_stamp().encode()
+                                    if overwritten: dataset.attrs['overwritten'] = True
+
+                                    for l,v in result['meta'].items():
+                                        if l == 'fingerprint': continue
+                                        dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
+                                    creator = dataset.attrs['creator'] if h5py3 else \
+                                              dataset.attrs['creator'].decode()
+                                    dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
+                                                               f'damask.Result.{creator} v{damask.version}'.encode()
+
+                                if rows.stop == N_rows:                                             # mark complete data only
+                                    dataset.attrs['fingerprint'] = fingerprint if h5py3 else fingerprint.encode()
+                                    created.pop((group,i),None)
+
+                            except Exception as err:
+                                print(f'Could not add dataset: {err}.')
+                                failed.add((group,i))
+                                if (group,i) in created:
+                                    del f[created.pop((group,i))]
+                                    self._session.keys.pop(group,None)
+            finally:
+                if created:                                                                         # discard partially written data
+                    with self._open('a') as f:
+                        for path in created.values():
+                            if path in f: del f[path]
+                    self._session.keys.clear()
+
+
+    def _region(self,
+                roi: Union[IntSequence, FloatSequence]) -> Tuple[np.ndarray, np.ndarray, Tuple]:
+        """
+        Cells and nodes in a region of interest and mappings restricted to it.
 
+        Parameters
+        ----------
+        roi : numpy.ndarray, shape (2,3)
+            Lower and upper bound of the region of interest.
+            Integer values are interpreted as cell indices (upper bound exclusive),
+            floating point values as physical coordinates.
 
-        for group in util.show_progress(groups):
-            if not (result := job_pointwise(group, callback=func, datasets=datasets, args=args)):   # type: ignore
-                continue
-            with h5py.File(self.fname, 'a') as f:
-                try:
-                    if not self._protected and '/'.join([group,result['label']]) in f:
-                        dataset = f['/'.join([group,result['label']])]
-                        dataset[...] = result['data']
-                        dataset.attrs['overwritten'] = True
-                    else:
-                        shape = result['data'].shape
-                        if compress := result['data'].size >= chunk_size*2:
-                            chunks = (chunk_size//np.prod(shape[1:]),)+shape[1:]
-                        else:
-                            chunks = shape
-                        dataset = f[group].create_dataset(result['label'],data=result['data'],
-                                                          maxshape=shape, chunks=chunks,
-                                                          compression = 'gzip' if compress else None,
-                                                          compression_opts = 6 if compress else None,
-                                                          shuffle=True,fletcher32=True)
-
-                    dataset.attrs['created'] = util.time_stamp() if h5py3 else \
-                                               util.time_stamp().encode()
-
-                    for l,v in result['meta'].items():
-                        dataset.attrs[l.lower()]=v.encode() if not h5py3 and type(v) is str else v
-                    creator = dataset.attrs['creator'] if h5py3 else \
-                              dataset.attrs['creator'].decode()
-                    dataset.attrs['creator'] = f'damask.Result.{creator} v{damask.version}' if h5py3 else \
-                                               f'damask.Result.{creator} v{damask.version}'.encode()
-
-                except (OSError,RuntimeError) as err:
-                    print(f'Could not add dataset: {err}.')
-
-
-    def _mappings(self):
-        """Mappings to place data spatially."""
-        with h5py.File(self.fname,'r') as f:
-
-            at_cell_ph = []
-            in_data_ph = []
-            for c in range(self.N_constituents):
-                at_cell_ph.append({label: np.where(self.phase[:,c] == label)[0] \
-                                          for label in self._visible['phases']})
-                in_data_ph.append({label: f['/'.join(['cell_to','phase'])]['entry'][at_cell_ph[c][label]][:,c] \
-                                          for label in self._visible['phases']})
-
-            at_cell_ho = {label: np.where(self.homogenization[:] == label)[0] \
-                                 for label in self._visible['homogenizations']}
-            in_data_ho = {label: f['/'.join(['cell_to','homogenization'])]['entry'][at_cell_ho[label]] \
-                                 for label in self._visible['homogenizations']}
+        Returns
+        -------
+        rows_cell : numpy.ndarray
+            Indices of the cells in the region of interest.
+        rows_node : numpy.ndarray
+            Indices of the nodes in the region of interest.
+        mappings : tuple
+            Mappings to place data in the region of interest.
+
+        """
+        if not self.structured:
+            raise NotImplementedError('not a structured grid')
+
+        roi_ = np.array(roi)
+        if roi_.shape != (2,3):
+            raise ValueError(f'invalid region of interest "{roi}"')
+
+        if np.issubdtype(roi_.dtype,np.integer):
+            lower,upper = roi_
+        else:
+            lower = np.floor((roi_[0]-self.origin)/self.size*self.cells+1e-9).astype(int)
+            upper = np.ceil ((roi_[1]-self.origin)/self.size*self.cells-1e-9).astype(int)
+        lower,upper = np.clip(lower,0,self.cells),np.clip(upper,0,self.cells)
+        if np.any(upper <= lower):
+            raise ValueError(f'empty region of interest "{roi}"')
+
+        rows_cell = _box(lower,upper,self.cells)
+        rows_node = _box(lower,upper+1,self.cells+1)
+
+        return rows_cell,rows_node,self._mappings_at(rows_cell)
+
+
+    def _mappings_at(self,
+                     rows: np.ndarray) -> Tuple:
+        """Mappings to place data at the given cells."""
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        for c in range(self.N_constituents):
+            for label in at_cell_ph[c]:
+                at_cell_ph[c][label],in_data_ph[c][label] = _crop(at_cell_ph[c][label],in_data_ph[c][label],rows)
+        for label in at_cell_ho:
+            at_cell_ho[label],in_data_ho[label] = _crop(at_cell_ho[label],in_data_ho[label],rows)
+
+        return at_cell_ph,in_data_ph,at_cell_ho,in_data_ho
+
+
+    def _labels(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Phase and homogenization labels of the material points."""
+        if self._session.labels is None and self._session.index is not None:
+            with h5py.File(self._session.index,'r') as f:
+                self._session.labels = tuple(np.char.decode(f[ty+'s'][()],'utf-8')[f[ty][()]]       # type: ignore
+                                             for ty in ['phase','homogenization'])
+        if self._session.labels is None:
+            with self._open('r') as f:
+                self._session.labels = tuple(np.char.decode(f['cell_to'][ty]['label'],'utf-8')      # type: ignore
+                                             for ty in ['phase','homogenization'])
+        return self._session.labels                                                                 # type: ignore
+
+    @property
+    def phase(self) -> np.ndarray:
+        """Phase labels of the constituents of each material point."""
+        return self._labels()[0]
+
+    @property
+    def homogenization(self) -> np.ndarray:
+        """Homogenization label of each material point."""
+        return self._labels()[1]
+
+
+    def _mappings(self,
+                  visible: bool = True):
+        """Mappings to place data spatially (of all labels if not visible)."""
+        def group_by(labels: np.ndarray,
+                     entries: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+            names,codes = np.unique(labels,return_inverse=True)
+            order = np.argsort(codes.ravel(),kind='stable')                                         # ascending cells per label
+            at_cell = dict(zip(map(str,names),np.split(order,np.cumsum(np.bincount(codes.ravel()))[:-1])))
+            return at_cell,{label: entries[cells] for label,cells in at_cell.items()}
+
+        if self._session.mappings is None and self._session.index is not None:
+            with h5py.File(self._session.index,'r') as f:
+                g = f['mappings']
+                self._session.mappings = ([tuple({label:g[f'phase/{c}/{label}/{m}'][()]
+                                                  for label in g.get(f'phase/{c}',{})} for m in ['at_cell','in_data'])
+                                           for c in range(self.N_constituents)],
+                                          tuple({label:g[f'homogenization/{label}/{m}'][()]
+                                                 for label in g.get('homogenization',{})} for m in ['at_cell','in_data']))
+        if self._session.mappings is None:
+            phase,homogenization = self._labels()
+            with self._open('r') as f:
+                entry_ph = f['/'.join(['cell_to','phase'])]['entry']
+                entry_ho = f['/'.join(['cell_to','homogenization'])]['entry']
+            self._session.mappings = ([group_by(phase[:,c],entry_ph[:,c]) for c in range(self.N_constituents)],
+                                      group_by(homogenization,entry_ho))
+
+        mappings_ph,mappings_ho = self._session.mappings
+        if not visible: return mappings_ph,mappings_ho
+        empty = np.zeros(0,np.int64)
+
+        at_cell_ph = [{label: m[0].get(label,empty) for label in self._visible['phases']} for m in mappings_ph]
+        in_data_ph = [{label: m[1].get(label,empty) for label in self._visible['phases']} for m in mappings_ph]
+        at_cell_ho = {label: mappings_ho[0].get(label,empty) for label in self._visible['homogenizations']}
+        in_data_ho = {label: mappings_ho[1].get(label,empty) for label in self._visible['homogenizations']}
 
         return at_cell_ph,in_data_ph,at_cell_ho,in_data_ho
 
 
+    @_profiled('get')
     def get(self,
             output: Union[str, List[str]] = '*',
             flatten: bool = True,
-            prune: bool = True) -> Union[None,Dict[str,Any]]:
+            prune: bool = True,
+            lazy: bool = False,
+            dtype: Optional[DTypeLike] = None) -> Union[None,Dict[str,Any]]:
         """
         Collect data per phase/homogenization reflecting the group/folder structure in the DADF5 file.
 
@@ -1629,29 +2817,49 @@ class Result:
             phase/homogenization, or field. Defaults to True.
         prune : bool, optional
             Remove branches with no data. Defaults to True.
+        lazy : bool, optional
+            Return placeholders that read the data on demand, i.e. when
+            they are indexed or converted with numpy.asarray.
+            Defaults to False.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            The data is cast by HDF5 while reading.
+            Defaults to None, in which case the stored data type is kept.
 
         Returns
         -------
         data : dict of numpy.ndarray
             Datasets structured by phase/homogenization and according to selected view.
 
+        Examples
+        --------
+        Read the deformation gradient of the first ten cells of phase 'Aluminum'
+        in the last increment:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5').view(increments=-1,phases='Aluminum')
+        >>> F = r.get('F',lazy=True)[:10]
+
         """
         r: Dict[str,Any] = {}
 
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f:
             for inc in util.show_progress(self._visible['increments']):
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
-                for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = _read(f['/'.join([inc,'geometry',out])])
+                for out in _match(output,self._keys(f,'/'.join([inc,'geometry']))):
+                    dataset = f['/'.join([inc,'geometry',out])]
+                    r[inc]['geometry'][out] = _LazyData(self,dataset,dtype=dtype) if lazy else _read(dataset,dtype)
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
                         r[inc][ty][label] = {}
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             r[inc][ty][label][field] = {}
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                r[inc][ty][label][field][out] = _read(f['/'.join([inc,ty,label,field,out])])
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                dataset = f['/'.join([inc,ty,label,field,out])]
+                                r[inc][ty][label][field][out] = _LazyData(self,dataset,dtype=dtype) if lazy else \
+                                                                _read(dataset,dtype)
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1659,13 +2867,17 @@ class Result:
         return None if (type(r) == dict and r == {}) else r
 
 
+    @_profiled('place')
     def place(self,
               output: Union[str, List[str]] = '*',
               flatten: bool = True,
               prune: bool = True,
               constituents: Optional[IntSequence] = None,
               fill_float: float = np.nan,
-              fill_int: int = 0) -> Optional[Dict[str,Any]]:
+              fill_int: int = 0,
+              lazy: bool = False,
+              roi: Union[None, IntSequence, FloatSequence] = None,
+              dtype: Optional[DTypeLike] = None) -> Optional[Dict[str,Any]]:
         """
         Merge data into spatial order that is compatible with the damask.VTK geometry representation.
 
@@ -1695,12 +2907,35 @@ class Result:
         fill_int : int, optional
             Fill value for non-existent entries of integer type.
             Defaults to 0.
+        lazy : bool, optional
+            Return placeholders that read and place the data on demand.
+            Indexing returns numpy.ma.MaskedArray, conversion with
+            numpy.asarray returns the filled data.
+            Defaults to False.
+        roi : numpy.ndarray, shape (2,3), optional
+            Lower and upper bound of the region of interest of a
+            structured grid. Integer values are interpreted as cell
+            indices (upper bound exclusive), floating point values
+            as physical coordinates.
+            Defaults to None, in which case all cells are placed.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            The data is cast by HDF5 while reading.
+            Defaults to None, in which case the stored data type is kept.
 
         Returns
         -------
         data : dict of numpy.ma.MaskedArray
             Datasets structured by spatial position and according to selected view.
 
+        Examples
+        --------
+        Place the deformation gradient of the first 10x10x2 cells:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> F = r.view(increments=-1).place('F',roi=[[0,0,0],[10,10,2]])
+
         """
         r: Dict[str,Any] = {}
 
@@ -1710,40 +2945,66 @@ class Result:
         suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
                    [f'#{c}' for c in constituents_]
 
-        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        if roi is None:
+            N_rows = self.N_materialpoints
+            at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        else:
+            rows_cell,rows_node,(at_cell_ph,in_data_ph,at_cell_ho,in_data_ho) = self._region(roi)
+            N_rows = len(rows_cell)
+        lazy_ = lazy or roi is not None
 
-        with h5py.File(self.fname,'r') as f:
+        with self.session(), self._open('r') as f:
 
             for inc in util.show_progress(self._visible['increments']):
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
-                for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = ma.array(_read(f['/'.join([inc,'geometry',out])]),fill_value = fill_float)
+                for out in _match(output,self._keys(f,'/'.join([inc,'geometry']))):
+                    dataset = f['/'.join([inc,'geometry',out])]
+                    if roi is not None:
+                        rows = rows_cell if dataset.shape[0] == self.N_materialpoints else rows_node
+                        r[inc]['geometry'][out] = _LazyData(self,dataset,len(rows),(fill_float,fill_int),dtype)
+                        r[inc]['geometry'][out]._add(dataset.name,np.arange(len(rows)),rows)
+                    else:
+                        r[inc]['geometry'][out] = _LazyData(self,dataset,fill=(fill_float,fill_int),dtype=dtype) if lazy else \
+                                                  ma.array(_read(dataset,dtype),fill_value = fill_float)
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
                             if field not in r[inc][ty].keys():
                                 r[inc][ty][field] = {}
 
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                path = '/'.join([inc,ty,label,field,out])
+                                if lazy_:
+                                    data = f[path]
+                                    empty_like: Callable[[Any], Union[_LazyData, np.ma.MaskedArray]] = \
+                                        lambda d: _LazyData(self,d,N_rows,(fill_float,fill_int),dtype)
+                                else:
+                                    data = ma.array(_read(f[path],dtype))
+                                    empty_like = lambda d: _empty_like(d,N_rows,fill_float,fill_int)
 
                                 if ty == 'phase':
                                     if out+suffixes[0] not in r[inc][ty][field].keys():
                                         for c,suffix in zip(constituents_,suffixes):
-                                            r[inc][ty][field][out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                            r[inc][ty][field][out+suffix] = empty_like(data)
 
                                     for c,suffix in zip(constituents_,suffixes):
-                                        r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+                                        if lazy_:
+                                            r[inc][ty][field][out+suffix]._add(path,at_cell_ph[c][label],in_data_ph[c][label])
+                                        else:
+                                            r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
 
                                 if ty == 'homogenization':
                                     if out not in r[inc][ty][field].keys():
-                                        r[inc][ty][field][out] = \
-                                            _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                        r[inc][ty][field][out] = empty_like(data)
 
-                                    r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
+                                    if lazy_:
+                                        r[inc][ty][field][out]._add(path,at_cell_ho[label],in_data_ho[label])
+                                    else:
+                                        r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
+
+            if lazy_ and not lazy: r = _materialize(r)
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1751,15 +3012,371 @@ class Result:
         return None if (type(r) == dict and r == {}) else r
 
 
+    def time_series(self,
+                    output: Union[str, List[str]],
+                    points: Union[int, IntSequence],
+                    flatten: bool = True,
+                    prune: bool = True,
+                    constituents: Optional[IntSequence] = None,
+                    fill_float: float = np.nan,
+                    fill_int: int = 0) -> Optional[Dict[str,Any]]:
+        """
+        Collect the history of data at selected material points.
+
+        The phase/homogenization entries of the material points are
+        determined once, only the corresponding rows are read from
+        the datasets of the visible increments.
+
+        Parameters
+        ----------
+        output : (list of) str
+            Names of the datasets to read.
+        points : (list of) int
+            Indices of the material points.
+        flatten : bool, optional
+            Remove singular levels of the folder hierarchy.
+            This might be beneficial in case of single field.
+            Defaults to True.
+        prune : bool, optional
+            Remove branches with no data. Defaults to True.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+
+        Returns
+        -------
+        data : dict of numpy.ma.MaskedArray, shape (:,N_points,...)
+            Datasets structured according to selected view.
+            The first axis corresponds to the visible increments,
+            i.e. to `times`. Nodal data is not considered.
+
+        Examples
+        --------
+        Stress-strain history at two material points:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_stress_Cauchy()
+        >>> r.add_strain()
+        >>> h = r.time_series(['sigma','epsilon_V^0.0(F)'],[12,345])
+        >>> t = r.times
+
+        """
+        points_ = np.array(points,dtype=int).reshape(-1)
+        if np.any(points_ < 0) or np.any(points_ >= self.N_materialpoints):
+            raise ValueError(f'invalid material points "{points}"')
+
+        r: Dict[str,Any] = {'phase':{},'homogenization':{},'geometry':{}}
+
+        constituents_ = list(map(int,constituents)) if isinstance(constituents,Iterable) else \
+                      (range(self.N_constituents) if constituents is None else [constituents])      # type: ignore
+
+        suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
+                   [f'#{c}' for c in constituents_]
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings_at(points_)
+        N_increments = len(self._visible['increments'])
+
+        def empty_like(dataset: h5py._hl.dataset.Dataset) -> np.ma.core.MaskedArray:
+            dtype = _dtype(dataset)
+            return ma.array(np.empty((N_increments,len(points_))+dataset.shape[1:],dtype),
+                            fill_value = fill_float if np.issubdtype(dtype,np.floating) else fill_int,
+                            mask = True)
+
+        with self._open('r') as f:
+
+            for i,inc in enumerate(util.show_progress(self._visible['increments'])):
+
+                for out in _match(output,self._keys(f,'/'.join([inc,'geometry']))):
+                    dataset = f['/'.join([inc,'geometry',out])]
+                    if dataset.shape[0] != self.N_materialpoints: continue
+                    if out not in r['geometry']:
+                        r['geometry'][out] = empty_like(dataset)
+                    r['geometry'][out][i] = _read_rows(dataset,points_)
+
+                for ty in ['phase','homogenization']:
+                    for label in self._visible[ty+'s']:
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            if field not in r[ty].keys():
+                                r[ty][field] = {}
+
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                dataset = f['/'.join([inc,ty,label,field,out])]
+
+                                if ty == 'phase':
+                                    if out+suffixes[0] not in r[ty][field].keys():
+                                        for c,suffix in zip(constituents_,suffixes):
+                                            r[ty][field][out+suffix] = empty_like(dataset)
+
+                                    for c,suffix in zip(constituents_,suffixes):
+                                        r[ty][field][out+suffix][i,at_cell_ph[c][label]] = \
+                                            _read_rows(dataset,in_data_ph[c][label])
+
+                                if ty == 'homogenization':
+                                    if out not in r[ty][field].keys():
+                                        r[ty][field][out] = empty_like(dataset)
+
+                                    r[ty][field][out][i,at_cell_ho[label]] = _read_rows(dataset,in_data_ho[label])
+
+        if prune:   r = util.dict_prune(r)
+        if flatten: r = util.dict_flatten(r)
+
+        return None if (type(r) == dict and r == {}) else r
+
+
+    def reduce(self,
+               output: Union[str, List[str]] = '*',
+               ops: Union[str, Sequence[str]] = ('mean','min','max','std'),
+               weights: Optional[str] = None,
+               bins: Union[int, FloatSequence] = 10,
+               flatten: bool = True,
+               prune: bool = True) -> Optional[Dict[str,Any]]:
+        """
+        Calculate statistics of the data of each visible increment.
+
+        The datasets are read block-wise and reduced without placing
+        them spatially, i.e. the memory demand does not scale with
+        the size of the datasets.
+
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to reduce.
+            Defaults to '*', in which case all visible datasets are considered.
+        ops : (sequence of) str, optional
+            Statistics to calculate. Possible values are 'mean', 'min',
+            'max', 'std' (standard deviation), and 'histogram'.
+            Defaults to ('mean','min','max','std').
+        weights : str, optional
+            Name of a scalar phase dataset, e.g. 'v', with the weights
+            of the constituents. Defaults to None, in which case all
+            constituents of a material point are weighted equally.
+        bins : int or sequence of float, optional
+            Number of equal-width bins or bin edges for 'histogram'.
+            Defaults to 10.
+        flatten : bool, optional
+            Remove singular levels of the folder hierarchy.
+            This might be beneficial in case of single field.
+            Defaults to True.
+        prune : bool, optional
+            Remove branches with no data. Defaults to True.
+
+        Returns
+        -------
+        statistics : dict of numpy.ma.MaskedArray, shape (:,...)
+            Statistics structured according to selected view.
+            The first axis corresponds to the visible increments,
+            i.e. to `times`. Increments without data are masked.
+            The weighted histogram of each component has the shape
+            (:,...,bins) and is accompanied by its 'bin_edges'.
+
+        Notes
+        -----
+        All material points are assumed to have the same volume.
+        The data of all phases (homogenizations) is reduced jointly,
+        homogenization data is weighted equally. Geometry data is not
+        considered. If the bin edges of a histogram are not given,
+        they are determined by an additional pass over the data.
+
+        Examples
+        --------
+        Volume-averaged stress-strain curve:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_stress_Cauchy()
+        >>> r.add_strain()
+        >>> s = r.reduce(['sigma','epsilon_V^0.0(F)'],'mean')
+        >>> sigma_avg,epsilon_avg = s['sigma'],s['epsilon_V^0.0(F)']
+
+        """
+        ops_ = [ops] if isinstance(ops,str) else list(ops)
+        if invalid := set(ops_).difference(['mean','min','max','std','histogram']):
+            raise ValueError(f'invalid operation(s) "{sorted(invalid)}"')
+
+        N_increments = len(self._visible['increments'])
+
+        def accumulate(ops: List[str],
+                       edges: Dict[Tuple[str, str, str], np.ndarray]) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+            stats: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+            with self._open('r') as f:
+                for i,inc in enumerate(util.show_progress(self._visible['increments'])):
+                    for ty in ['phase','homogenization']:
+                        for label in self._visible[ty+'s']:
+                            group = '/'.join([inc,ty,label])
+                            if ty == 'phase' and weights is not None:
+                                found = [field for field in self._keys(f,group) if weights in self._keys(f,f'{group}/{field}')]
+                                if not found:
+                                    raise ValueError(f'weights "{weights}" not found for phase "{label}"')
+                                w_dataset = f['/'.join([group,found[0],weights])]
+                            else:
+                                w_dataset = None
+
+                            for field in _match(self._visible['fields'],self._keys(f,group)):
+                                for out in _match(output,self._keys(f,'/'.join([group,field]))):
+                                    dataset = f['/'.join([group,field,out])]
+                                    if (key := (ty,field,out)) not in stats:
+                                        N_components = int(np.prod(dataset.shape[1:],dtype=int))
+                                        stats[key] = {'shape':dataset.shape[1:],'rows':np.zeros(N_increments,int),
+                                                      'W':np.zeros(N_increments),
+                                                      'mean':np.zeros((N_increments,N_components)),
+                                                      'M2':np.zeros((N_increments,N_components)),
+                                                      'min':np.zeros((N_increments,N_components),dataset.dtype),
+                                                      'max':np.zeros((N_increments,N_components),dataset.dtype)}
+                                        if 'histogram' in ops:
+                                            stats[key]['histogram'] = np.zeros((N_increments,N_components,len(edges[key])-1))
+                                    s = stats[key]
+
+                                    for b,e in _blocks(dataset):
+                                        x = dataset[b:e].reshape(e-b,-1)
+                                        w = w_dataset[b:e].reshape(-1) if w_dataset is not None else \
+                                            np.full(e-b,1./self.N_constituents if ty == 'phase' else 1.)
+
+                                        if 'min' in ops or 'max' in ops:
+                                            x_min,x_max = np.min(x,axis=0),np.max(x,axis=0)
+                                            s['min'][i] = x_min if s['rows'][i] == 0 else np.minimum(s['min'][i],x_min)
+                                            s['max'][i] = x_max if s['rows'][i] == 0 else np.maximum(s['max'][i],x_max)
+                                        if ('mean' in ops or 'std' in ops) and (W_b := np.sum(w)) > 0:
+                                            mean_b = w@x/W_b                                        # merge weighted moments (Chan et al.)
+                                            delta = mean_b-s['mean'][i]
+                                            W = s['W'][i]+W_b
+                                            s['M2'][i] += w@(x-mean_b)**2 + delta**2*s['W'][i]*W_b/W
+                                            s['mean'][i] += delta*W_b/W
+                                            s['W'][i] = W
+                                        if 'histogram' in ops:
+                                            for c in range(x.shape[1]):
+                                                s['histogram'][i,c] += np.histogram(x[:,c],edges[key],weights=w)[0]
+                                        s['rows'][i] += e-b
+            return stats
+
+        edges: Dict[Tuple[str, str, str], np.ndarray] = defaultdict(lambda: np.asarray(bins,dtype=float))
+        if 'histogram' in ops_ and isinstance(bins,(int,np.integer)):
+            for key,s in accumulate(['min','max'],{}).items():
+                seen = s['rows'] > 0
+                lo,hi = (float(np.min(s['min'][seen])),float(np.max(s['max'][seen]))) if np.any(seen) else (0.,1.)
+                edges[key] = np.linspace(lo,hi,int(bins)+1) if lo < hi else np.linspace(lo-.5,hi+.5,int(bins)+1)
+
+        r: Dict[str,Any] = {'phase':{},'homogenization':{}}
+        for (ty,field,out),s in accumulate(ops_,edges).items():
+            mask = np.broadcast_to((s['rows'] == 0).reshape((-1,)+(1,)*len(s['shape'])),(N_increments,)+s['shape'])
+            reduced = {'mean': lambda: s['mean'],
+                       'min':  lambda: s['min'],
+                       'max':  lambda: s['max'],
+                       'std':  lambda: np.sqrt(s['M2']/np.where(s['W'] > 0,s['W'],1.)[:,None])}
+            r[ty].setdefault(field,{})[out] = {op: ma.array(reduced[op]().reshape((N_increments,)+s['shape']),mask=mask)
+                                               for op in ops_ if op != 'histogram'}
+            if 'histogram' in ops_:
+                r[ty][field][out]['histogram'] = s['histogram'].reshape((N_increments,)+s['shape']+(-1,))
+                r[ty][field][out]['bin_edges'] = edges[(ty,field,out)]
+
+        if prune:   r = util.dict_prune(r)
+        if flatten: r = util.dict_flatten(r)
+
+        return None if (type(r) == dict and r == {}) else r
+
+
+    def benchmark_storage(self,
+                          output: str,
+                          storages: Optional[Sequence[Dict[str, Any]]] = None,
+                          target_dir: Union[None, str, Path] = None) -> List[Dict[str, Any]]:
+        """
+        Measure the performance of storage policies for added data.
+
+        A sample dataset is written to and read from a temporary file
+        with each storage policy.
+
+        Parameters
+        ----------
+        output : str
+            Name of the sample dataset. The first match in the
+            visible increments, phases, and homogenizations is used.
+        storages : sequence of dict, optional
+            Storage policies to compare, see `view`.
+            Defaults to None, in which case the storage policy
+            of the current view is measured.
+        target_dir : str or pathlib.Path, optional
+            Directory for the temporary files.
+            Defaults to the directory of the DADF5 file.
+
+        Returns
+        -------
+        benchmark : list of dict
+            Complete storage policy ('storage'), write and read throughput
+            in bytes per second ('write','read'), and compression ratio
+            ('ratio') for each storage policy.
+
+        Notes
+        -----
+        The read throughput might be affected by the cache of the file system.
+
+        Examples
+        --------
+        Compare the default storage policy to fast compression without checksum:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.benchmark_storage('F',[{},{'compression':'lzf','fletcher32':False}])
+        [...]
+
+        """
+        sample = None
+        with self._open('r') as f:
+            for inc in self._visible['increments']:
+                for ty in ['phase','homogenization']:
+                    for label in self._visible[ty+'s']:
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                                if sample is None: sample = f['/'.join([inc,ty,label,field,out])][()]
+        if sample is None:
+            raise ValueError(f'dataset "{output}" not found')
+
+        tmp_dir = self.fname.parent if target_dir is None else Path(target_dir)
+        tmp_dir.mkdir(parents=True,exist_ok=True)
+
+        benchmark = []
+        for storage in [{}] if storages is None else storages:
+            storage_ = self.view(storage=storage)._storage
+            fd,tmp = tempfile.mkstemp(suffix='.hdf5',dir=tmp_dir)
+            os.close(fd)
+            try:
+                start = time.perf_counter()
+                with h5py.File(tmp,'w') as f:
+                    dataset = _create_dataset(f,output,sample.shape,sample.dtype,storage_)
+                    dataset[...] = sample
+                    size = dataset.id.get_storage_size()
+                write = time.perf_counter()-start
+                start = time.perf_counter()
+                with h5py.File(tmp,'r') as f:
+                    f[output][()]
+                read = time.perf_counter()-start
+            finally:
+                os.remove(tmp)
+            benchmark.append({'storage':storage_,
+                              'write':  sample.nbytes/write,
+                              'read':   sample.nbytes/read,
+                              'ratio':  sample.nbytes/max(1,size)})
+
+        return benchmark
+
+
+    @_profiled('export_XDMF')
     def export_XDMF(self,
                     output: Union[str, List[str]] = '*',
                     target_dir: Union[None, str, Path] = None,
-                    absolute_path: bool = False):
+                    absolute_path: bool = False,
+                    constituents: Optional[IntSequence] = None,
+                    fill_float: float = np.nan,
+                    fill_int: int = 0):
         """
         Write XDMF file to directly visualize data from DADF5 file.
 
-        The XDMF format is only supported for structured grids
-        with single phase and single constituent.
+        The XDMF format is only supported for structured grids.
         For other cases use `export_VTK`.
 
         Parameters
@@ -1773,15 +3390,29 @@ class Result:
             Store absolute (instead of relative) path to DADF5 file.
             Defaults to False, i.e. the XDMF file expects the
             DADF5 file at a stable relative path.
+        constituents : (list of) int, optional
+            Constituents to consider in case of multiple phases or constituents.
+            Defaults to None, in which case all constituents are considered.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type
+            in case of multiple phases or constituents.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type
+            in case of multiple phases or constituents.
+            Defaults to 0.
 
         Notes
         -----
-        This function is implemented only for structured grids with
-        one constituent and a single phase.
+        For results with multiple phases or constituents, the data
+        is fused into spatial order by HDF5 virtual datasets in a
+        sidecar file ('*_XDMF.hdf5') next to the XDMF file.
+        They reference the DADF5 file without duplicating its data.
 
         """
-        if self.N_constituents != 1 or len(self.phases) != 1 or not self.structured:
-            raise NotImplementedError('not a structured grid with one constituent and a single phase')
+        if not self.structured:
+            raise NotImplementedError('not a structured grid')
+        fused = self.N_constituents != 1 or len(self.phases) != 1
 
         attribute_type_map = defaultdict(lambda:'Matrix', ( ((),'Scalar'), ((3,),'Vector'), ((3,3),'Tensor')) )
 
@@ -1819,8 +3450,11 @@ class Result:
         hdf5_dir  = self.fname.parent
         out_dir   = Path.cwd() if target_dir is None else Path(target_dir)
         hdf5_link = (hdf5_dir if absolute_path else Path(os.path.relpath(hdf5_dir,out_dir.resolve())))/hdf5_name
+        vds_name  = f'{self.fname.stem}_XDMF.hdf5'
 
-        with h5py.File(self.fname,'r') as f:
+        out_dir.mkdir(parents=True,exist_ok=True)
+        with self._open('r') as f, \
+             (h5py.File(out_dir/vds_name,'w') if fused else contextlib.nullcontext()) as f_vds:
             for inc in self._visible['increments']:
 
                 grid = ET.SubElement(collection,'Grid')
@@ -1855,10 +3489,10 @@ class Result:
                                          'Precision':  '8',
                                          'Dimensions': '{} {} {} 3'.format(*(self.cells[::-1]+1))}
                 data_items[-1].text = f'{hdf5_link}:/{inc}/geometry/u_n'
-                for ty in ['phase','homogenization']:
+                for ty in ['phase','homogenization'] if not fused else []:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                            for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
                                 name = '/'.join([inc,ty,label,field,out])
                                 shape = f[name].shape[1:]
                                 dtype = f[name].dtype
@@ -1878,11 +3512,112 @@ class Result:
                                                                                                         np.prod(shape))}
                                 data_items[-1].text = f'{hdf5_link}:{name}'
 
-        out_dir.mkdir(parents=True,exist_ok=True)
+                for name,(shape,dtype,unit) in \
+                    self._virtual_fused(f,f_vds,inc,output,constituents,fill_float,fill_int,hdf5_link).items():
+
+                    attributes.append(ET.SubElement(grid, 'Attribute'))
+                    attributes[-1].attrib = {'Name':          '/'.join(name.split('/')[1:])+f' / {unit}',
+                                             'Center':       'Cell',
+                                             'AttributeType': attribute_type_map[shape]}
+                    data_items.append(ET.SubElement(attributes[-1], 'DataItem'))
+                    data_items[-1].attrib = {'Format':     'HDF',
+                                             'NumberType': number_type_map(dtype),
+                                             'Precision':  f'{dtype.itemsize}',
+                                             'Dimensions': '{} {} {} {}'.format(*self.cells[::-1],1 if shape == () else
+                                                                                            np.prod(shape))}
+                    data_items[-1].text = f'{vds_name}:{name}'
+
         with util.open_text((out_dir/hdf5_name).with_suffix('.xdmf'),'w') as f:
             f.write(xml.dom.minidom.parseString(ET.tostring(xdmf).decode()).toprettyxml())
 
 
+    def _virtual_fused(self,
+                       f: h5py.File,
+                       f_vds: Optional[h5py.File],
+                       inc: str,
+                       output: Union[str, List[str]],
+                       constituents: Optional[IntSequence],
+                       fill_float: float,
+                       fill_int: int,
+                       link: Path) -> Dict[str, Tuple[Tuple[int, ...], np.dtype, str]]:
+        """
+        Create virtual datasets that fuse multi-phase data of an increment into spatial order.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Open DADF5 file.
+        f_vds : h5py.File or None
+            File to store the virtual datasets. None, if no data needs to be fused.
+        inc : str
+            Increment.
+        output : (list of) str
+            Names of the datasets to fuse.
+        constituents : (list of) int or None
+            Constituents to consider.
+        fill_float : float
+            Fill value for non-existent entries of floating point type.
+        fill_int : int
+            Fill value for non-existent entries of integer type.
+        link : pathlib.Path
+            Path to the DADF5 file relative to f_vds (or absolute).
+
+        Returns
+        -------
+        virtual : dict
+            Shape, data type, and unit of the created virtual datasets.
+
+        Notes
+        -----
+        Each run of cells with constant stride that is mapped to
+        entries with constant stride is represented by one hyperslab.
+
+        """
+        if f_vds is None: return {}
+
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+
+        constituents_ = list(constituents) if isinstance(constituents,Iterable) else \
+                        (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
+
+        suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
+                   [f'#{c}' for c in constituents_]
+
+        sources: Dict[str, List[Tuple[h5py.Dataset, np.ndarray, np.ndarray]]] = defaultdict(list)
+        for ty in ['phase','homogenization']:
+            for label in self._visible[ty+'s']:
+                for field in _match(self._visible['fields'],self._keys(f,'/'.join([inc,ty,label]))):
+                    for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                        dataset = f['/'.join([inc,ty,label,field,out])]
+                        if ty == 'phase':
+                            for c,suffix in zip(constituents_,suffixes):
+                                sources['/'.join([inc,ty,field,out+suffix])].append(
+                                    (dataset,at_cell_ph[c][label],in_data_ph[c][label]))
+                        else:
+                            sources['/'.join([inc,ty,field,out])].append(
+                                (dataset,at_cell_ho[label],in_data_ho[label]))
+
+        virtual = {}
+        for name,mapped in sources.items():
+            shape,dtype = mapped[0][0].shape[1:],mapped[0][0].dtype
+            layout = h5py.VirtualLayout(shape=(self.N_materialpoints,)+shape,dtype=dtype)
+            for dataset,at_cell,in_data in mapped:
+                v_space,s_space = h5s.create_simple(layout.shape),h5s.create_simple(dataset.shape)      # low-level selections avoid copies
+                for b,e in _strided_runs(at_cell,in_data):
+                    step_cell,step_data = (int(at_cell[b+1]-at_cell[b]),int(in_data[b+1]-in_data[b])) if e > b else (1,1)
+                    v_space.select_hyperslab((int(at_cell[b]),)+(0,)*len(shape),(e-b+1,)+shape,
+                                             (step_cell,)+(1,)*len(shape))
+                    s_space.select_hyperslab((int(in_data[b]),)+(0,)*len(shape),(e-b+1,)+shape,
+                                             (step_data,)+(1,)*len(shape))
+                    layout.dcpl.set_virtual(v_space,str(link).encode(),dataset.name.encode(),s_space)
+            f_vds.create_virtual_dataset(name,layout,
+                                         fillvalue=fill_float if np.issubdtype(dtype,np.floating) else fill_int)
+            virtual[name] = (shape,dtype,mapped[0][0].attrs['unit'] if h5py3 else mapped[0][0].attrs['unit'].decode())
+
+        return virtual
+
+
+    @_profiled('export_VTK')
     def export_VTK(self,
                    output: Union[str,List[str]] = '*',
                    mode: str = 'cell',
@@ -1890,7 +3625,9 @@ class Result:
                    target_dir: Union[None, str, Path] = None,
                    fill_float: float = np.nan,
                    fill_int: int = 0,
-                   parallel: bool = True):
+                   parallel: Union[bool, int] = True,
+                   roi: Union[None, IntSequence, FloatSequence] = None,
+                   dtype: Optional[DTypeLike] = None):
         """
         Export to VTK cell/point data.
 
@@ -1919,74 +3656,328 @@ class Result:
         fill_int : int, optional
             Fill value for non-existent entries of integer type.
             Defaults to 0.
-        parallel : bool, optional
-            Write VTK files in parallel in a separate background process.
-            Defaults to True.
+        parallel : bool or int, optional
+            Write VTK files in parallel in separate background processes.
+            An integer limits the number of concurrent writes, see
+            `damask.VTK.save`. The export returns once all files are
+            written. Defaults to True.
+        roi : numpy.ndarray, shape (2,3), optional
+            Lower and upper bound of the region of interest of a
+            structured grid. Integer values are interpreted as cell
+            indices (upper bound exclusive), floating point values
+            as physical coordinates. Only the data in the region of
+            interest is read and exported as cropped ImageData.
+            Defaults to None, in which case all cells are exported.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            The data is cast by HDF5 while reading.
+            Defaults to None, in which case the stored data type is kept.
+
+        Notes
+        -----
+        If more than one process is requested (see `view`), the
+        increments are exported concurrently by a pool of forked
+        processes. Each process reads, places, converts, and writes
+        one increment at a time.
 
         """
-        if mode.lower()=='cell':
-            v = self.geometry0
-        elif mode.lower()=='point':
-            v = VTK.from_poly_data(self.coordinates0_point)
-        else:
+        if mode.lower() not in ['cell','point']:
             raise ValueError(f'invalid mode "{mode}"')
 
+        if roi is None:
+            N_rows = self.N_materialpoints
+            at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+            v = self.geometry0 if mode.lower()=='cell' else VTK.from_poly_data(self.coordinates0_point)
+        else:
+            rows_cell,rows_node,(at_cell_ph,in_data_ph,at_cell_ho,in_data_ho) = self._region(roi)
+            N_rows = len(rows_cell)
+            lower = np.unravel_index(rows_cell[0],self.cells,order='F')
+            upper = np.unravel_index(rows_cell[-1],self.cells,order='F')
+            v = VTK.from_image_data(np.array(upper)-lower+1,
+                                    self.size/self.cells*(np.array(upper)-lower+1),
+                                    self.origin+self.size/self.cells*lower) if mode.lower()=='cell' else \
+                VTK.from_poly_data(self.coordinates0_point[rows_cell])
+
         v.comments = [util.execution_stamp('Result','export_VTK')]
 
         N_digits = int(np.floor(np.log10(max(1,self._incs[-1]))))+1
 
+        out_dir = Path.cwd() if target_dir is None else Path(target_dir)
+        out_dir.mkdir(parents=True,exist_ok=True)
+
+        with self._open('r') as f:
+            creator = f.attrs['creator'] if h5py3 else f.attrs['creator'].decode()
+            created = f.attrs['created'] if h5py3 else f.attrs['created'].decode()
+            v.comments += [f'{creator} ({created})']
+
+        def export(inc: str,
+                   parallel: Union[bool, int]):
+            with self._open('r') as f:
+                u = f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])]
+                u_ = _read(u,dtype) if roi is None else \
+                     _read_rows(u,rows_node if mode.lower() == 'cell' else rows_cell,dtype)
+                with _stage('convert'):
+                    v.set('u',u_,inplace=True)
+
+                for label,data in self._fused(f,inc,output,constituents,fill_float,fill_int,
+                                              (at_cell_ph,in_data_ph,at_cell_ho,in_data_ho),N_rows,
+                                              roi is not None,dtype):
+                    with _stage('convert'):
+                        v.set(label,data,inplace=True)
+
+            with _stage('write'):
+                saved = v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
+                               parallel=parallel)
+            if _profile is not None and saved.done() and saved.exception() is None:
+                _account(str(saved.result()),written=saved.result().stat().st_size)
+
+        if self._processes == 1 or 'fork' not in mp.get_all_start_methods():
+            with self.session():
+                for inc in util.show_progress(self._visible['increments']):
+                    export(inc,parallel)
+            if parallel: VTK.wait()
+            return
+
+        self._session.flush()                                                                       # forked workers open the file themselves
+        _forked_job.update(export=export)                                                           # forked workers inherit the closure
+        try:
+            with ProcessPoolExecutor(self._processes,mp_context=mp.get_context('fork'),
+                                     initializer=self._session.detach) as pool:
+                for _ in util.show_progress(pool.map(_forked_job_export,self._visible['increments']),
+                                            len(self._visible['increments'])):
+                    pass
+        finally:
+            _forked_job.clear()
+
+
+    def _fused(self,
+               f: h5py.File,
+               inc: str,
+               output: Union[str, List[str]],
+               constituents: Optional[IntSequence],
+               fill_float: float,
+               fill_int: int,
+               mappings: Tuple,
+               N_rows: int,
+               subset: bool,
+               dtype: Optional[DTypeLike] = None) -> Iterator[Tuple[str, np.ma.core.MaskedArray]]:
+        """
+        Multi-phase data of an increment fused into spatial order.
+
+        Parameters
+        ----------
+        f : h5py.File
+            Open DADF5 file.
+        inc : str
+            Increment.
+        output : (list of) str
+            Names of the datasets to place.
+        constituents : (list of) int or None
+            Constituents to consider.
+        fill_float : float
+            Fill value for non-existent entries of floating point type.
+        fill_int : int
+            Fill value for non-existent entries of integer type.
+        mappings : tuple
+            Mappings to place the data.
+        N_rows : int
+            Number of rows of the placed data.
+        subset : bool
+            Read only the mapped rows instead of complete datasets.
+        dtype : numpy.dtype, optional
+            Data type of floating point data.
+
+        Yields
+        ------
+        label : str
+            Export label ('type/field/name / unit').
+        data : numpy.ma.MaskedArray
+            Placed data.
+
+        """
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = mappings
+
         constituents_ = constituents if isinstance(constituents,Iterable) else \
                         (range(self.N_constituents) if constituents is None else [constituents])    # type: ignore
 
         suffixes = [''] if self.N_constituents == 1 or isinstance(constituents,int) else \
                    [f'#{c}' for c in constituents_]
 
-        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
+        for ty in ['phase','homogenization']:
+            for field in self._visible['fields']:
+                outs: Dict[str, np.ma.core.MaskedArray] = {}
+                for label in self._visible[ty+'s']:
+                    if field not in self._keys(f,'/'.join([inc,ty,label])): continue
 
-        out_dir = Path.cwd() if target_dir is None else Path(target_dir)
-        out_dir.mkdir(parents=True,exist_ok=True)
+                    for out in _match(output,self._keys(f,'/'.join([inc,ty,label,field]))):
+                        dataset = f['/'.join([inc,ty,label,field,out])]
+                        with _stage('place'):
+                            data = _LazyData(self,dataset,dtype=dtype) if subset else ma.array(_read(dataset,dtype))
 
-        with h5py.File(self.fname,'r') as f:
-            creator = f.attrs['creator'] if h5py3 else f.attrs['creator'].decode()
-            created = f.attrs['created'] if h5py3 else f.attrs['created'].decode()
-            v.comments += [f'{creator} ({created})']
+                            if ty == 'phase':
+                                if out+suffixes[0] not in outs.keys():
+                                    for c,suffix in zip(constituents_,suffixes):
+                                        outs[out+suffix] = _empty_like(data,N_rows,fill_float,fill_int)
 
-            for inc in util.show_progress(self._visible['increments']):
+                                for c,suffix in zip(constituents_,suffixes):
+                                    outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
 
-                u = _read(f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])])
-                v = v.set('u',u)
+                            if ty == 'homogenization':
+                                if out not in outs.keys():
+                                    outs[out] = _empty_like(data,N_rows,fill_float,fill_int)
 
-                for ty in ['phase','homogenization']:
-                    for field in self._visible['fields']:
-                        outs: Dict[str, np.ma.core.MaskedArray] = {}
-                        for label in self._visible[ty+'s']:
-                            if field not in f['/'.join([inc,ty,label])].keys(): continue
+                                outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
 
-                            for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                for label,dataset in outs.items():
+                    yield ' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset
 
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in outs.keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            outs[out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
 
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+    @_profiled('export_VTKHDF')
+    def export_VTKHDF(self,
+                      output: Union[str,List[str]] = '*',
+                      mode: str = 'cell',
+                      constituents: Optional[IntSequence] = None,
+                      target_dir: Union[None, str, Path] = None,
+                      fill_float: float = np.nan,
+                      fill_int: int = 0,
+                      dtype: Optional[DTypeLike] = None):
+        """
+        Export to a single VTKHDF file with one time step per increment.
 
-                                if ty == 'homogenization':
-                                    if out not in outs.keys():
-                                        outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+        In contrast to `export_VTK`, the geometry is written only once
+        and shared by all time steps. Only the data arrays are stored
+        per visible increment. For point data, the VTKHDF type is
+        UnstructuredGrid with vertex cells. For cell data, the type is
+        either ImageData or UnstructuredGrid for grid-based or
+        mesh-based simulations, respectively.
 
-                                    outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to export to the VTKHDF file.
+            Defaults to '*', in which case all visible datasets are exported.
+        mode : {'cell', 'point'}, optional
+            Export in cell format or point format.
+            Defaults to 'cell'.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        target_dir : str or pathlib.Path, optional
+            Directory to save VTKHDF file. Will be created if non-existent.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            The data is cast by HDF5 while reading.
+            Defaults to None, in which case the stored data type is kept.
 
-                        for label,dataset in outs.items():
-                            v = v.set(' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset)
+        Notes
+        -----
+        The VTKHDF format with time steps requires VTK 9.3 or ParaView 5.12.
+        HDF5 does not allow '/' in names, it is replaced by '∕' (division slash)
+        in the labels of the data arrays.
+        The data arrays are stored according to the storage policy of
+        the view (see `view`).
 
+        """
+        if mode.lower()=='cell':
+            v = self.geometry0
+        elif mode.lower()=='point':
+            v = VTK.from_poly_data(self.coordinates0_point)
+        else:
+            raise ValueError(f'invalid mode "{mode}"')
 
-                v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
-                       parallel=parallel)
+        out_dir = Path.cwd() if target_dir is None else Path(target_dir)
+        out_dir.mkdir(parents=True,exist_ok=True)
 
+        image = self.structured and mode.lower() == 'cell'
+        N_steps = len(self._visible['increments'])
+        N_cells,N_points = v.N_cells,v.N_points
+        mappings = self._mappings()
+
+        N_rows: Dict[h5py.Dataset, int] = {}                                                        # rows per time step
+        def add(label: str,
+                data: np.ndarray,
+                step: int):
+            if mode.lower() == 'cell' and len(data) == N_cells:
+                add_array(cell_data,cell_offsets,label,data,step)
+            elif len(data) == N_points:
+                add_array(point_data,point_offsets,label,data,step)
+
+        def add_array(group: h5py.Group,
+                      offsets: h5py.Group,
+                      label: str,
+                      data: np.ndarray,
+                      step: int):
+            data_ = data.filled() if isinstance(data,np.ma.MaskedArray) else data
+            data_ = data_.reshape(len(data_),-1).astype(np.single if data_.dtype in [np.double,np.longdouble] else
+                                                        data_.dtype,copy=False)
+            if data_.shape[-1] == 1: data_ = data_[:,0]
+            if image:
+                cells = self.cells if len(data_) == N_cells else self.cells+1
+                data_ = data_.reshape((1,)+tuple(cells[::-1])+data_.shape[1:])                      # z,y,x order
+            label_ = label.replace('/','\u2215')
+            _account('/'.join([group.name,label_]),written=data_.nbytes)
+            if label_ not in group:
+                options = _storage_options((N_steps*len(data_),)+data_.shape[1:],self._storage)
+                if options['chunks'] is None: options['chunks'] = True                              # resizable
+                dataset = group.create_dataset(label_,shape=(0,)+data_.shape[1:],dtype=data_.dtype,
+                                               maxshape=(None,)+data_.shape[1:],**options,
+                                               fillvalue=fill_float if np.issubdtype(data_.dtype,np.floating) else
+                                                         fill_int)
+                N_rows[dataset] = len(data_)
+                offsets.create_dataset(label_,data=np.arange(N_steps)*len(data_))
+            dataset = group[label_]
+            dataset.resize((step+1)*N_rows[dataset],axis=0)
+            dataset[step*N_rows[dataset]:] = data_
+
+        with self._open('r') as f_in, \
+             h5py.File(out_dir/f'{self.fname.stem}.vtkhdf','w') as f_out:
+            root = f_out.create_group('VTKHDF')
+            root.attrs['Version'] = (2,2)
+            steps = root.create_group('Steps')
+            steps.attrs['NSteps'] = N_steps
+            steps.create_dataset('Values',data=np.array(self.times,dtype=float))
+            if image:
+                root.attrs.create('Type',np.bytes_('ImageData'))
+                root.attrs['WholeExtent'] = np.array([[0,c] for c in self.cells]).ravel()
+                root.attrs['Origin']      = self.origin
+                root.attrs['Spacing']     = self.size/self.cells
+                root.attrs['Direction']   = np.eye(3).ravel()
+            else:
+                cells = v.vtk_data.GetCells() if mode.lower() == 'cell' else v.vtk_data.GetVerts()  # type: ignore
+                root.attrs.create('Type',np.bytes_('UnstructuredGrid'))
+                root.create_dataset('NumberOfPoints',data=[N_points])
+                root.create_dataset('NumberOfCells',data=[N_cells])
+                root.create_dataset('NumberOfConnectivityIds',data=[cells.GetNumberOfConnectivityIds()])
+                root.create_dataset('Points',data=vtk_to_numpy(v.vtk_data.GetPoints().GetData()))
+                root.create_dataset('Connectivity',data=vtk_to_numpy(cells.GetConnectivityArray()))
+                root.create_dataset('Offsets',data=vtk_to_numpy(cells.GetOffsetsArray()))
+                root.create_dataset('Types',data=np.full(N_cells,v.vtk_data.GetCellType(0),np.uint8))        # single cell type
+                for label in ['PointOffsets','CellOffsets','ConnectivityIdOffsets','PartOffsets']:
+                    steps.create_dataset(label,data=np.zeros(N_steps,np.int64))                    # geometry is shared
+                steps.create_dataset('NumberOfParts',data=np.ones(N_steps,np.int64))
+            point_data,cell_data = root.create_group('PointData'),root.create_group('CellData')
+            point_offsets,cell_offsets = steps.create_group('PointDataOffsets'),steps.create_group('CellDataOffsets')
+
+            for step,inc in enumerate(util.show_progress(self._visible['increments'])):
+                u = _read(f_in['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])],dtype)
+                with _stage('write'):
+                    add('u',u,step)
+                for label,data in self._fused(f_in,inc,output,constituents,fill_float,fill_int,
+                                              mappings,self.N_materialpoints,False,dtype):
+                    with _stage('write'):
+                        add(label,data,step)
+
+            for dataset,N in N_rows.items():                                                        # missing steps are filled
+                dataset.resize(N_steps*N,axis=0)
+
+
+    @_profiled('export_DREAM3D')
     def export_DREAM3D(self,
                        q: str = 'O',
                        target_dir: Union[None, str, Path] = None):
@@ -2034,7 +4025,7 @@ class Result:
         out_dir = Path.cwd() if target_dir is None else Path(target_dir)
         out_dir.mkdir(parents=True,exist_ok=True)
 
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f:
             for inc in util.show_progress(self._visible['increments']):
                 for c in range(self.N_constituents):
                     crystal_structure = [999]
@@ -2116,10 +4107,12 @@ class Result:
                         add_attribute(geom,name,value)
 
 
+    @_profiled('export_DADF5')
     def export_DADF5(self,
                      fname,
                      output: Union[str, List[str]] = '*',
-                     mapping = None):
+                     mapping = None,
+                     link: bool = False):
         """
         Export visible components into a new DADF5 file.
 
@@ -2136,6 +4129,22 @@ class Result:
         mapping : numpy.ndarray of int, shape (:,:,:), optional
             Indices for regridding. Only applicable for grid
             solver results.
+        link : bool, optional
+            Store the datasets as virtual datasets that refer to
+            the data in the original DADF5 file instead of copying it.
+            Not applicable for regridding. Defaults to False.
+
+        Notes
+        -----
+        A linked DADF5 file contains the path to the original DADF5 file
+        relative to its own location. Both files need to be kept at
+        the same relative location and reading from the linked file
+        gives fill values if the original DADF5 file is not found.
+
+        Regridded datasets are written in blocks of about 16 MiB
+        with the chunking and compression of the original datasets.
+        The blocks are read and regridded in parallel according
+        to the number of processes set by `view`.
 
         """
         if Path(fname).expanduser().absolute() == self.fname:
@@ -2144,64 +4153,128 @@ class Result:
         if mapping is not None and not self.structured:
             raise PermissionError('cannot regrid unstructured mesh')
 
+        if mapping is not None and link:
+            raise ValueError('cannot link regridded data')
 
-        def cp(path_in,path_out,label,mapping):
-            if mapping is None:
-                path_in.copy(label,path_out)
+        source = os.path.relpath(self.fname,Path(fname).expanduser().absolute().parent)
+
+        def cp(path_in,path_out,label):
+            if link:
+                dataset = path_in[label]
+                layout = h5py.VirtualLayout(shape=dataset.shape,dtype=dataset.dtype)
+                layout[...] = h5py.VirtualSource(source,dataset.name,shape=dataset.shape,dtype=dataset.dtype)
+                path_out.create_virtual_dataset(label,layout)
+                path_out[label].attrs.update(dataset.attrs)
             else:
-                path_out.create_dataset(label,data=path_in[label][()][mapping])
-                path_out[label].attrs.update(path_in[label].attrs)
+                path_in.copy(label,path_out)
 
+        if mapping is not None:
+            self._export_DADF5_regrid(fname,output,mapping)
+            return
 
-        with h5py.File(self.fname,'r') as f_in, h5py.File(fname,'w') as f_out:
+        with self._open('r') as f_in, h5py.File(fname,'w') as f_out:
             f_out.attrs.update(f_in.attrs)
-            for g in ['setup','geometry'] + (['cell_to'] if mapping is None else []):
+            for g in ['setup','geometry','cell_to']:
                 f_in.copy(g,f_out)
 
-            if mapping is not None:
-                cells = mapping.shape
-                mapping_flat = mapping.flatten(order='F')
+            for inc in util.show_progress(self._visible['increments']):
+                f_in.copy(inc,f_out,shallow=True)
+                for label in ['u_p','u_n']:
+                    cp(f_in[inc]['geometry'],f_out[inc]['geometry'],label)
 
-                f_out['geometry'].attrs['cells'] = cells
-                if self.version_major == 1 and self.version_minor > 0:
-                    f_out['geometry']['cells'][...] = cells
+                for label in self._homogenizations:
+                    f_in[inc]['homogenization'].copy(label,f_out[inc]['homogenization'],shallow=True)
+                for label in self._phases:
+                    f_in[inc]['phase'].copy(label,f_out[inc]['phase'],shallow=True)
 
-                f_out.create_group('cell_to')                                                       # ToDo: attribute missing
-                mappings = {'phase':{},'homogenization':{}}                                         # type: ignore
+                for ty in ['phase','homogenization']:
+                    for label in self._visible[ty+'s']:
+                        for field in _match(self._visible['fields'],self._keys(f_in,'/'.join([inc,ty,label]))):
+                            p = '/'.join([inc,ty,label,field])
+                            for out in _match(output,self._keys(f_in,p)):
+                                cp(f_in[p],f_out[p],out)
 
-                mapping_phase = f_in['cell_to']['phase'][()][mapping_flat]
-                for p in np.unique(mapping_phase['label']):
-                    m = mapping_phase['label'] == p
-                    mappings['phase'][p] = mapping_phase[m]['entry']
-                    c = np.count_nonzero(m)
-                    mapping_phase[m] = list(zip((p,)*c,tuple(np.arange(c))))
-                f_out['cell_to'].create_dataset('phase',data=mapping_phase.reshape(np.prod(mapping_flat.shape),-1))
 
-                mapping_homog = f_in['cell_to']['homogenization'][()][mapping]
-                for h in np.unique(mapping_homog['label']):
-                    m = mapping_homog['label'] == h
-                    mappings['homogenization'][h] = mapping_homog[m]['entry']
-                    c = np.count_nonzero(m)
-                    mapping_homog[mapping_homog['label'] == h] = list(zip((h,)*c,tuple(np.arange(c))))
-                f_out['cell_to'].create_dataset('homogenization',data=mapping_homog.flatten())
+    def _export_DADF5_regrid(self,
+                             fname,
+                             output: Union[str, List[str]],
+                             mapping: np.ndarray):
+        """
+        Export visible components into a new DADF5 file on a new grid.
 
+        Parameters
+        ----------
+        fname : str or pathlib.Path
+            Name of the DADF5 file to be created.
+        output : (list of) str
+            Names of the datasets to export.
+        mapping : numpy.ndarray of int, shape (:,:,:)
+            Indices for regridding.
 
-            for inc in util.show_progress(self._visible['increments']):
-                f_in.copy(inc,f_out,shallow=True)
-                if mapping is None:
-                    for label in ['u_p','u_n']:
-                        f_in[inc]['geometry'].copy(label,f_out[inc]['geometry'])
-                else:
-                    u_p = f_in[inc]['geometry']['u_p'][()][mapping_flat]
-                    f_out[inc]['geometry'].create_dataset('u_p',data=u_p)
-                    delta = self.size/np.array(mapping.shape)
-                    c_0_p = tuple([np.linspace(delta[i]/2,self.size[i]-delta[i]/2,mapping.shape[i]) for i in [0,1,2]])
-                    interpolator = interpolate.RegularGridInterpolator(c_0_p,np.reshape(u_p,tuple(cells)+(3,)),
-                                                                       fill_value=None,bounds_error=False,method='linear')
-                    c_0_n = grid_filters.coordinates0_node(mapping.shape,self.size).reshape(-1,3)
-                    f_out[inc]['geometry'].create_dataset('u_n',data=interpolator(c_0_n))
-                    f_out[inc]['geometry/u_n'].attrs.update(f_in[inc]['geometry/u_n'].attrs)
+        """
+        def create(path_in,path_out,label,N):
+            """Create an empty dataset with the layout, filters, and attributes of the original."""
+            dataset = path_in[label]
+            chunks = None if dataset.chunks is None or N == 0 else \
+                     (min(dataset.chunks[0],N),)+dataset.chunks[1:]
+            path_out.create_dataset(label,shape=(N,)+dataset.shape[1:],dtype=dataset.dtype,chunks=chunks,
+                                    compression=dataset.compression,compression_opts=dataset.compression_opts,
+                                    shuffle=dataset.shuffle,fletcher32=dataset.fletcher32)
+            path_out[label].attrs.update(dataset.attrs)
+            return path_out[label]
+
+        def regrid(name,rows,nodes):
+            """Read the given rows or interpolate from the (mapped) cells to the given nodes."""
+            if nodes is not None:
+                indices,weights = _cell_to_node(cells,np.arange(nodes.start,nodes.stop))
+                rows,inverse = np.unique(mapping_flat[indices],return_inverse=True)
+            with self._open('r') as f:
+                data = _read_rows(f[name],rows)
+            if nodes is None: return data
+            return sparse.csr_matrix((weights.ravel(),inverse.ravel(),np.arange(0,weights.size+1,8)),
+                                     shape=(len(weights),len(rows)))@data
+
+        cells = mapping.shape
+        mapping_flat = mapping.flatten(order='F')
+        jobs: List[Tuple[str, int, int, str, Optional[np.ndarray], Optional[slice]]] = []
+
+        with self._open('r') as f_in, h5py.File(fname,'w') as f_out:
+            f_out.attrs.update(f_in.attrs)
+            for g in ['setup','geometry']:
+                f_in.copy(g,f_out)
 
+            f_out['geometry'].attrs['cells'] = cells
+            if self.version_major == 1 and self.version_minor > 0:
+                f_out['geometry']['cells'][...] = cells
+
+            f_out.create_group('cell_to')                                                           # ToDo: attribute missing
+            mappings = {'phase':{},'homogenization':{}}                                             # type: ignore
+
+            mapping_phase = f_in['cell_to']['phase'][()][mapping_flat]
+            for p in np.unique(mapping_phase['label']):
+                m = mapping_phase['label'] == p
+                mappings['phase'][p] = mapping_phase[m]['entry']
+                c = np.count_nonzero(m)
+                mapping_phase[m] = list(zip((p,)*c,tuple(np.arange(c))))
+            f_out['cell_to'].create_dataset('phase',data=mapping_phase.reshape(np.prod(mapping_flat.shape),-1))
+
+            mapping_homog = f_in['cell_to']['homogenization'][()][mapping]
+            for h in np.unique(mapping_homog['label']):
+                m = mapping_homog['label'] == h
+                mappings['homogenization'][h] = mapping_homog[m]['entry']
+                c = np.count_nonzero(m)
+                mapping_homog[mapping_homog['label'] == h] = list(zip((h,)*c,tuple(np.arange(c))))
+            f_out['cell_to'].create_dataset('homogenization',data=mapping_homog.flatten())
+
+            for inc in self._visible['increments']:
+                f_in.copy(inc,f_out,shallow=True)
+                u_p = f_in[inc]['geometry/u_p'].name
+                dataset = create(f_in[inc]['geometry'],f_out[inc]['geometry'],'u_p',len(mapping_flat))
+                for b,e in _blocks(dataset):
+                    jobs.append((dataset.name,b,e,u_p,mapping_flat[b:e],None))
+                dataset = create(f_in[inc]['geometry'],f_out[inc]['geometry'],'u_n',np.prod(np.array(cells)+1))
+                for b,e in _blocks(dataset):
+                    jobs.append((dataset.name,b,e,u_p,None,slice(b,e)))
 
                 for label in self._homogenizations:
                     f_in[inc]['homogenization'].copy(label,f_out[inc]['homogenization'],shallow=True)
@@ -2210,12 +4283,45 @@ class Result:
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
-                        for field in _match(self._visible['fields'],f_in['/'.join([inc,ty,label])].keys()):
+                        for field in _match(self._visible['fields'],self._keys(f_in,'/'.join([inc,ty,label]))):
                             p = '/'.join([inc,ty,label,field])
-                            for out in _match(output,f_in[p].keys()):
-                                cp(f_in[p],f_out[p],out,None if mapping is None else mappings[ty][label.encode()])
-
+                            for out in _match(output,self._keys(f_in,p)):
+                                entries = mappings[ty][label.encode()]
+                                dataset = create(f_in[p],f_out[p],out,len(entries))
+                                for b,e in _blocks(dataset):
+                                    jobs.append((dataset.name,b,e,f_in[p][out].name,entries[b:e],None))
+
+        def store(f_out,name,b,e,data):
+            with _stage('write'):
+                f_out[name][b:e] = data
+            _account(name,written=data.nbytes)
+
+        if self._processes == 1 or 'fork' not in mp.get_all_start_methods():
+            with self.session(), h5py.File(fname,'a') as f_out:
+                for name,b,e,*job in util.show_progress(jobs):
+                    store(f_out,name,b,e,regrid(*job))
+            return
 
+        self._session.flush()                                                                       # forked workers open the file themselves
+        _forked_job.update(regrid=regrid)                                                           # forked workers inherit the closure
+        try:
+            with ProcessPoolExecutor(self._processes,mp_context=mp.get_context('fork'),
+                                     initializer=self._session.detach) as pool, \
+                 h5py.File(fname,'a') as f_out:
+                pending: deque = deque()
+                for name,b,e,*job in util.show_progress(jobs):
+                    pending.append((name,b,e,pool.submit(_forked_job_regrid,*job)))
+                    if len(pending) >= 2*self._processes:                                           # limit data in flight
+                        name_,b_,e_,future = pending.popleft()
+                        store(f_out,name_,b_,e_,future.result())
+                while pending:
+                    name_,b_,e_,future = pending.popleft()
+                    store(f_out,name_,b_,e_,future.result())
+        finally:
+            _forked_job.clear()
+
+
+    @_profiled('export_simulation_setup')
     def export_simulation_setup(self,
                      output: Union[str, List[str]] = '*',
                      target_dir: Union[None, str, Path] = None,
@@ -2252,7 +4358,7 @@ class Result:
                     with util.open_text(cfg,'w') as f_out: f_out.write(obj[0].decode())
 
         cfg_dir = (Path.cwd() if target_dir is None else Path(target_dir))
-        with h5py.File(self.fname,'r') as f_in:
+        with self._open('r') as f_in:
             f_in['setup'].visititems(functools.partial(export,
                                                        output=output,
                                                        cfg_dir=cfg_dir,
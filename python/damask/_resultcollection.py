@@ -0,0 +1,510 @@
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Union, Callable, Any, Sequence, Dict, List, Tuple
+
+import numpy as np
+from numpy import ma
+
+from . import Result
+from . import VTK
+from . import util
+from ._typehints import FloatSequence, IntSequence, DTypeLike
+
+
+Leaves = Dict[Tuple[str, ...], Any]
+
+_forked_job: Dict[str, Any] = {}
+
+def _forked_job_run(i: int) -> List[Leaves]:
+    """Process a run with the closure inherited from the parent process."""
+    return _forked_job['run'](i)
+
+def _detach(results: Sequence[Result]):
+    """Forget the handles inherited by a forked process."""
+    for r in results:
+        r._session.detach()
+
+
+def _leaves(d: Optional[Dict[str, Any]],
+            path: Tuple[str, ...] = ()) -> Leaves:
+    """Leaves of a nested dictionary indexed by their path."""
+    leaves: Leaves = {}
+    for k,v in ({} if d is None else d).items():
+        if isinstance(v,dict):
+            leaves.update(_leaves(v,path+(k,)))
+        else:
+            leaves[path+(k,)] = v
+    return leaves
+
+def _nest(leaves: Leaves) -> Dict[str, Any]:
+    """Nested dictionary from leaves indexed by their path."""
+    d: Dict[str, Any] = {}
+    for path,v in leaves.items():
+        node = d
+        for k in path[:-1]:
+            node = node.setdefault(k,{})
+        node[path[-1]] = v
+    return d
+
+def _stack(runs: Sequence[Sequence[Tuple[Leaves, int]]]) -> Leaves:
+    """
+    Stack time-dependent data.
+
+    Parameters
+    ----------
+    runs : sequence of sequence of (dict, int)
+        Per run, the data of each segment and its number of
+        increments, i.e. the length of the first axis of the data.
+
+    Returns
+    -------
+    stacked : dict of numpy.ma.MaskedArray, shape (N_runs,N_increments,...)
+        Data of the segments of a run concatenated along the first axis,
+        runs stacked along a new first axis. Missing entries are masked.
+
+    """
+    N_increments = max([sum(N for _,N in run) for run in runs],default=0)
+
+    templates: Leaves = {}
+    for run in runs:
+        for leaves,_ in run:
+            for path,data in leaves.items():
+                templates.setdefault(path,data)
+
+    stacked: Leaves = {}
+    for path,template in templates.items():
+        s = ma.masked_all((len(runs),N_increments)+np.shape(template)[1:],np.asarray(template).dtype)
+        if isinstance(template,ma.MaskedArray): s.fill_value = template.fill_value
+        for i,run in enumerate(runs):
+            offset = 0
+            for leaves,N in run:
+                if path in leaves: s[i,offset:offset+N] = leaves[path]
+                offset += N
+        stacked[path] = s
+
+    return stacked
+
+
+class ResultCollection:
+    """
+    Read results of several DADF5 files.
+
+    All runs share a common view and the data is returned as stacked
+    arrays with the runs along the first and the increments along
+    the second axis.
+
+    A run can be spread over several files, e.g. in case of a restarted
+    simulation. Their increments are joined into a single time axis,
+    the increments of a file at or after the time of the first increment
+    of the subsequent file are hidden.
+    """
+
+    def __init__(self,
+                 fnames: Sequence[Union[str, Path, Sequence[Union[str, Path]]]],
+                 index: bool = False):
+        """
+        New collection of results.
+
+        Parameters
+        ----------
+        fnames : sequence of (sequence of) str or pathlib.Path
+            Filenames of the DADF5 files of the runs. The files of
+            a restarted run are given as a sequence ordered by time.
+        index : bool, optional
+            Use a sidecar index for each file, see `damask.Result`.
+            Defaults to False.
+
+        """
+        if len(fnames) == 0:
+            raise ValueError('no DADF5 files given')
+
+        self._runs: List[List[Result]] = []
+        self._hidden: List[List[List[str]]] = []
+        for fname in fnames:
+            segments = [Result(f,index) for f in ([fname] if isinstance(fname,(str,Path)) else fname)]
+            hidden = []
+            for current,subsequent in zip(segments[:-1],segments[1:]):
+                t_0 = subsequent._times[subsequent._incs[0]]
+                if t_0 <= current._times[current._incs[0]]:
+                    raise ValueError(f'"{subsequent.fname}" does not continue "{current.fname}"')
+                hidden.append([inc for inc in current._increments
+                               if current._times[int(inc.split('_')[-1])] >= t_0])
+            hidden.append([])
+            self._runs.append([s.view_less(increments=h) if h else s for s,h in zip(segments,hidden)])
+            self._hidden.append(hidden)
+
+        self._processes = 1
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return util.srepr([f'{" + ".join(s.fname.name for s in run)}: {len(t)} increment(s)'
+                           for run,t in zip(self._runs,self.times)])
+
+
+    def __len__(self) -> int:
+        """
+        Return len(self).
+
+        Number of runs.
+
+        """
+        return len(self._runs)
+
+
+    def __getitem__(self,
+                    item: int) -> List[Result]:
+        """
+        Return self[item].
+
+        Views on the DADF5 files of a run.
+
+        """
+        return list(self._runs[item])
+
+
+    @property
+    def times(self) -> List[np.ndarray]:
+        """Times of the visible increments of each run."""
+        return [np.array(sum([s.times for s in run],[]),dtype=float) for run in self._runs]
+
+
+    def view(self,*,
+             increments: Union[None, int, Sequence[int], str, Sequence[str], bool] = None,
+             times: Union[None, float, Sequence[float], str, Sequence[str], bool] = None,
+             phases: Union[None, str, Sequence[str], bool] = None,
+             homogenizations: Union[None, str, Sequence[str], bool] = None,
+             fields: Union[None, str, Sequence[str], bool] = None,
+             processes: Optional[int] = None) -> "ResultCollection":
+        """
+        Set view of all runs.
+
+        Wildcard matching with '?' and '*' is supported.
+        True is equivalent to '*', False is equivalent to [].
+        Increments are selected per file, i.e. negative
+        numbers count from the end of each file.
+
+        Parameters
+        ----------
+        increments: (list of) int, (list of) str, or bool, optional.
+            Numbers of increments to select.
+        times: (list of) float, (list of) str, or bool, optional.
+            Simulation times of increments to select.
+        phases: (list of) str, or bool, optional.
+            Names of phases to select.
+        homogenizations: (list of) str, or bool, optional.
+            Names of homogenizations to select.
+        fields: (list of) str, or bool, optional.
+            Names of fields to select.
+        processes: int, optional.
+            Number of processes used to process the runs concurrently.
+
+        Returns
+        -------
+        view : damask.ResultCollection
+            View with only the selected attributes being visible.
+
+        Examples
+        --------
+        Get a view on the final state of a parameter study,
+        processing four runs concurrently:
+
+        >>> import damask
+        >>> c = damask.ResultCollection([f'run_{i}.hdf5' for i in range(16)])
+        >>> c_final = c.view(times=100.0,processes=4)
+
+        """
+        dup = ResultCollection.__new__(ResultCollection)
+        dup._hidden = self._hidden
+        dup._runs = []
+        for run,hidden in zip(self._runs,self._hidden):
+            segments = [s.view(increments=increments,times=times,phases=phases,
+                               homogenizations=homogenizations,fields=fields) for s in run]
+            dup._runs.append([s.view_less(increments=h) if h else s for s,h in zip(segments,hidden)])
+
+        dup._processes = self._processes
+        if processes is not None:
+            if processes < 1:
+                raise ValueError(f'invalid number of processes "{processes}"')
+            dup._processes = int(processes)
+
+        return dup
+
+
+    def _map(self,
+             job: Callable[[Result], Leaves]) -> List[List[Leaves]]:
+        """Apply a job to each file with visible increments, runs are processed by forked processes."""
+        def run(i: int) -> List[Leaves]:
+            return [job(s) if s.increments else {} for s in self._runs[i]]
+
+        if self._processes == 1 or 'fork' not in mp.get_all_start_methods():
+            return [run(i) for i in range(len(self))]
+
+        for s in sum(self._runs,[]):
+            s._session.flush()                                                                      # forked workers open the files themselves
+        _forked_job.update(run=run)                                                                 # forked workers inherit the closure
+        try:
+            with ProcessPoolExecutor(self._processes,mp_context=mp.get_context('fork'),
+                                     initializer=_detach,initargs=(sum(self._runs,[]),)) as pool:
+                return list(util.show_progress(pool.map(_forked_job_run,range(len(self))),len(self)))
+        finally:
+            _forked_job.clear()
+
+
+    def _stacked(self,
+                 data: List[List[Leaves]],
+                 flatten: bool,
+                 common: Optional[Leaves] = None) -> Optional[Dict[str, Any]]:
+        """Stack the data of the runs, add data common to all runs, and restructure it."""
+        r = _nest({**_stack([[(leaves,len(s.increments)) for leaves,s in zip(run_data,run)]
+                             for run_data,run in zip(data,self._runs)]),
+                   **({} if common is None else common)})
+
+        if flatten: r = util.dict_flatten(r)
+
+        return None if (type(r) == dict and r == {}) else r
+
+
+    def place(self,
+              output: Union[str, List[str]] = '*',
+              flatten: bool = True,
+              constituents: Optional[IntSequence] = None,
+              fill_float: float = np.nan,
+              fill_int: int = 0,
+              roi: Union[None, IntSequence, FloatSequence] = None,
+              dtype: Optional[DTypeLike] = None) -> Optional[Dict[str,Any]]:
+        """
+        Merge data of all runs into spatial order.
+
+        The runs need to have the same geometry.
+        See `damask.Result.place` for details.
+
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to read.
+            Defaults to '*', in which case all visible datasets are placed.
+        flatten : bool, optional
+            Remove singular levels of the folder hierarchy.
+            Defaults to True.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+        roi : numpy.ndarray, shape (2,3), optional
+            Lower and upper bound of the region of interest of a
+            structured grid. Defaults to None, in which case all
+            cells are placed.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            Defaults to None, in which case the stored data type is kept.
+
+        Returns
+        -------
+        data : dict of numpy.ma.MaskedArray, shape (N_runs,N_increments,...)
+            Datasets structured according to selected view.
+            The second axis corresponds to the visible increments,
+            i.e. to `times`. Entries of non-existent increments,
+            e.g. of shorter runs, are masked.
+
+        Examples
+        --------
+        Deformation gradient of two runs at the end of the loading:
+
+        >>> import damask
+        >>> c = damask.ResultCollection(['run_1.hdf5','run_2.hdf5'])
+        >>> F = c.view(times=100.0).place('F')
+
+        """
+        def job(r: Result) -> Leaves:
+            placed = r.place(output,False,True,constituents,fill_float,fill_int,roi=roi,dtype=dtype) or {}
+            stacked = _stack([[({path:data[np.newaxis] for path,data in _leaves(placed.get(inc)).items()},1)
+                               for inc in r.increments]])
+            return {path:data[0] for path,data in stacked.items()}
+
+        return self._stacked(self._map(job),flatten)
+
+
+    def time_series(self,
+                    output: Union[str, List[str]],
+                    points: Union[int, IntSequence],
+                    flatten: bool = True,
+                    constituents: Optional[IntSequence] = None,
+                    fill_float: float = np.nan,
+                    fill_int: int = 0) -> Optional[Dict[str,Any]]:
+        """
+        Collect the history of data at selected material points of all runs.
+
+        See `damask.Result.time_series` for details.
+
+        Parameters
+        ----------
+        output : (list of) str
+            Names of the datasets to read.
+        points : (list of) int
+            Indices of the material points.
+        flatten : bool, optional
+            Remove singular levels of the folder hierarchy.
+            Defaults to True.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+
+        Returns
+        -------
+        data : dict of numpy.ma.MaskedArray, shape (N_runs,N_increments,N_points,...)
+            Datasets structured according to selected view.
+            The second axis corresponds to the visible increments,
+            i.e. to `times`. Entries of non-existent increments,
+            e.g. of shorter runs, are masked.
+
+        """
+        return self._stacked(self._map(lambda r: _leaves(r.time_series(output,points,False,True,constituents,
+                                                                       fill_float,fill_int))),
+                             flatten)
+
+
+    def reduce(self,
+               output: Union[str, List[str]] = '*',
+               ops: Union[str, Sequence[str]] = ('mean','min','max','std'),
+               weights: Optional[str] = None,
+               bins: Optional[FloatSequence] = None,
+               flatten: bool = True) -> Optional[Dict[str,Any]]:
+        """
+        Calculate statistics of the data of each visible increment of all runs.
+
+        See `damask.Result.reduce` for details.
+
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to reduce.
+            Defaults to '*', in which case all visible datasets are considered.
+        ops : (sequence of) str, optional
+            Statistics to calculate. Possible values are 'mean', 'min',
+            'max', 'std' (standard deviation), and 'histogram'.
+            Defaults to ('mean','min','max','std').
+        weights : str, optional
+            Name of a scalar phase dataset with the weights of the
+            constituents. Defaults to None, in which case all
+            constituents of a material point are weighted equally.
+        bins : sequence of float, optional
+            Bin edges for 'histogram', common to all runs.
+        flatten : bool, optional
+            Remove singular levels of the folder hierarchy.
+            Defaults to True.
+
+        Returns
+        -------
+        statistics : dict of numpy.ma.MaskedArray, shape (N_runs,N_increments,...)
+            Statistics structured according to selected view.
+            The second axis corresponds to the visible increments,
+            i.e. to `times`. Entries of non-existent increments,
+            e.g. of shorter runs, are masked.
+
+        Examples
+        --------
+        Volume-averaged stress-strain curves of a parameter study:
+
+        >>> import damask
+        >>> c = damask.ResultCollection([f'run_{i}.hdf5' for i in range(16)]).view(processes=4)
+        >>> s = c.reduce(['sigma','epsilon_V^0.0(F)'],'mean')
+        >>> sigma_avg,epsilon_avg = s['sigma'],s['epsilon_V^0.0(F)']
+
+        """
+        histogram = 'histogram' in ([ops] if isinstance(ops,str) else ops)
+        if histogram and (bins is None or np.ndim(bins) != 1):
+            raise ValueError('bin edges required for histogram')
+
+        def job(r: Result) -> Leaves:
+            reduced = r.reduce(output,ops,weights,bins if histogram else 10,False,True)             # type: ignore
+            return {path:data for path,data in _leaves(reduced).items() if path[-1] != 'bin_edges'}
+
+        data = self._map(job)
+        edges = {path[:-1]+('bin_edges',):np.asarray(bins,float)
+                 for run in data for leaves in run for path in leaves if path[-1] == 'histogram'}
+
+        return self._stacked(data,flatten,edges)
+
+
+    def export_VTK(self,
+                   output: Union[str,List[str]] = '*',
+                   mode: str = 'cell',
+                   constituents: Optional[IntSequence] = None,
+                   target_dir: Union[None, str, Path] = None,
+                   fill_float: float = np.nan,
+                   fill_int: int = 0,
+                   parallel: Union[bool, int] = True,
+                   roi: Union[None, IntSequence, FloatSequence] = None,
+                   dtype: Optional[DTypeLike] = None):
+        """
+        Export all runs to VTK cell/point data.
+
+        See `damask.Result.export_VTK` for details.
+
+        Parameters
+        ----------
+        output : (list of) str, optional
+            Names of the datasets to export to the VTK file.
+            Defaults to '*', in which case all visible datasets are exported.
+        mode : {'cell', 'point'}, optional
+            Export in cell format or point format.
+            Defaults to 'cell'.
+        constituents : (list of) int, optional
+            Constituents to consider.
+            Defaults to None, in which case all constituents are considered.
+        target_dir : str or pathlib.Path, optional
+            Directory to save the VTK files of each run in a subdirectory
+            named by the index of the run. Will be created if non-existent.
+            Defaults to None, in which case the VTK files are saved in the
+            directory of the (first) DADF5 file of each run.
+        fill_float : float, optional
+            Fill value for non-existent entries of floating point type.
+            Defaults to NaN.
+        fill_int : int, optional
+            Fill value for non-existent entries of integer type.
+            Defaults to 0.
+        parallel : bool or int, optional
+            Write VTK files in parallel in separate background processes.
+            Ignored if more than one process is used (see `view`).
+            The export returns once all files are written.
+            Defaults to True.
+        roi : numpy.ndarray, shape (2,3), optional
+            Lower and upper bound of the region of interest of a
+            structured grid. Defaults to None, in which case all
+            cells are exported.
+        dtype : numpy.dtype, optional
+            Data type of floating point data, e.g. numpy.float32.
+            Defaults to None, in which case the stored data type is kept.
+
+        """
+        N_digits = int(np.floor(np.log10(max(1,len(self)-1))))+1
+        out_dirs = [run[0].fname.parent if target_dir is None else Path(target_dir)/str(i).zfill(N_digits)
+                    for i,run in enumerate(self._runs)]
+        directory = {id(s):d for run,d in zip(self._runs,out_dirs) for s in run}                    # a file might belong to several runs
+
+        parallel_ = parallel if self._processes == 1 else False                                     # forked workers write themselves
+
+        def job(r: Result) -> Leaves:
+            r.export_VTK(output,mode,constituents,directory[id(r)],fill_float,fill_int,parallel_,roi,dtype)
+            return {}
+
+        self._map(job)
+        if parallel_: VTK.wait()
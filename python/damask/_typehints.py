@@ -16,10 +16,12 @@ CrystalKinematics = Literal['slip', 'twin']
 NumpyRngSeed = Union[int, IntSequence, np.random.SeedSequence, np.random.Generator]
 # BitGenerator does not exists in older numpy versions
 #NumpyRngSeed = Union[int, IntSequence, np.random.SeedSequence, np.random.BitGenerator, np.random.Generator]
+# numpy.typing.DTypeLike does not exist in numpy < 1.20
+DTypeLike = Union[np.dtype, type, str]
 
 # https://peps.python.org/pep-0655/
 # Metadata = TypedDict('Metadata', {'unit': str, 'description': str, 'creator': str, 'lattice': NotRequired[str]})
-_Metadata = TypedDict('_Metadata', {'lattice': str, 'c/a': float}, total=False)
+_Metadata = TypedDict('_Metadata', {'lattice': str, 'c/a': float, 'fingerprint': str}, total=False)
 
 class Metadata(_Metadata):
     unit: str
@@ -1,7 +1,10 @@
 import os
+import time
 import multiprocessing as mp
+from multiprocessing import connection
+from concurrent import futures
 from pathlib import Path
-from typing import Optional, Union, Literal, List, Sequence
+from typing import Optional, Union, Literal, List, Sequence, Tuple
 
 import numpy as np
 
@@ -62,6 +65,49 @@ from . import Table
 from . import Colormap
 
 
+_pending: List[Tuple[mp.Process, futures.Future, Path]] = []
+_failed: List[futures.Future] = []
+
+def _reap(N_pending: int,
+          future: Optional[futures.Future] = None,
+          timeout: Optional[float] = None):
+    """
+    Resolve the futures of finished background writes.
+
+    Waits (in the calling thread) until at most the given number
+    of background writes is pending and the given future is resolved.
+    """
+    deadline = None if timeout is None else time.monotonic()+timeout
+    while True:
+        for writing in [w for w in _pending if w[0].exitcode is not None]:
+            process,future_,fname = writing
+            process.join()
+            _pending.remove(writing)
+            if process.exitcode == 0:
+                future_.set_result(fname)
+            else:
+                future_.set_exception(OSError(f'could not write "{fname}"'))
+                _failed.append(future_)
+        if len(_pending) <= N_pending and (future is None or future.done()):
+            return
+        if not _pending or not connection.wait([p.sentinel for p,_,_ in _pending],
+                                               None if deadline is None else max(0.,deadline-time.monotonic())):
+            return                                                                                  # timeout
+
+class _Writing(futures.Future):
+    """Future of a file written by a background process."""
+
+    def result(self,
+               timeout: Optional[float] = None) -> Path:
+        _reap(len(_pending),self,timeout)
+        return super().result(0)
+
+    def exception(self,
+                  timeout: Optional[float] = None) -> Optional[BaseException]:
+        _reap(len(_pending),self,timeout)
+        return super().exception(0)
+
+
 class VTK:
     """
     Spatial visualization (and potentially manipulation).
@@ -389,7 +435,26 @@ class VTK:
     @staticmethod
     def _write(writer):
         """Wrapper for parallel writing."""
-        writer.Write()
+        if writer.Write() != 1:
+            raise OSError(f'could not write "{writer.GetFileName()}"')
+
+
+    @staticmethod
+    def wait():
+        """
+        Wait until all files written in background processes are saved.
+
+        Raises
+        ------
+        OSError
+            If writing of a file failed since the last call.
+
+        """
+        _reap(0)
+        if _failed:
+            errors = [str(f.exception()) for f in _failed]
+            _failed.clear()
+            raise OSError('\n'.join(errors))
 
 
     def as_ASCII(self) -> str:
@@ -404,8 +469,8 @@ class VTK:
 
     def save(self,
              fname: Union[str, Path],
-             parallel: bool = True,
-             compress: bool = True):
+             parallel: Union[bool, int] = True,
+             compress: bool = True) -> futures.Future:
         """
         Save as VTK file.
 
@@ -413,11 +478,32 @@ class VTK:
         ----------
         fname : str or pathlib.Path
             Filename to write.
-        parallel : bool, optional
+        parallel : bool or int, optional
             Write data in parallel background process. Defaults to True.
+            An integer sets the maximum number of files that are written
+            concurrently, True corresponds to $OMP_NUM_THREADS (or 4).
+            If the maximum is reached, saving waits for the oldest
+            background process to finish.
         compress : bool, optional
             Compress with zlib algorithm. Defaults to True.
 
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Path of the written file once saved.
+
+        Raises
+        ------
+        OSError
+            If writing in the foreground failed.
+
+        Notes
+        -----
+        Use `damask.VTK.wait` to wait for all background processes
+        and to check for failed writes. The background processes are
+        monitored by the calling thread, i.e. their futures are resolved
+        when saving further files, waiting, or querying the future.
+
         """
         writer: Optional[vtkXMLWriter] = (
             vtkXMLImageDataWriter() if isinstance(self.vtk_data, vtkImageData) else
@@ -431,7 +517,8 @@ class VTK:
 
         default_ext = '.'+writer.GetDefaultFileExtension()
         ext = Path(fname).suffix
-        writer.SetFileName(str(Path(fname).expanduser())+(default_ext if default_ext != ext else ''))
+        fname_ = Path(str(Path(fname).expanduser())+(default_ext if default_ext != ext else ''))
+        writer.SetFileName(str(fname_))
 
         if compress:
             writer.SetCompressorTypeToZLib()
@@ -442,13 +529,21 @@ class VTK:
         writer.SetInputData(self.vtk_data)
 
         if parallel:
+            N_max = util._N_threads() if parallel is True else int(parallel)
+            _reap(max(N_max,1)-1)
             try:
                 mp_writer = mp.Process(target=self._write,args=(writer,))
                 mp_writer.start()
+                _pending.append((mp_writer,writing := _Writing(),fname_))
+                return writing
             except TypeError:
-                writer.Write()
-        else:
-            writer.Write()
+                pass
+
+        if writer.Write() != 1:
+            raise OSError(f'could not write "{fname_}"')
+        written: futures.Future = futures.Future()
+        written.set_result(fname_)
+        return written
 
 
     # Check https://blog.kitware.com/ghost-and-blanking-visibility-changes/ for missing data
@@ -457,7 +552,8 @@ class VTK:
             data: Union[None, np.ndarray, np.ma.MaskedArray] = None,
             info: Optional[str] = None,
             *,
-            table: Optional['Table'] = None) -> 'VTK':
+            table: Optional['Table'] = None,
+            inplace: bool = False) -> 'VTK':
         """
         Add new or replace existing point or cell data.
 
@@ -476,6 +572,10 @@ class VTK:
         table: damask.Table, optional
             Data to add or replace. Each table label is individually considered.
             Number of rows needs to match either number of cells or number of points.
+        inplace : bool, optional
+            Modify this VTK-based geometry instead of a copy.
+            Avoids copying the already attached data when adding
+            many arrays. Defaults to False.
 
         Returns
         -------
@@ -497,14 +597,14 @@ class VTK:
                 raise ValueError(f'data count mismatch ({N_data} ≠ {N_p} & {N_c})')
 
             data_ = data.reshape(N_data,-1) \
-                        .astype(np.single if data.dtype in [np.double,np.longdouble] else data.dtype)
+                        .astype(np.single if data.dtype in [np.double,np.longdouble] else data.dtype,copy=False)
 
             if data.dtype.type is np.str_:
                 d = vtkStringArray()
                 for s in np.squeeze(data_):
                     d.InsertNextValue(s)
             else:
-                d = numpy_to_vtk(data_,deep=True)
+                d = numpy_to_vtk(data_,deep=np.may_share_memory(data_,data))                        # temporary copy can be used
 
             d.SetName(label)
 
@@ -518,7 +618,7 @@ class VTK:
         if data is not None and table is not None:
             raise KeyError('cannot use both, data and table')
 
-        dup = self.copy()
+        dup = self if inplace else self.copy()
         if isinstance(data,np.ndarray):
             if label is not None:
                 _add_array(dup.vtk_data,
@@ -13,11 +13,14 @@ the following operations are required for tensorial data:
 """
 
 from typing import Tuple as _Tuple
+from functools import lru_cache as _lru_cache
 
 from scipy import spatial as _spatial
+from scipy import fft as _fft
 import numpy as _np
 
 from ._typehints import FloatSequence as _FloatSequence, IntSequence as _IntSequence
+from . import util as _util
 
 
 def _ks(size: _FloatSequence,
@@ -35,7 +38,20 @@ def _ks(size: _FloatSequence,
     first_order : bool, optional
         Correction for first order derivatives, defaults to False.
 
+    Returns
+    -------
+    k_s : numpy.ndarray, shape (:,:,:,3)
+        Wave numbers. The array is cached and therefore read-only.
+
     """
+    return _ks_cached(tuple(map(float,size)),tuple(map(int,cells)),bool(first_order))
+
+
+@_lru_cache(maxsize=2)
+def _ks_cached(size: _Tuple[float, float, float],
+               cells: _Tuple[int, int, int],
+               first_order: bool) -> _np.ndarray:
+    """Wave numbers operator of the most recently used grids."""
     k_sk = _np.where(_np.arange(cells[0])>cells[0]//2,
                      _np.arange(cells[0])-cells[0],_np.arange(cells[0]))/size[0]
     if cells[0]%2 == 0 and first_order: k_sk[cells[0]//2] = 0                                       # Nyquist freq=0 for even cells (Johnson, MIT, 2011)
@@ -46,7 +62,20 @@ def _ks(size: _FloatSequence,
 
     k_si = _np.arange(cells[2]//2+1)/size[2]
 
-    return _np.stack(_np.meshgrid(k_sk,k_sj,k_si,indexing = 'ij'), axis=-1)
+    k_s = _np.stack(_np.meshgrid(k_sk,k_sj,k_si,indexing = 'ij'), axis=-1)
+    k_s.flags.writeable = False
+    return k_s
+
+
+def _rfftn(f: _np.ndarray) -> _np.ndarray:
+    """Forward FFT over the spatial axes of all components using $OMP_NUM_THREADS (or 4) threads."""
+    return _fft.rfftn(f,axes=(0,1,2),workers=_util._N_threads())
+
+
+def _irfftn(f_fourier: _np.ndarray,
+            cells: _Tuple[int, ...]) -> _np.ndarray:
+    """Inverse FFT over the spatial axes of all components using $OMP_NUM_THREADS (or 4) threads."""
+    return _fft.irfftn(f_fourier,axes=(0,1,2),s=cells,workers=_util._N_threads())
 
 
 def curl(size: _FloatSequence,
@@ -74,11 +103,11 @@ def curl(size: _FloatSequence,
     e[0, 1, 2] = e[1, 2, 0] = e[2, 0, 1] = +1.0                                                     # Levi-Civita symbol
     e[0, 2, 1] = e[2, 1, 0] = e[1, 0, 2] = -1.0
 
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
+    f_fourier = _rfftn(f)
     curl_ = (_np.einsum('slm,ijkl,ijkm ->ijks' if n == 3 else
                         'slm,ijkl,ijknm->ijksn',e,k_s,f_fourier)*2.0j*_np.pi)                       # vector 3->3, tensor 3x3->3x3
 
-    return _np.fft.irfftn(curl_,axes=(0,1,2),s=f.shape[:3])
+    return _irfftn(curl_,f.shape[:3])
 
 
 def divergence(size: _FloatSequence,
@@ -102,11 +131,11 @@ def divergence(size: _FloatSequence,
     n = _np.prod(f.shape[3:])
     k_s = _ks(size,f.shape[:3],True)
 
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
+    f_fourier = _rfftn(f)
     divergence_ = (_np.einsum('ijkl,ijkl ->ijk' if n == 3 else
                               'ijkm,ijklm->ijkl', k_s,f_fourier)*2.0j*_np.pi)                       # vector 3->1, tensor 3x3->3
 
-    return _np.fft.irfftn(divergence_,axes=(0,1,2),s=f.shape[:3])
+    return _irfftn(divergence_,f.shape[:3])
 
 
 def gradient(size: _FloatSequence,
@@ -130,11 +159,11 @@ def gradient(size: _FloatSequence,
     n = _np.prod(f.shape[3:])
     k_s = _ks(size,f.shape[:3],True)
 
-    f_fourier = _np.fft.rfftn(f,axes=(0,1,2))
+    f_fourier = _rfftn(f)
     gradient_ = (_np.einsum('ijkl,ijkm->ijkm' if n == 1 else
                             'ijkl,ijkm->ijklm',f_fourier,k_s)*2.0j*_np.pi)                          # scalar 1->3, vector 3->3x3
 
-    return _np.fft.irfftn(gradient_,axes=(0,1,2),s=f.shape[:3])
+    return _irfftn(gradient_,f.shape[:3])
 
 
 def coordinates0_point(cells: _IntSequence,
@@ -191,12 +220,12 @@ def displacement_fluct_point(size: _FloatSequence,
     k_s_squared[0,0,0] = 1.0
 
     displacement = -_np.einsum('ijkml,ijkl,l->ijkm',
-                              _np.fft.rfftn(F,axes=(0,1,2)),
+                              _rfftn(F),
                               k_s,
                               _np.array([0.5j/_np.pi]*3),
                               ) / k_s_squared[...,_np.newaxis]
 
-    return _np.fft.irfftn(displacement,axes=(0,1,2),s=F.shape[:3])
+    return _irfftn(displacement,F.shape[:3])
 
 
 def displacement_avg_point(size: _FloatSequence,
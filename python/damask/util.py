@@ -583,6 +583,19 @@ def shapeblender(a: _Tuple[int, ...],
         return _np.broadcast_shapes(a_,_b)
 
 
+def _N_threads() -> int:
+    """
+    Number of threads according to $OMP_NUM_THREADS.
+
+    Only the outermost level of nested parallelism (e.g. '4,2')
+    is considered. Defaults to 4 if unset or invalid.
+    """
+    try:
+        return max(1,int(_os.environ.get('OMP_NUM_THREADS','').split(',')[0]))
+    except ValueError:
+        return 4
+
+
 def _docstringer(docstring: _Union[str, _Callable],
                  adopted_parameters: _Union[None, str, _Callable] = None,
                  adopted_return: _Union[None, str, _Callable] = None,
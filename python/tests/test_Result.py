@@ -25,6 +25,7 @@ from damask import VTK
 from damask import tensor
 from damask import mechanics
 from damask import grid_filters
+from damask import _vtk
 
 
 @pytest.fixture
@@ -172,6 +173,28 @@ class TestResult:
         in_file   = default.place('x')
         assert np.allclose(in_memory,in_file)
 
+    @pytest.mark.parametrize('formula,reference',
+                             [('#a#*#b#+np.sqrt(np.abs(#c#))',lambda a,b,c: a*b+np.sqrt(np.abs(c))),
+                              ('np.where(#a# > 0.5,#b#,-1.0)**2',lambda a,b,c: np.where(a > 0.5,b,-1.0)**2),
+                              ('np.sum(#a#*#b#,axis=(1,2))',lambda a,b,c: np.sum(a*b,axis=(1,2))),
+                              ('#c#[:,0]',lambda a,b,c: c[:,0])])
+    def test_compile_formula(self,formula,reference):
+        from damask._result import _compile_formula
+        a,b,c = np.random.rand(3,12345,3,3)
+        assert np.allclose(_compile_formula(formula)({'a':a,'b':b,'c':c}),reference(a,b,c))
+
+    @pytest.mark.parametrize('unparse',[True,False])
+    def test_compile_formula_numexpr(self,monkeypatch,unparse):
+        ne = pytest.importorskip('numexpr')
+        from damask._result import _compile_formula
+        evaluated = []
+        monkeypatch.setattr(ne,'evaluate',lambda *args,evaluate=ne.evaluate,**kwargs:
+                                          evaluated.append(args[0]) or evaluate(*args,**kwargs))
+        if not unparse: monkeypatch.delattr('ast.unparse')
+        a,b = np.random.rand(100,3,3),np.random.rand(100,3,3)
+        assert np.allclose(_compile_formula('np.sqrt(#a#)*2+np.abs(#b#)')({'a':a,'b':b}),np.sqrt(a)*2+np.abs(b))
+        assert evaluated == (['sqrt(_0) * 2 + abs(_1)'] if unparse else [])
+
     def test_add_calculation_invalid(self,default):
         default.add_calculation('np.linalg.norm(#F#,axis=0)','wrong_dim')
         assert default.get('wrong_dim') is None
@@ -322,6 +345,89 @@ class TestResult:
         in_file   = default.place('V(F)')
         assert np.allclose(in_memory,in_file)
 
+    @pytest.mark.parametrize('processes',[1,2,3])
+    def test_add_parallel(self,default,processes):
+        default.view(processes=processes).add_stress_Cauchy('P','F')
+        default.view(processes=processes).add_calculation('np.linalg.norm(#F#,axis=0)','wrong_dim')
+        in_memory = mechanics.stress_Cauchy(default.place('P'), default.place('F'))
+        in_file   = default.place('sigma')
+        assert np.array_equal(in_memory,in_file) and default.get('wrong_dim') is None
+
+    @pytest.mark.parametrize('processes',[1,2])
+    @pytest.mark.parametrize('memory_limit',[1,5000,False])
+    def test_add_blockwise(self,default,processes,memory_limit):
+        blockwise = default.view(processes=processes,memory_limit=memory_limit)
+        blockwise.add_stress_Cauchy('P','F')
+        blockwise.add_equivalent_Mises('sigma')
+        blockwise.add_calculation('np.linalg.norm(#F#,axis=0)','wrong_dim')
+        in_memory = mechanics.equivalent_stress_Mises(mechanics.stress_Cauchy(default.place('P'),
+                                                                               default.place('F')))
+        in_file   = default.place('sigma_vM')
+        assert np.allclose(in_memory,in_file) and default.get('wrong_dim') is None
+
+    def test_add_blockwise_failed_write(self,default):
+        def wrong_rows(F):
+            return {'data':np.repeat(F['data'],2,axis=0)[:50],'label':'x',
+                    'meta':{'unit':'1','description':'wrong shape of last block','creator':'test'}}
+        default.view(memory_limit=50*72)._add_generic_pointwise(wrong_rows,{'F':'F'})
+        assert default.get('x') is None
+        default.add_calculation('#F#','x','1','F')
+        assert np.array_equal(default.place('x'),default.place('F'))
+
+    @pytest.mark.parametrize('memory_limit',[0,-1,True])
+    def test_view_invalid_memory_limit(self,default,memory_limit):
+        with pytest.raises(ValueError):
+            default.view(memory_limit=memory_limit)
+
+    @pytest.mark.parametrize('storage',[{'chunk_size':100,'compression':'lzf','fletcher32':False},
+                                        {'chunk_size':100,'compression':None,'shuffle':False},
+                                        {'chunk_size':100,'compression_opts':1}])
+    def test_add_storage(self,default,storage):
+        default.view(storage=storage).add_stress_Cauchy('P','F')
+        assert np.array_equal(mechanics.stress_Cauchy(default.place('P'),default.place('F')),default.place('sigma'))
+        with h5py.File(default.fname) as f:
+            dataset = f['/'.join([default._visible['increments'][0],'phase/pheno_fcc/mechanical/sigma'])]
+            policy = {**default._storage,**storage}
+            assert dataset.compression == policy['compression'] and dataset.fletcher32 == policy['fletcher32']
+            assert dataset.shuffle == policy['shuffle'] and dataset.chunks == (11,3,3)
+            assert dataset.compression_opts == (1 if policy['compression'] == 'gzip' else None)
+
+    @pytest.mark.parametrize('storage',[{'compression':'szip'},{'level':3},{'chunk_size':0}])
+    def test_view_invalid_storage(self,default,storage):
+        with pytest.raises(ValueError):
+            default.view(storage=storage)
+
+    def test_benchmark_storage(self,default,tmp_path):
+        benchmark = default.benchmark_storage('F',[{},{'compression':'lzf'}],target_dir=tmp_path/'benchmark')
+        assert [b['storage']['compression'] for b in benchmark] == ['gzip','lzf']
+        assert all(b['write'] > 0 and b['read'] > 0 and b['ratio'] > 0 for b in benchmark)
+        assert os.listdir(tmp_path/'benchmark') == []
+
+    def test_view_invalid_processes(self,default):
+        with pytest.raises(ValueError):
+            default.view(processes=0)
+
+    @pytest.mark.parametrize('processes',[1,2])
+    def test_add_many(self,default,processes):
+        default.view(processes=processes).add_many([('equivalent_Mises','sigma'),
+                                                    'add_stress_Cauchy',
+                                                    ('strain','F',{'t':'U','m':0.5}),
+                                                    ('equivalent_Mises','epsilon_U^0.5(F)'),
+                                                    ('rotation','F'),
+                                                    ('norm','invalid')])
+        sigma   = mechanics.stress_Cauchy(default.place('P'), default.place('F'))
+        epsilon = mechanics.strain(default.place('F'),'U',0.5)
+        assert np.allclose(sigma,default.place('sigma'))
+        assert np.allclose(mechanics.equivalent_stress_Mises(sigma),default.place('sigma_vM'))
+        assert np.allclose(mechanics.equivalent_strain_Mises(epsilon),default.place('epsilon_U^0.5(F)_vM'))
+        assert np.allclose(mechanics.rotation(default.place('F')).as_matrix(),default.place('R(F)'))
+
+    @pytest.mark.parametrize('quantities',[['invalid'],['many'],[('curl','F')]])
+    def test_add_many_invalid(self,default,quantities):
+        with pytest.raises((ValueError,NotImplementedError)):
+            default.add_many(quantities)
+        assert default._pipeline is None
+
     def test_add_invalid_dataset(self,default):
         with pytest.raises(TypeError):
             default.add_calculation('#invalid#*2')
@@ -363,6 +469,19 @@ class TestResult:
         in_memory = grid_filters.gradient(default.size,x.reshape(tuple(default.cells)+x.shape[1:])).reshape(in_file.shape)
         assert (in_file == in_memory).all()
 
+    def test_add_gradient_increments(self,default):
+        r = default.view(increments=True)
+        r.add_calculation('#F#[:,:,1]','x','1','just a vector')
+        r.add_gradient('x')
+        placed = r.place(['x','gradient(x)'],flatten=False)
+        for inc in placed.values():
+            x = inc['phase']['mechanical']['x']
+            in_memory = grid_filters.gradient(r.size,x.reshape(tuple(r.cells)+x.shape[1:])).reshape(-1,3,3)
+            assert (inc['phase']['mechanical']['gradient(x)'] == in_memory).all()
+        at_cell_ph,in_data_ph,_,_ = r._mappings()
+        for label,d in r.view(increments=-1).get('gradient(x)').items():
+            assert np.array_equal(d[in_data_ph[0][label]],placed[r.increments[-1]]['phase']['mechanical']['gradient(x)'][at_cell_ph[0][label]])
+
     @pytest.mark.parametrize('overwrite',['off','on'])
     def test_add_overwrite(self,default,overwrite):
         last = default.view(increments=-1)
@@ -388,6 +507,66 @@ class TestResult:
         else:
             assert created_first == created_second and not np.allclose(last.place('sigma'),311.)
 
+    def test_add_fingerprint(self,default):
+        default = default.view(phases=default.phases[0])
+        default.add_many([('stress_Cauchy',),('equivalent_Mises','sigma')])
+        first = {k:v.dtype.metadata for k,v in default.get(['sigma','sigma_vM']).items()}
+        time.sleep(1)
+        default.add_many([('stress_Cauchy',),('equivalent_Mises','sigma')])
+        default.add_stress_Cauchy()
+        assert first == {k:v.dtype.metadata for k,v in default.get(['sigma','sigma_vM']).items()}
+        assert all('fingerprint' in m for m in first.values())
+
+        unprotected = default.view(protected=False)
+        unprotected.add_many([('stress_Cauchy',),('equivalent_Mises','sigma')])
+        assert first == {k:v.dtype.metadata for k,v in default.get(['sigma','sigma_vM']).items()}
+
+        sigma = default.get('sigma')
+        unprotected.add_calculation('2*#P#','P','Pa','doubled')
+        default.add_many([('stress_Cauchy',),('equivalent_Mises','sigma')])
+        assert np.allclose(default.get('sigma'),2*sigma)
+        assert np.allclose(default.get('sigma_vM'),mechanics.equivalent_stress_Mises(2*sigma))
+        assert all(v.dtype.metadata['overwritten'] for v in default.get(['sigma','sigma_vM']).values())
+
+    def test_add_fingerprint_code(self,default):
+        def twice(F):
+            return {'data':2*F['data'],'label':'x','meta':{'unit':'1','description':'','creator':'test'}}
+        default._add_generic_pointwise(twice,{'F':'F'})
+        first = default.place('x').dtype.metadata
+        def twice(F):                                                                               # noqa
+            return {'data':3*F['data'],'label':'x','meta':{'unit':'1','description':'','creator':'test'}}
+        default.view(protected=False)._add_generic_pointwise(twice,{'F':'F'})
+        second = default.place('x').dtype.metadata
+        assert first['fingerprint'] != second['fingerprint']
+        assert np.allclose(default.place('x'),3*default.place('F'))
+        time.sleep(1)
+        default._add_generic_pointwise(twice,{'F':'F'})
+        assert default.place('x').dtype.metadata == second
+
+    def test_session(self,default):
+        last = default.view(increments=-1)
+        with default.session():
+            default.add_stress_Cauchy()
+            last.add_equivalent_Mises('sigma')
+            in_session = last.place('sigma_vM')
+            assert default._session.handle is last._session.handle is not None
+        assert default._session.handle is None
+        in_memory = mechanics.equivalent_stress_Mises(last.place('sigma'))
+        assert np.allclose(in_memory,in_session)
+
+    def test_session_nested(self,default):
+        with default.session():
+            with default.session():
+                F = default.place('F')
+            assert default._session.handle is not None
+        assert default._session.handle is None and np.allclose(F,default.place('F'))
+
+    def test_session_reopen_in_use(self,default):
+        with default.session(), default._open('r') as f:
+            with pytest.raises(RuntimeError):
+                default.add_stress_Cauchy()
+            assert f.id.valid and default.place('F') is not None
+
     @pytest.mark.parametrize('allowed',['off','on'])
     def test_rename(self,default,allowed):
         if allowed == 'on':
@@ -420,6 +599,64 @@ class TestResult:
             b = default.coordinates0_node.reshape(tuple(default.cells+1)+(3,),order='F')
         assert np.allclose(a,b)
 
+    @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5',
+                                      '12grains6x7x8_tensionY.hdf5',
+                                      'check_compile_job1.hdf5'])
+    def test_index(self,res_path,tmp_path,fname):
+        shutil.copy(res_path/fname,tmp_path)
+        ref = Result(tmp_path/fname)
+        Result(tmp_path/fname,index=True)
+        r = Result(tmp_path/fname,index=True)
+        assert r._session.index == tmp_path/f'{fname}.damask-index'
+        for attr in ['increments','times','phases','homogenizations','fields','phase','homogenization',
+                     'N_materialpoints','N_constituents','structured','version_major','version_minor']:
+            assert np.array_equal(getattr(r,attr),getattr(ref,attr))
+        for m,m_ref in zip(r._mappings(),ref._mappings()):
+            for d,d_ref in zip(m if isinstance(m,list) else [m],m_ref if isinstance(m_ref,list) else [m_ref]):
+                assert d.keys() == d_ref.keys() and all(np.array_equal(d[k],d_ref[k]) for k in d)
+        assert str(r.place('*')) == str(ref.place('*'))
+
+    def test_index_outdated(self,default):
+        Result(default.fname,index=True)
+        default.add_calculation('2.0*#F#','twice_F')
+        assert Result(default.fname,index=True)._session.index is None
+        assert Result(default.fname,index=True)._session.index is not None
+
+    def test_index_non_ASCII(self,default):
+        with h5py.File(default.fname,'a') as f:
+            cell_to = f['cell_to/phase'][()]
+            label = np.char.decode(cell_to['label'],'utf-8')
+            label[label=='pheno_fcc'] = 'phäno_fcc'
+            renamed = np.empty(cell_to.shape,[('label','S16'),('entry',cell_to.dtype['entry'])])
+            renamed['label'],renamed['entry'] = np.char.encode(label,'utf-8'),cell_to['entry']
+            del f['cell_to/phase']
+            f['cell_to/phase'] = renamed
+            for inc in default.view(increments='*').increments:
+                f.move(f'{inc}/phase/pheno_fcc',f'{inc}/phase/phäno_fcc')
+        ref = Result(default.fname)
+        Result(default.fname,index=True)
+        r = Result(default.fname,index=True)
+        assert r._session.index is not None and 'phäno_fcc' in r.phases
+        assert np.array_equal(r.phase,ref.phase) and str(r.place('F')) == str(ref.place('F'))
+
+    @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5',
+                                      '12grains6x7x8_tensionY.hdf5'])
+    def test_mappings(self,res_path,fname):
+        r = Result(res_path/fname)
+        at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = r._mappings()
+        with h5py.File(r.fname,'r') as f:
+            entry_ph = f['cell_to/phase']['entry']
+            entry_ho = f['cell_to/homogenization']['entry']
+        for c in range(r.N_constituents):
+            for label in r.phases:
+                assert np.array_equal(at_cell_ph[c][label],np.where(r.phase[:,c] == label)[0])
+                assert np.array_equal(in_data_ph[c][label],entry_ph[at_cell_ph[c][label],c])
+        for label in r.homogenizations:
+            assert np.array_equal(at_cell_ho[label],np.where(r.homogenization == label)[0])
+            assert np.array_equal(in_data_ho[label],entry_ho[at_cell_ho[label]])
+        subset = r.view(phases=r.phases[-1:])._mappings()
+        assert list(subset[0][0].keys()) == r.phases[-1:] and subset[0][0][r.phases[-1]] is at_cell_ph[0][r.phases[-1]]
+
     @pytest.mark.parametrize('output',['F','*',['P'],['P','F']],ids=range(4))
     @pytest.mark.parametrize('fname',['12grains6x7x8_tensionY.hdf5',
                                       '4grains2x4x3_compressionY.hdf5',
@@ -468,6 +705,118 @@ class TestResult:
         single_phase.export_VTK(mode='point',target_dir=export_dir,parallel=False)
         assert set(os.listdir(export_dir)) == set([f'{single_phase.fname.stem}_inc{i:02}.vtp' for i in range(0,40+1,4)])
 
+    @pytest.mark.parametrize('mode',['point','cell'])
+    def test_vtk_processes(self,tmp_path,default,patch_execution_stamp,mode):
+        r = default.view(increments='*')
+        r.export_VTK(['F','O'],mode=mode,target_dir=tmp_path/'serial',parallel=False)
+        r.view(processes=3).export_VTK(['F','O'],mode=mode,target_dir=tmp_path/'pool')
+        assert sorted(os.listdir(tmp_path/'serial')) == sorted(os.listdir(tmp_path/'pool'))
+        for fname in os.listdir(tmp_path/'serial'):
+            assert VTK.load(tmp_path/'serial'/fname) == VTK.load(tmp_path/'pool'/fname)
+
+    def test_vtk_parallel(self,tmp_path,default,monkeypatch):
+        default.export_VTK('F',target_dir=tmp_path/'parallel',parallel=2)
+        assert not _vtk._pending
+        assert len(os.listdir(tmp_path/'parallel')) == len(default.increments)
+        for fname in os.listdir(tmp_path/'parallel'):
+            assert VTK.load(tmp_path/'parallel'/fname).N_cells == default.N_materialpoints
+        def fail(writer):
+            raise OSError
+        monkeypatch.setattr(VTK,'_write',staticmethod(fail))
+        with pytest.raises(OSError):
+            default.export_VTK('F',target_dir=tmp_path/'failed',parallel=2)
+
+    def test_vtk_processes_session(self,tmp_path,default):
+        r = default.view(increments='*')
+        with r.session(), r._open('r') as f:
+            r.view(processes=2).export_VTK('F',target_dir=tmp_path/'pool',parallel=False)
+            assert f.id.valid and np.array_equal(f[r.increments[-1]+'/geometry/u_p'],
+                                                 r.view(increments=-1).place('u_p'))
+        assert len(os.listdir(tmp_path/'pool')) == len(r.increments)
+
+    @pytest.mark.parametrize('roi',[[[1,2,3],[4,6,5]],[[0,0,0],[6,7,1]],[[.1,.2,.3],[.5,.5,.5]]],ids=range(3))
+    @pytest.mark.parametrize('constituents',[None,0],ids=range(2))
+    def test_place_roi(self,default,roi,constituents):
+        lower,upper = default._region(roi)[0][[0,-1]]
+        lower,upper = [np.array(np.unravel_index(i,default.cells,order='F')) for i in (lower,upper)]
+        full = default.place(constituents=constituents,flatten=False)
+        cropped = default.place(constituents=constituents,flatten=False,roi=roi)
+        def crop(d):
+            if type(d) is dict: return {k:crop(v) for k,v in d.items()}
+            cells = default.cells+(1 if len(d) != np.prod(default.cells) else 0)
+            d_ = d.reshape(tuple(cells)+d.shape[1:],order='F')
+            return d_[tuple(slice(l,u+1+(cells[0]-default.cells[0])) for l,u in zip(lower,upper))]\
+                   .reshape((-1,)+d.shape[1:],order='F')
+        def assert_equal(a,b):
+            assert a.keys() == b.keys()
+            for k in a:
+                if type(a[k]) is dict:
+                    assert_equal(a[k],b[k])
+                else:
+                    assert a[k].shape == b[k].shape and np.ma.allequal(a[k],b[k]) \
+                       and np.array_equal(np.ma.getmaskarray(a[k]),np.ma.getmaskarray(b[k]))
+        assert_equal(cropped,crop(full))
+
+    @pytest.mark.parametrize('roi',[[[0,0,0],[1,1]],[[3,3,3],[3,4,4]],[[1.,1.,1.],[2.,2.,2.]]])
+    def test_roi_invalid(self,default,roi):
+        with pytest.raises(ValueError):
+            default.place(roi=roi)
+
+    def test_roi_unstructured(self,res_path):
+        with pytest.raises(NotImplementedError):
+            Result(res_path/'check_compile_job1.hdf5').place(roi=[[0,0,0],[1,1,1]])
+
+    @pytest.mark.parametrize('mode',['point','cell'])
+    def test_vtk_roi(self,tmp_path,default,mode):
+        roi = [[1,2,3],[4,6,5]]
+        default.export_VTK('F',mode=mode,target_dir=tmp_path/'roi',roi=roi,parallel=False)
+        v = VTK.load(tmp_path/'roi'/os.listdir(tmp_path/'roi')[0])
+        placed = default.place('F',roi=roi)
+        assert (v.N_points if mode == 'point' else v.N_cells) == 3*4*2
+        assert np.allclose(v.get('phase/mechanical/F / 1').reshape(placed.shape),placed.filled(np.nan),equal_nan=True)
+        if mode == 'cell':
+            assert np.allclose(v.vtk_data.GetOrigin(),default.size/default.cells*roi[0])
+            assert np.allclose(v.vtk_data.GetDimensions(),np.array(roi[1])-roi[0]+1)
+
+    @pytest.mark.parametrize('mode',['point','cell'])
+    @pytest.mark.parametrize('fname',['12grains6x7x8_tensionY.hdf5','check_compile_job1.hdf5'])
+    @pytest.mark.skipif(vtkVersion.GetVTKMajorVersion()*100+vtkVersion.GetVTKMinorVersion()<903,
+                        reason='no time steps in VTKHDF')
+    def test_export_VTKHDF(self,tmp_path,res_path,fname,mode):
+        from vtkmodules.vtkIOHDF import vtkHDFReader
+        result = Result(res_path/fname).view(increments=[0,-1])
+        result.export_VTKHDF(mode=mode,target_dir=tmp_path)
+        result.export_VTK(mode=mode,target_dir=tmp_path,parallel=False)
+        reader = vtkHDFReader()
+        reader.SetFileName(str(tmp_path/f'{result.fname.stem}.vtkhdf'))
+        reader.UpdateInformation()
+        assert reader.GetNumberOfSteps() == len(result.increments)
+        for step,fname_VTK in enumerate(sorted([f for f in os.listdir(tmp_path) if not f.endswith('.vtkhdf')])):
+            reader.SetStep(step)
+            reader.Update()
+            ref = VTK.load(tmp_path/fname_VTK)
+            cur = VTK(reader.GetOutput())
+            assert cur.N_cells == ref.N_cells and cur.N_points == ref.N_points
+            for labels in ref.labels.values():
+                for label in labels:
+                    assert np.allclose(cur.get(label.replace('/','\u2215')),ref.get(label),equal_nan=True)
+
+    @pytest.mark.parametrize('storage',[{'chunk_size':100,'compression':'lzf','shuffle':True,'fletcher32':False},
+                                        {'chunk_size':100,'compression':None,'shuffle':False,'fletcher32':True}])
+    def test_export_VTKHDF_storage(self,tmp_path,default,storage):
+        default.view(storage=storage).export_VTKHDF(['F'],target_dir=tmp_path)
+        with h5py.File(tmp_path/f'{default.fname.stem}.vtkhdf') as f:
+            F = f['VTKHDF/CellData/phase\u2215mechanical\u2215F \u2215 1']
+            assert (F.compression,F.shuffle,F.fletcher32) == \
+                   (storage['compression'],storage['shuffle'],storage['fletcher32'])
+
+    def test_export_VTKHDF_point(self,tmp_path,default):
+        default.export_VTKHDF(['F'],mode='point',target_dir=tmp_path)
+        with h5py.File(tmp_path/f'{default.fname.stem}.vtkhdf') as f:
+            assert len(f['VTKHDF/CellData']) == len(f['VTKHDF/Steps/CellDataOffsets']) == 0
+            assert set(f['VTKHDF/PointData']) == set(f['VTKHDF/Steps/PointDataOffsets']) \
+                                              == {'u','phase\u2215mechanical\u2215F \u2215 1'}
+
     def test_export_DREAM3D(self,tmp_path,res_path,h5py_dataset_iterator):
         result = Result(res_path/'2phase_irregularGrid_tensionX_material.hdf5').view(increments=0)  # compare the initial data only
         result.export_DREAM3D(target_dir=tmp_path)
@@ -530,9 +879,19 @@ class TestResult:
         bounds_vti = reader_vti.GetOutput().GetBounds()
         assert dim_vti == dim_xdmf and bounds_vti == bounds_xdmf
 
-    def test_XDMF_invalid(self,default):
+    def test_XDMF_invalid(self,res_path):
         with pytest.raises(NotImplementedError):
-            default.export_XDMF()
+            Result(res_path/'check_compile_job1.hdf5').export_XDMF()
+
+    @pytest.mark.parametrize('constituents',[None,0])
+    def test_XDMF_multiphase(self,tmp_path,default,constituents):
+        default.export_XDMF(['F','O'],target_dir=tmp_path/'xdmf',constituents=constituents)
+        placed = default.place(['F','O'],constituents=constituents)
+        with h5py.File(tmp_path/'xdmf'/default.fname.with_name(default.fname.stem+'_XDMF.hdf5').name) as f:
+            inc = default._visible['increments'][0]
+            for label,data in placed.items():
+                name = '/'.join([inc,'phase','mechanical',label])
+                assert np.array_equal(f[name][()],data.filled(np.nan if data.dtype.kind == 'f' else 0),equal_nan=True)
 
     def test_XDMF_custom_path(self,single_phase,tmp_path):
         os.chdir(tmp_path)
@@ -617,6 +976,142 @@ class TestResult:
             ref = pickle.load(f)
             assert cur is None if ref is None else dict_equal(cur,ref)
 
+    @pytest.mark.parametrize('view',[{},{'phases':['A','C']},{'increments':[2,4]}],ids=range(3))
+    @pytest.mark.parametrize('constituents',[None,1],ids=range(2))
+    @pytest.mark.parametrize('rows',[np.array([7,1,1,5,-1]),slice(3,17),slice(20,2,-3),slice(5,5),
+                                     5,-1,(slice(2,9),0),(np.array([[4,3],[2,1]]),Ellipsis,0)],ids=range(8))
+    def test_lazy(self,res_path,view,constituents,rows):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(**view)
+        def materialize(d,rows):
+            return {k:materialize(v,rows) if type(v) is dict else v[rows] for k,v in d.items()}
+        def equal(d1,d2):
+            return d1.keys() == d2.keys() and \
+                   all(equal(d1[k],d2[k]) if type(d1[k]) is dict else
+                       np.array_equal(np.ma.getmaskarray(d1[k]),np.ma.getmaskarray(d2[k])) and
+                       np.allclose(np.ma.filled(d1[k],0),np.ma.filled(d2[k],0)) for k in d1)
+
+        eager = result.get(['F','P','u_p'],flatten=False)
+        lazy = result.get(['F','P','u_p'],flatten=False,lazy=True)
+        assert equal(materialize(lazy,slice(None)),eager)
+        assert equal(materialize(lazy,rows),materialize(eager,rows))
+
+        eager = result.place(['F','O','u_p'],constituents=constituents)
+        lazy = result.place(['F','O','u_p'],constituents=constituents,lazy=True)
+        assert equal(materialize(lazy,slice(None)),eager)
+        assert equal(materialize(lazy,rows),materialize(eager,rows))
+
+    @pytest.mark.parametrize('lazy',[True,False])
+    def test_dtype(self,res_path,lazy):
+        result = Result(res_path/'12grains6x7x8_tensionY.hdf5').view(increments=-1)
+        def compare(reduced,full):
+            for k,f in full.items():
+                if type(f) is dict:
+                    compare(reduced[k],f)
+                else:
+                    r = reduced[k][:]
+                    assert r.dtype == np.float32 and r.dtype.metadata['unit'] == f.dtype.metadata['unit']
+                    assert np.array_equal(r,f.astype(np.float32))
+
+        compare(result.get(['F','O','u_n'],lazy=lazy,dtype=np.float32),result.get(['F','O','u_n']))
+        compare(result.place(['F','O','u_n'],lazy=lazy,dtype=np.float32),result.place(['F','O','u_n']))
+
+    def test_dtype_integer(self,default):
+        default.add_calculation('np.ones(len(#F#),np.int32)','one')
+        assert default.place('one',dtype=np.float32).dtype == np.int32
+
+    def test_vtk_dtype(self,tmp_path,default):
+        default.export_VTK('F',target_dir=tmp_path/'vtk',parallel=False,dtype=np.float32)
+        v = VTK.load(tmp_path/'vtk'/os.listdir(tmp_path/'vtk')[0])
+        assert v.get('phase/mechanical/F / 1').dtype == np.float32
+
+    def test_profile(self,tmp_path,default):
+        completed = []
+        with default.profile(lambda stage,t: completed.append(stage)) as stats:
+            default.add_stress_Cauchy()
+            F = default.place('F')
+            default.export_VTK('sigma',target_dir=tmp_path/'vtk',parallel=False)
+        assert {'add','compute','read','write','place','convert','export_VTK'} == set(stats.time)
+        assert len(completed) == sum(stats.calls.values())
+        assert stats.bytes_read['/increment_40/phase/pheno_fcc/mechanical/F'] > 0
+        assert sum(stats.bytes_read.values()) >= F.data.nbytes
+        assert stats.bytes_written['/increment_40/phase/pheno_bcc/mechanical/sigma'] > 0
+        assert any(str(tmp_path/'vtk') in k for k in stats.bytes_written)
+        assert stats.file_opens > 0 and stats.peak_memory > 0 and stats.wall_time >= sum(stats.time.values())
+
+    @pytest.mark.parametrize('tracing',[True,False])
+    def test_profile_no_reset_peak(self,monkeypatch,default,tracing):
+        import tracemalloc
+        monkeypatch.delattr('tracemalloc.reset_peak',raising=False)
+        if tracing:
+            tracemalloc.start()
+            allocated = np.ones(2**20)                                                              # raise the peak
+            del allocated
+        try:
+            with default.profile() as stats:
+                default.get('F')
+        finally:
+            if tracing: tracemalloc.stop()
+        assert stats.peak_memory is None if tracing else stats.peak_memory > 0
+        assert 'peak memory' in repr(stats)
+
+    def test_profile_inactive(self,default):
+        with default.profile() as stats:
+            pass
+        default.get('F')
+        assert stats.calls == {} and stats.file_opens == 0
+
+    @pytest.mark.parametrize('view',[{},{'phases':['A']},{'increments':[2,4]}],ids=range(3))
+    @pytest.mark.parametrize('constituents',[None,1,3],ids=range(3))
+    @pytest.mark.parametrize('points',[[7,1,1,23],5],ids=range(2))
+    def test_time_series(self,res_path,view,constituents,points):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5').view(**view)
+        history = result.time_series(['F','P','u_p'],points,flatten=False,constituents=constituents)
+        for i,inc in enumerate(result.increments):
+            placed = result.view(increments=inc).place(['F','P','u_p'],flatten=False,constituents=constituents)
+            for ty in placed[inc]:
+                for field,data in placed[inc][ty].items():
+                    for out,d in (data.items() if type(data) is dict else [(field,data)]):
+                        h = history[ty][field][out] if type(data) is dict else history[ty][field]
+                        assert len(h) == len(result.times)
+                        assert np.ma.allequal(h[i],d[np.atleast_1d(points)]) and \
+                               np.array_equal(np.ma.getmaskarray(h[i]),np.ma.getmaskarray(d[np.atleast_1d(points)]))
+
+    def test_time_series_constituents(self,res_path):
+        result = Result(res_path/'4grains2x4x3_compressionY.hdf5')
+        history = result.time_series('F',[3,5],constituents=[0,3])
+        for c in [0,3]:
+            assert np.ma.allequal(history[f'F#{c}'],result.time_series('F',[3,5],constituents=c))
+
+    @pytest.mark.parametrize('points',[[-1],[0,24]])
+    def test_time_series_invalid(self,res_path,points):
+        with pytest.raises(ValueError):
+            Result(res_path/'4grains2x4x3_compressionY.hdf5').time_series('F',points)
+
+    @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5','12grains6x7x8_tensionY.hdf5'])
+    def test_reduce(self,res_path,fname):
+        r = Result(res_path/fname)
+        r = r.view(increments=r._increments[::2])
+        s = r.reduce('F',['mean','std','min','max','histogram'],bins=5)
+        for i,inc in enumerate(r._visible['increments']):
+            F = np.concatenate([v['mechanical']['F'] for v in r.view(increments=inc).get('F',flatten=False)[inc]['phase'].values()])
+            assert np.allclose(s['mean'][i],np.average(F,axis=0)) and np.allclose(s['std'][i],np.std(F,axis=0))
+            assert np.all(s['min'][i] == np.min(F,axis=0)) and np.all(s['max'][i] == np.max(F,axis=0))
+            assert np.allclose(s['histogram'][i].sum(axis=-1),len(F)/r.N_constituents)
+        assert s['bin_edges'].shape == (6,)
+
+    def test_reduce_weights(self,default):
+        default.add_calculation('np.where(#F#[:,0,0] > 1.01,2.,1.)','v')
+        s = default.reduce('F','mean',weights='v')
+        inc = default._visible['increments'][0]
+        F = np.concatenate([v['mechanical']['F'] for v in default.get('F',flatten=False)[inc]['phase'].values()])
+        w = np.concatenate([v['mechanical']['v'] for v in default.get('v',flatten=False)[inc]['phase'].values()])
+        assert np.allclose(s[0],np.average(F,axis=0,weights=w))
+
+    @pytest.mark.parametrize('kwargs',[{'ops':'median'},{'weights':'v'}])
+    def test_reduce_invalid(self,default,kwargs):
+        with pytest.raises(ValueError):
+            default.reduce('F',**kwargs)
+
     def test_simulation_setup_files(self,default):
         assert set(default.simulation_setup_files) == set(['12grains6x7x8.vti',
                                                             'material.yaml',
@@ -679,6 +1174,56 @@ class TestResult:
         assert str(r.get()) == str(r_exp.get())
         assert str(r.place()) == str(r_exp.place())
 
+    @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5',
+                                      '12grains6x7x8_tensionY.hdf5',
+                                      'check_compile_job1.hdf5',])
+    def test_export_DADF5_link(self,res_path,tmp_path,fname):
+        r = Result(res_path/fname)
+        r = r.view(increments = random.sample(r._increments,np.random.randint(1,len(r._increments))))
+        (tmp_path/'link').mkdir()
+        r.export_DADF5(tmp_path/'link'/fname,output=['F','u_n'],link=True)
+        r_exp = Result(tmp_path/'link'/fname)
+        assert str(r.get(['F','u_n'])) == str(r_exp.get(['F','u_n']))
+        assert str(r.place(['F','u_n'])) == str(r_exp.place(['F','u_n']))
+        with h5py.File(tmp_path/'link'/fname) as f:
+            assert f['/'.join([r._visible['increments'][0],'geometry','u_n'])].is_virtual
+
+    def test_export_DADF5_link_regrid(self,default,tmp_path):
+        with pytest.raises(ValueError):
+            default.export_DADF5(tmp_path/'regridded.hdf5',mapping=np.zeros(default.cells,int),link=True)
+
+    def test_export_DADF5_regrid_parallel(self,default,tmp_path):
+        from scipy import interpolate
+        default.add_stress_Cauchy()
+        m = grid_filters.regrid(default.size,np.broadcast_to(np.eye(3),tuple(default.cells)+(3,3)),default.cells*2)
+        default.export_DADF5(tmp_path/'serial.hdf5',mapping=m)
+        default.view(processes=3).export_DADF5(tmp_path/'parallel.hdf5',mapping=m)
+        with h5py.File(default.fname) as f_in, \
+             h5py.File(tmp_path/'serial.hdf5') as f_s, h5py.File(tmp_path/'parallel.hdf5') as f_p:
+            inc = default._visible['increments'][0]
+            for name in ['geometry/u_p','geometry/u_n','phase/pheno_fcc/mechanical/sigma']:
+                name = '/'.join([inc,name])
+                assert np.array_equal(f_s[name],f_p[name])
+                assert (f_s[name].compression,f_s[name].shuffle,f_s[name].fletcher32) == \
+                       (f_in[name].compression,f_in[name].shuffle,f_in[name].fletcher32)
+            u_p = f_in[inc]['geometry/u_p'][()][m.flatten(order='F')]
+            delta = default.size/np.array(m.shape)
+            c_0_p = tuple([np.linspace(delta[i]/2,default.size[i]-delta[i]/2,m.shape[i]) for i in [0,1,2]])
+            interpolator = interpolate.RegularGridInterpolator(c_0_p,np.reshape(u_p,tuple(m.shape)+(3,)),
+                                                               fill_value=None,bounds_error=False)
+            assert np.allclose(f_s[inc]['geometry/u_n'],
+                               interpolator(grid_filters.coordinates0_node(m.shape,default.size).reshape(-1,3)))
+
+    def test_export_DADF5_regrid_parallel_session(self,default,tmp_path):
+        m = grid_filters.regrid(default.size,np.broadcast_to(np.eye(3),tuple(default.cells)+(3,3)),default.cells*2)
+        default.export_DADF5(tmp_path/'serial.hdf5',mapping=m)
+        with default.session(), default._open('r') as f:
+            default.view(processes=2).export_DADF5(tmp_path/'parallel.hdf5',mapping=m)
+            assert f.id.valid and default.place('F') is not None
+        with h5py.File(tmp_path/'serial.hdf5') as f_s, h5py.File(tmp_path/'parallel.hdf5') as f_p:
+            name = default._visible['increments'][0]+'/phase/pheno_fcc/mechanical/F'
+            assert np.array_equal(f_s[name],f_p[name])
+
     @pytest.mark.parametrize('fname',['4grains2x4x3_compressionY.hdf5',
                                       '6grains6x7x8_single_phase_tensionY.hdf5'])
     def test_export_DADF5_name_clash(self,res_path,tmp_path,fname):
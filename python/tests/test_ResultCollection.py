@@ -0,0 +1,106 @@
+import shutil
+
+import pytest
+import h5py
+import numpy as np
+
+from damask import Result
+from damask import VTK
+from damask import ResultCollection
+from damask import _vtk
+
+
+@pytest.fixture
+def res_path(res_path_base):
+    """Directory containing testing resources."""
+    return res_path_base/'Result'
+
+@pytest.fixture
+def restarted(tmp_path,res_path):
+    """Result file split into two overlapping files of a restarted run."""
+    fname = '12grains6x7x8_tensionY.hdf5'
+    for name,increments in [('first.hdf5',range(24,41,4)),('second.hdf5',range(0,16,4))]:
+        shutil.copy(res_path/fname,tmp_path/name)
+        with h5py.File(tmp_path/name,'a') as f:
+            for i in increments: del f[f'increment_{i}']
+    return [tmp_path/'first.hdf5',tmp_path/'second.hdf5']
+
+
+class TestResultCollection:
+
+    def test_restart_times(self,res_path,restarted):
+        c = ResultCollection([restarted,res_path/'12grains6x7x8_tensionY.hdf5'])
+        assert len(c) == 2 and np.array_equal(c.times[0],c.times[1])
+        assert c[0][0].times == [0.,2.,4.,6.] and c[0][1].times[0] == 8.
+
+    def test_restart_invalid(self,restarted):
+        with pytest.raises(ValueError):
+            ResultCollection([restarted[::-1]])
+
+    @pytest.mark.parametrize('processes',[1,2])
+    def test_reduce(self,res_path,restarted,processes):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([restarted,fname,restarted[0]]).view(processes=processes)
+        reduced = c.reduce('F',['mean','max'])
+        ref = Result(fname).reduce('F',['mean','max'])
+        assert reduced['mean'].shape == (3,11,3,3)
+        assert np.allclose(reduced['mean'][0],ref['mean']) and np.allclose(reduced['max'][1],ref['max'])
+        assert np.all(reduced['mean'].mask[2,6:]) and not np.any(reduced['mean'].mask[2,:6])
+
+    def test_reduce_histogram(self,res_path):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        bins = np.linspace(0.,1.5,6)
+        reduced = ResultCollection([fname,fname]).view(times=20.).reduce('F','histogram',bins=bins)
+        assert np.array_equal(reduced['bin_edges'],bins)
+        assert np.allclose(reduced['histogram'][1],Result(fname).view(times=20.).reduce('F','histogram',bins=bins)['histogram'])
+        with pytest.raises(ValueError):
+            ResultCollection([fname]).reduce('F','histogram',bins=10)
+
+    @pytest.mark.parametrize('processes',[1,2])
+    def test_place(self,res_path,restarted,processes):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([fname,restarted]).view(times=[0.,10.,20.],processes=processes)
+        placed = c.place('F')
+        ref = Result(fname).view(times=[0.,10.,20.]).place('F',flatten=False)
+        assert placed.shape == (2,3,336,3,3)
+        for i,inc in enumerate(ref):
+            assert np.array_equal(placed[1,i],ref[inc]['phase']['mechanical']['F'])
+
+    def test_time_series(self,res_path,restarted):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([restarted,fname])
+        series = c.time_series('F',[3,7])
+        assert series.shape == (2,11,2,3,3) and np.array_equal(series[0],series[1])
+        assert np.array_equal(series[1],Result(fname).time_series('F',[3,7]))
+
+    @pytest.mark.parametrize('processes',[1,2])
+    def test_export_VTK(self,tmp_path,res_path,restarted,processes):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([fname,restarted]).view(times=[8.,20.],processes=processes)
+        c.export_VTK('F',target_dir=tmp_path/'vtk',parallel=False)
+        assert sorted(p.name for p in (tmp_path/'vtk'/'0').iterdir()) == ['12grains6x7x8_tensionY_inc16.vti',
+                                                                         '12grains6x7x8_tensionY_inc40.vti']
+        assert sorted(p.name for p in (tmp_path/'vtk'/'1').iterdir()) == ['second_inc16.vti','second_inc40.vti']
+
+    def test_session_processes(self,res_path):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([fname,fname]).view(processes=2)
+        r = c[0][0]
+        with r.session(), r._open('r') as f:
+            reduced = c.reduce('F',['mean','max'])
+            assert f.id.valid and np.allclose(reduced['mean'][0],reduced['mean'][1])
+
+    @pytest.mark.parametrize('processes',[1,2])
+    def test_export_VTK_parallel(self,tmp_path,res_path,processes):
+        fname = res_path/'12grains6x7x8_tensionY.hdf5'
+        c = ResultCollection([fname,fname]).view(processes=processes)
+        c.export_VTK('F',target_dir=tmp_path,parallel=True)
+        assert not _vtk._pending
+        for run in ['0','1']:
+            assert len(list((tmp_path/run).iterdir())) == 11
+            for vti in (tmp_path/run).iterdir():
+                assert VTK.load(vti).N_cells == 336
+
+    def test_view_invalid(self,res_path):
+        with pytest.raises(ValueError):
+            ResultCollection([res_path/'12grains6x7x8_tensionY.hdf5']).view(processes=0)
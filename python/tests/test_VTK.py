@@ -1,6 +1,6 @@
 import os
 import filecmp
-import time
+import threading
 import string
 import sys
 
@@ -102,13 +102,32 @@ class TestVTK:
         fname_s = tmp_path/'single.vtp'
         fname_p = tmp_path/'parallel.vtp'
         v.save(fname_s,False)
-        v.save(fname_p,True)
-        for i in range(10):
-            if os.path.isfile(fname_p) and filecmp.cmp(fname_s,fname_p):
-                assert(True)
-                return
-            time.sleep(.5)
-        assert(False)
+        v.save(fname_p,True).result()
+        assert filecmp.cmp(fname_s,fname_p)
+
+    @pytest.mark.parametrize('parallel,OMP_NUM_THREADS',[(2,None),(True,'2,4'),(True,'')])
+    def test_parallel_bounded(self,tmp_path,monkeypatch,parallel,OMP_NUM_THREADS):
+        if OMP_NUM_THREADS is not None: monkeypatch.setenv('OMP_NUM_THREADS',OMP_NUM_THREADS)
+        v = VTK.from_poly_data(np.random.rand(102,3))
+        N_threads = threading.active_count()
+        written = [v.save(tmp_path/f'{i}.vtp',parallel=parallel) for i in range(5)]
+        assert threading.active_count() == N_threads
+        VTK.wait()
+        assert all(f.done() for f in written)
+        assert [f.result() for f in written] == [tmp_path/f'{i}.vtp' for i in range(5)]
+        assert all(os.path.isfile(tmp_path/f'{i}.vtp') for i in range(5))
+
+    @pytest.mark.parametrize('parallel',[True,False])
+    def test_parallel_error(self,tmp_path,parallel):
+        v = VTK.from_poly_data(np.random.rand(102,3))
+        if parallel:
+            future = v.save(tmp_path/'non-existing'/'polyData.vtp',parallel=parallel)
+            with pytest.raises(OSError):
+                VTK.wait()
+            assert isinstance(future.exception(),OSError)
+        else:
+            with pytest.raises(OSError):
+                v.save(tmp_path/'non-existing'/'polyData.vtp',parallel=parallel)
 
     def test_compress(self,tmp_path):
         points = np.random.rand(102,3)
@@ -192,6 +211,16 @@ class TestVTK:
             assert np.allclose(np.squeeze(d[k]['data']),new.get(k),rtol=1e-7)
 
 
+    @pytest.mark.parametrize('data_type',[np.int32,np.float32,np.float64])
+    def test_set_inplace(self,default,data_type):
+        data = np.random.rand(default.N_cells,3).astype(data_type)
+        copied = default.set('data',data)
+        assert 'data' not in default.labels.get('Cell Data',[])
+        updated = default.set('data',data,inplace=True)
+        assert updated is default and updated == copied
+        data[...] = 0
+        assert np.allclose(default.get('data'),copied.get('data'))
+
     def test_set_masked(self,default):
         data = np.random.rand(5*6*7,3)
         masked = ma.MaskedArray(data,mask=data<.4,fill_value=42.)
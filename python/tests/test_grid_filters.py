@@ -225,6 +225,28 @@ class TestGridFilters:
             assert np.allclose(differential_operator(size,field),0.0)
 
 
+    def test_ks_cached(self):
+        size = np.random.random(3)+1.0
+        cells = np.random.randint(8,32,(3))
+        k_s = grid_filters._ks(size,cells,True)
+        assert grid_filters._ks(list(size),tuple(cells),True) is k_s and not k_s.flags.writeable
+        assert grid_filters._ks(size,cells,False) is not k_s
+        assert np.array_equal(k_s,grid_filters._ks_cached.__wrapped__(tuple(size),tuple(cells),True))
+
+    @pytest.mark.parametrize('differential_operator',[grid_filters.curl,
+                                                      grid_filters.divergence,
+                                                      grid_filters.gradient])
+    @pytest.mark.parametrize('OMP_NUM_THREADS,N_threads',[('2',2),('3,2',3),('',4),('x',4)])
+    def test_differential_operator_workers(self,monkeypatch,differential_operator,OMP_NUM_THREADS,N_threads):
+        workers = []
+        for name in ['rfftn','irfftn']:
+            monkeypatch.setattr(grid_filters._fft,name,
+                                lambda *args,transform=getattr(grid_filters._fft,name),**kwargs:
+                                       workers.append(kwargs['workers']) or transform(*args,**kwargs))
+        monkeypatch.setenv('OMP_NUM_THREADS',OMP_NUM_THREADS)
+        differential_operator(np.ones(3),np.random.random((8,9,10,3)))
+        assert workers == [N_threads]*2
+
     grad_test_data = [
     (['np.sin(np.pi*2*nodes[...,0]/size[0])', '0.0', '0.0'],
      ['np.cos(np.pi*2*nodes[...,0]/size[0])*np.pi*2/size[0]', '0.0', '0.0',